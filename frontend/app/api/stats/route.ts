@@ -1,13 +1,22 @@
 import { NextResponse } from 'next/server';
-import { getStats } from '@/lib/db';
+import { getStats, getPerformanceTrends } from '@/lib/db';
 
-export async function GET() {
+export async function GET(request: Request) {
   try {
-    const stats = await getStats();
+    const { searchParams } = new URL(request.url);
+    const days = parseInt(searchParams.get('days') || '14');
+
+    const [stats, performance] = await Promise.all([
+      getStats(),
+      getPerformanceTrends(days)
+    ]);
 
     return NextResponse.json({
       success: true,
-      data: stats
+      data: {
+        ...stats,
+        performance
+      }
     });
   } catch (error) {
     console.error('Error fetching stats:', error);
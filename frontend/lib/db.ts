@@ -1,5 +1,5 @@
 import { Pool } from 'pg';
-import { Article, ScrapingSummary } from '@/types';
+import { Article, ScrapingSummary, SourcePerformance } from '@/types';
 
 // Create a connection pool
 let pool: Pool | null = null;
@@ -150,3 +150,33 @@ export async function getStats() {
   const result = await pool.query(query);
   return result.rows[0];
 }
+
+/**
+ * Get per-source scraper performance trends (one row per source per day)
+ */
+export async function getPerformanceTrends(days: number = 14): Promise<SourcePerformance[]> {
+  const pool = getPool();
+
+  const query = `
+    SELECT
+      source,
+      DATE(run_started_at) as day,
+      COUNT(*)::int as runs,
+      SUM(requests)::int as requests,
+      SUM(bytes)::float as bytes,
+      SUM(errors)::int as errors,
+      SUM(articles_saved)::int as articles_saved,
+      ROUND(AVG(latency_p50_ms), 1)::float as latency_p50_ms,
+      ROUND(AVG(latency_p95_ms), 1)::float as latency_p95_ms,
+      MAX(latency_p99_ms)::float as latency_p99_ms,
+      ROUND(SUM(parse_cpu_seconds), 2)::float as parse_cpu_seconds,
+      SUM(tokens_input + tokens_output)::int as tokens
+    FROM news.scraping_metrics
+    WHERE run_started_at >= CURRENT_DATE - $1::int
+    GROUP BY source, DATE(run_started_at)
+    ORDER BY day DESC, source
+  `;
+
+  const result = await pool.query(query, [days]);
+  return result.rows;
+}
@@ -25,6 +25,23 @@ export interface ScrapingSummary {
   updated_at: string;
 }
 
+// Daily aggregate of news.scraping_metrics for one source
+// ('database' and 'gemini' rows cover DB writes and AI calls)
+export interface SourcePerformance {
+  source: string;
+  day: string;
+  runs: number;
+  requests: number;
+  bytes: number;
+  errors: number;
+  articles_saved: number | null;
+  latency_p50_ms: number | null;
+  latency_p95_ms: number | null;
+  latency_p99_ms: number | null;
+  parse_cpu_seconds: number | null;
+  tokens: number;
+}
+
 export interface SummaryWithArticles extends ScrapingSummary {
   articles: Article[];
 }
@@ -0,0 +1,582 @@
+"""
+Async database layer for the async scraper pipeline
+Same public API as db.Database, backed by a bounded psycopg 3 connection pool
+so queries overlap with scraping instead of blocking the event loop
+"""
+
+import os
+from datetime import datetime
+from typing import Optional, Dict, List, Set
+
+from psycopg.rows import dict_row
+from psycopg_pool import AsyncConnectionPool
+
+from metrics import run_metrics, DB_GROUP
+
+# Load .env.local and share SQL with the sync layer
+from db import (
+    INSERT_ARTICLE_SQL,
+    INSERT_SUMMARY_SQL,
+    UPDATE_SUMMARY_SQL,
+    ARTICLE_EXISTS_SQL,
+    LATEST_PUBLISHED_SQL,
+    ARTICLES_BY_SOURCE_SQL,
+    BULK_INSERT_ARTICLES_UNNEST_SQL,
+    INSERT_SCRAPING_METRICS_SQL,
+    SOURCE_STATES_SQL,
+    UPSERT_SOURCE_STATE_SQL,
+    RECENT_SIGNATURES_SQL,
+    UPSERT_SIGNATURE_SQL,
+    UPSERT_RELEVANCE_SQL,
+    RELEVANCE_EXAMPLES_SQL,
+    RELEVANCE_VERDICTS_SQL,
+    article_params,
+    bulk_article_columns,
+    ids_in_order,
+    known_urls_query,
+    scraping_metrics_params,
+    summary_params,
+    unique_articles
+)
+
+
+class AsyncDatabase:
+    """
+    Async PostgreSQL access with a connection pool
+
+    Configuration (environment variables):
+    - DATABASE_URL: PostgreSQL connection string
+    - DB_POOL_MIN_SIZE: connections kept open (default: 1)
+    - DB_POOL_MAX_SIZE: maximum connections (default: 5)
+    - DB_PREPARED_STATEMENTS: prepare queries server-side on first use (default: true).
+      Set to false behind PgBouncer in transaction mode.
+    """
+
+    def __init__(self):
+        self.connection_string = os.getenv('DATABASE_URL')
+        self.min_size = int(os.getenv('DB_POOL_MIN_SIZE', '1'))
+        self.max_size = int(os.getenv('DB_POOL_MAX_SIZE', '5'))
+        prepared = os.getenv('DB_PREPARED_STATEMENTS', 'true').lower() in ('true', '1', 'yes', 'on')
+        # 0 = prepare on first execution, None = never prepare
+        self.prepare_threshold = 0 if prepared else None
+        self.pool: Optional[AsyncConnectionPool] = None
+
+    async def _configure_connection(self, conn):
+        """Per-connection setup when the pool opens a new connection"""
+        conn.prepare_threshold = self.prepare_threshold
+
+    async def connect(self) -> bool:
+        """Open the connection pool with UTF-8 encoding"""
+        try:
+            self.pool = AsyncConnectionPool(
+                self.connection_string,
+                min_size=self.min_size,
+                max_size=self.max_size,
+                kwargs={
+                    'row_factory': dict_row,
+                    'client_encoding': 'UTF8',
+                    'keepalives': 1,
+                    'keepalives_idle': 30,
+                    'keepalives_interval': 10,
+                    'keepalives_count': 5
+                },
+                configure=self._configure_connection,
+                open=False
+            )
+            await self.pool.open(wait=True, timeout=30)
+            print(f"[SUCCESS] Database pool connected ({self.min_size}-{self.max_size} connections)")
+            return True
+        except Exception as e:
+            print(f"[ERROR] Database connection failed: {e}")
+            self.pool = None
+            return False
+
+    async def ensure_connection(self) -> bool:
+        """Ensure the pool is open, reopen it if needed"""
+        if self.pool is None or self.pool.closed:
+            print("[INFO] Database pool closed, reconnecting...")
+            return await self.connect()
+        return True
+
+    async def close(self):
+        """Close the connection pool"""
+        if self.pool is not None and not self.pool.closed:
+            await self.pool.close()
+            print("[SUCCESS] Database connection closed")
+        self.pool = None
+
+    async def insert_article(self, article: Dict, scraping_session_id: Optional[int] = None) -> Optional[int]:
+        """
+        Insert a news article into the database
+
+        Args:
+            article: Dictionary with keys: title, content, source, url, published_date
+            scraping_session_id: Optional ID of the scraping session that collected this article
+
+        Returns:
+            Article ID if successful, None otherwise
+        """
+        try:
+            if not await self.ensure_connection():
+                print("[ERROR] Failed to establish database connection")
+                return None
+
+            async with self.pool.connection() as conn:
+                cursor = await conn.execute(INSERT_ARTICLE_SQL, article_params(article, scraping_session_id))
+                result = await cursor.fetchone()
+
+            article_id = result['id'] if result else None
+
+            # Try to print with title, fallback if console encoding fails
+            try:
+                print(f"[SUCCESS] Article saved: {article.get('title')[:50]}... (ID: {article_id})")
+            except (UnicodeEncodeError, UnicodeDecodeError):
+                print(f"[SUCCESS] Article saved (ID: {article_id})")
+
+            return article_id
+
+        except Exception as e:
+            try:
+                print(f"[ERROR] Error inserting article: {e}")
+            except UnicodeEncodeError:
+                print(f"[ERROR] Error inserting article (encoding error in message)")
+            return None
+
+    async def _upsert_articles(self, conn, articles: List[Dict], scraping_session_id: Optional[int]) -> List[int]:
+        """
+        Upsert a batch of articles with one statement on the given connection
+
+        Returns:
+            Article IDs in the order of the given articles
+        """
+        rows = unique_articles(articles)
+        if not rows:
+            return []
+
+        cursor = await conn.execute(
+            BULK_INSERT_ARTICLES_UNNEST_SQL,
+            bulk_article_columns(rows, scraping_session_id)
+        )
+        return ids_in_order(articles, await cursor.fetchall())
+
+    async def upsert_articles(self, articles: List[Dict], scraping_session_id: Optional[int] = None) -> List[int]:
+        """
+        Insert or update many articles in one statement and one transaction
+
+        Args:
+            articles: List of article dictionaries
+            scraping_session_id: Optional ID of the scraping session
+
+        Returns:
+            Article IDs in input order (empty list on failure, nothing is saved)
+        """
+        if not articles:
+            return []
+
+        try:
+            if not await self.ensure_connection():
+                print("[ERROR] Failed to establish database connection")
+                return []
+
+            with run_metrics.timer(DB_GROUP, 'upsert_articles'):
+                async with self.pool.connection() as conn:
+                    return await self._upsert_articles(conn, articles, scraping_session_id)
+
+        except Exception as e:
+            print(f"[ERROR] Error bulk inserting articles: {e}")
+            return []
+
+    async def bulk_insert_articles(self, articles: List[Dict], scraping_session_id: Optional[int] = None) -> int:
+        """
+        Insert multiple articles in a single transaction
+
+        Args:
+            articles: List of article dictionaries
+            scraping_session_id: Optional ID of the scraping session
+
+        Returns:
+            Number of articles successfully inserted
+        """
+        return len(await self.upsert_articles(articles, scraping_session_id))
+
+    async def save_complete_session(self, articles: List[Dict], summary_data: Dict,
+                                    signatures: Optional[List[Dict]] = None) -> Optional[int]:
+        """
+        Save a complete scraping session (summary + articles) in a single transaction.
+        If anything fails, everything is rolled back.
+
+        Args:
+            articles: List of article dictionaries to save
+            summary_data: Dictionary with summary data:
+                - summary: str (comprehensive summary text)
+                - articles_count: int (total articles found)
+                - sources_count: int (number of sources)
+                - new_articles_count: int (new articles saved)
+                - scraping_duration_seconds: float (optional)
+                - performance_metrics: dict (optional, see metrics.RunMetrics.summary)
+            signatures: news.article_signatures rows of the articles and their
+                near-duplicates (optional, see near_dup.signature_rows)
+
+        Returns:
+            Session ID if successful, None if anything failed (with full rollback)
+        """
+        try:
+            if not await self.ensure_connection():
+                print("[ERROR] Failed to establish database connection")
+                return None
+
+            print("[INFO] Starting database transaction...")
+
+            with run_metrics.timer(DB_GROUP, 'save_session'):
+                async with self.pool.connection() as conn:
+                    # Leaving the block commits; an exception rolls everything back
+                    async with conn.transaction():
+                        # Step 1: Create scraping session
+                        cursor = await conn.execute(INSERT_SUMMARY_SQL, summary_params(summary_data))
+                        result = await cursor.fetchone()
+                        session_id = result['id'] if result else None
+
+                        if not session_id:
+                            raise RuntimeError("Failed to create session")
+
+                        print(f"[SUCCESS] Created scraping session (ID: {session_id})")
+
+                        # Step 2: Insert all articles with session ID (one statement)
+                        article_ids = await self._upsert_articles(conn, articles, session_id)
+
+                        print(f"[SUCCESS] Inserted {len(article_ids)} articles")
+
+                        # Step 3: Signatures for near-duplicate detection
+                        if signatures:
+                            async with conn.cursor() as cursor:
+                                await cursor.executemany(UPSERT_SIGNATURE_SQL, signatures)
+                            print(f"[SUCCESS] Stored {len(signatures)} article signatures")
+
+            print(f"[SUCCESS] Transaction committed - session {session_id} saved successfully")
+            return session_id
+
+        except Exception as e:
+            print(f"[ERROR] Failed to save session: {e}")
+            print("[WARNING] Transaction rolled back")
+            return None
+
+    async def article_exists(self, url: str) -> bool:
+        """Check if an article with the given URL already exists"""
+        try:
+            if not await self.ensure_connection():
+                return False
+
+            async with self.pool.connection() as conn:
+                cursor = await conn.execute(ARTICLE_EXISTS_SQL, (url,))
+                return await cursor.fetchone() is not None
+        except Exception as e:
+            print(f"[ERROR] Error checking article existence: {e}")
+            return False
+
+    async def articles_exist(self, urls: List[str]) -> Set[str]:
+        """
+        Check which of the given URLs are already stored, in a single query
+
+        Args:
+            urls: List of article URLs
+
+        Returns:
+            Set of URLs that already exist in news.articles (or were dropped as
+            near-duplicates, see near_dup.py)
+        """
+        if not urls:
+            return set()
+
+        try:
+            if not await self.ensure_connection():
+                return set()
+
+            with run_metrics.timer(DB_GROUP, 'articles_exist'):
+                async with self.pool.connection() as conn:
+                    cursor = await conn.execute(*known_urls_query(urls))
+                    return {row['url'] for row in await cursor.fetchall()}
+        except Exception as e:
+            print(f"[ERROR] Error checking article existence: {e}")
+            return set()
+
+    async def latest_published_dates(self) -> Dict[str, datetime]:
+        """
+        Publish time of the newest stored article of each source
+
+        Returns:
+            {source name: published_date}; empty if the query fails
+        """
+        try:
+            if not await self.ensure_connection():
+                return {}
+
+            async with self.pool.connection() as conn:
+                cursor = await conn.execute(LATEST_PUBLISHED_SQL)
+                return {row['source']: row['latest'] for row in await cursor.fetchall()}
+        except Exception as e:
+            print(f"[ERROR] Error reading latest publish dates: {e}")
+            return {}
+
+    async def insert_scraping_summary(self, summary_data: Dict) -> Optional[int]:
+        """
+        Insert a scraping session summary
+
+        Args:
+            summary_data: Dictionary with keys:
+                - summary: str (comprehensive summary text)
+                - articles_count: int (total articles found)
+                - sources_count: int (number of sources)
+                - new_articles_count: int (new articles saved)
+                - scraping_duration_seconds: float (optional)
+                - performance_metrics: dict (optional, see metrics.RunMetrics.summary)
+
+        Returns:
+            Summary ID if successful, None otherwise
+        """
+        try:
+            if not await self.ensure_connection():
+                print("[ERROR] Failed to establish database connection")
+                return None
+
+            async with self.pool.connection() as conn:
+                cursor = await conn.execute(INSERT_SUMMARY_SQL, summary_params(summary_data))
+                result = await cursor.fetchone()
+
+            summary_id = result['id'] if result else None
+            print(f"[SUCCESS] Scraping summary saved (ID: {summary_id})")
+            return summary_id
+
+        except Exception as e:
+            print(f"[ERROR] Error inserting scraping summary: {e}")
+            return None
+
+    async def update_scraping_summary(self, summary_id: int, summary_data: Dict) -> bool:
+        """
+        Update an existing scraping session summary
+
+        Args:
+            summary_id: ID of the summary to update
+            summary_data: Dictionary with keys to update:
+                - summary: str (comprehensive summary text)
+                - articles_count: int (total articles found)
+                - new_articles_count: int (new articles saved)
+                - scraping_duration_seconds: float
+
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            if not await self.ensure_connection():
+                print("[ERROR] Failed to establish database connection")
+                return False
+
+            async with self.pool.connection() as conn:
+                await conn.execute(UPDATE_SUMMARY_SQL, (
+                    summary_data.get('summary'),
+                    summary_data.get('articles_count'),
+                    summary_data.get('new_articles_count'),
+                    summary_data.get('scraping_duration_seconds'),
+                    summary_id
+                ))
+
+            print(f"[SUCCESS] Scraping summary updated (ID: {summary_id})")
+            return True
+
+        except Exception as e:
+            print(f"[ERROR] Error updating scraping summary: {e}")
+            return False
+
+    async def save_run_metrics(self, rows: List[Dict], run: Dict) -> int:
+        """
+        Store per-source performance metrics for one run in news.scraping_metrics
+
+        Args:
+            rows: Groups from metrics.RunMetrics.table_rows()
+            run: Dictionary with keys:
+                - started_at: datetime
+                - duration_seconds: float
+                - success: bool
+                - scraping_session_id: int (None if the run saved nothing)
+
+        Returns:
+            Number of rows written (0 on failure)
+        """
+        if not rows:
+            return 0
+
+        try:
+            if not await self.ensure_connection():
+                print("[ERROR] Failed to establish database connection")
+                return 0
+
+            async with self.pool.connection() as conn:
+                async with conn.cursor() as cursor:
+                    await cursor.executemany(INSERT_SCRAPING_METRICS_SQL,
+                                             [scraping_metrics_params(row, run) for row in rows])
+            return len(rows)
+
+        except Exception as e:
+            print(f"[ERROR] Error saving run metrics: {e}")
+            return 0
+
+    async def get_source_states(self) -> Dict[str, Dict]:
+        """
+        Stored crawl state of every source (see source_state.py)
+
+        Returns:
+            {source name: news.source_state row}; empty if the query fails
+        """
+        try:
+            if not await self.ensure_connection():
+                return {}
+
+            async with self.pool.connection() as conn:
+                cursor = await conn.execute(SOURCE_STATES_SQL)
+                return {row['source']: row for row in await cursor.fetchall()}
+        except Exception as e:
+            print(f"[ERROR] Error reading source state: {e}")
+            return {}
+
+    async def save_source_states(self, rows: List[Dict]) -> int:
+        """
+        Update news.source_state after a run
+
+        Args:
+            rows: Parameters from source_state.state_row(), one per crawled source
+
+        Returns:
+            Number of sources updated (0 on failure)
+        """
+        if not rows:
+            return 0
+
+        try:
+            if not await self.ensure_connection():
+                print("[ERROR] Failed to establish database connection")
+                return 0
+
+            async with self.pool.connection() as conn:
+                async with conn.cursor() as cursor:
+                    await cursor.executemany(UPSERT_SOURCE_STATE_SQL, rows)
+            return len(rows)
+
+        except Exception as e:
+            print(f"[ERROR] Error saving source state: {e}")
+            return 0
+
+    async def recent_signatures(self, hours: float) -> List[Dict]:
+        """
+        Signatures of the stories stored in the last hours (see near_dup.py)
+
+        Returns:
+            news.article_signatures rows with url and simhash; empty if the query fails
+        """
+        try:
+            if not await self.ensure_connection():
+                return []
+
+            async with self.pool.connection() as conn:
+                cursor = await conn.execute(RECENT_SIGNATURES_SQL, (hours,))
+                return await cursor.fetchall()
+        except Exception as e:
+            print(f"[ERROR] Error reading article signatures: {e}")
+            return []
+
+    async def save_signatures(self, rows: List[Dict]) -> int:
+        """
+        Store near-duplicate signatures outside a session (see near_dup.signature_rows)
+
+        Returns:
+            Number of rows written (0 on failure)
+        """
+        if not rows:
+            return 0
+
+        try:
+            if not await self.ensure_connection():
+                return 0
+
+            async with self.pool.connection() as conn:
+                async with conn.cursor() as cursor:
+                    await cursor.executemany(UPSERT_SIGNATURE_SQL, rows)
+            return len(rows)
+
+        except Exception as e:
+            print(f"[ERROR] Error saving article signatures: {e}")
+            return 0
+
+    async def relevance_verdicts(self, hashes: List[str], prompt_version: str) -> Dict[str, bool]:
+        """
+        Stored Gemini relevance verdicts of articles (see relevance.content_hash)
+
+        Returns:
+            {content hash: relevant} for the hashes with a verdict; empty if the query fails
+        """
+        if not hashes:
+            return {}
+
+        try:
+            if not await self.ensure_connection():
+                return {}
+
+            with run_metrics.timer(DB_GROUP, 'relevance_verdicts'):
+                async with self.pool.connection() as conn:
+                    cursor = await conn.execute(RELEVANCE_VERDICTS_SQL, (prompt_version, list(hashes)))
+                    return {row['content_hash']: row['relevant'] for row in await cursor.fetchall()}
+        except Exception as e:
+            print(f"[ERROR] Error reading relevance verdicts: {e}")
+            return {}
+
+    async def relevance_examples(self, prompt_version: str, limit: int) -> List[Dict]:
+        """
+        Newest Gemini relevance verdicts for a filter prompt version (see relevance.py)
+
+        Returns:
+            news.article_relevance rows with title, snippet and relevant; empty if the query fails
+        """
+        try:
+            if not await self.ensure_connection():
+                return []
+
+            async with self.pool.connection() as conn:
+                cursor = await conn.execute(RELEVANCE_EXAMPLES_SQL, (prompt_version, limit))
+                return await cursor.fetchall()
+        except Exception as e:
+            print(f"[ERROR] Error reading relevance verdicts: {e}")
+            return []
+
+    async def save_relevance(self, rows: List[Dict]) -> int:
+        """
+        Store Gemini relevance verdicts (see relevance.verdict_rows)
+
+        Returns:
+            Number of rows written (0 on failure)
+        """
+        if not rows:
+            return 0
+
+        try:
+            if not await self.ensure_connection():
+                return 0
+
+            async with self.pool.connection() as conn:
+                async with conn.cursor() as cursor:
+                    await cursor.executemany(UPSERT_RELEVANCE_SQL, rows)
+            return len(rows)
+
+        except Exception as e:
+            print(f"[ERROR] Error saving relevance verdicts: {e}")
+            return 0
+
+    async def get_articles_by_source(self, source: str, limit: int = 10) -> List[Dict]:
+        """Retrieve articles from a specific source"""
+        try:
+            if not await self.ensure_connection():
+                return []
+
+            async with self.pool.connection() as conn:
+                cursor = await conn.execute(ARTICLES_BY_SOURCE_SQL, (source, limit))
+                return await cursor.fetchall()
+        except Exception as e:
+            print(f"[ERROR] Error retrieving articles: {e}")
+            return []
@@ -3,18 +3,72 @@ Async base scraper class for news sources
 All async source scrapers should inherit from this class
 """
 
+import os
+import re
 import aiohttp
 import asyncio
-from bs4 import BeautifulSoup
+import time
+import inspect
+from bs4 import BeautifulSoup, SoupStrainer
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import AsyncIterator, List, Dict, Optional, Callable, Set, Tuple, Union
 from abc import ABC, abstractmethod
 
+from fetch_scheduler import FetchScheduler, get_default_scheduler
+from http_pool import http_pool
+from http_cache import http_cache
+from html_store import html_store
+from retry_policy import RetryPolicy, RetryableFetchError, CircuitOpenError, RETRY_STATUSES, parse_retry_after
+from parse_pool import get_parser_mode, get_parse_executor, parse_article_in_worker, timed_parse
+from metrics import run_metrics
+from source_state import SourceBackoff, newest_published
+
+
+def resolve_html_parser(name: Optional[str] = None) -> str:
+    """
+    Pick the BeautifulSoup tree builder
+
+    Uses HTML_PARSER (default: lxml) and falls back to the pure-Python
+    html.parser when lxml is not installed.
+
+    Args:
+        name: Parser name to use instead of the HTML_PARSER setting
+
+    Returns:
+        Parser name accepted by BeautifulSoup
+    """
+    name = name or os.getenv('HTML_PARSER', 'lxml')
+    if name == 'lxml':
+        try:
+            import lxml  # noqa: F401
+        except ImportError:
+            print("[WARNING] lxml not installed, falling back to html.parser")
+            return 'html.parser'
+    return name
+
+
+def class_strainer(*class_names: str) -> SoupStrainer:
+    """
+    Build a SoupStrainer keeping elements that carry any of the given CSS classes
+
+    A regex is used because during parsing the class attribute is still the raw
+    string (e.g. "texts mb-site"), so plain class_ matching would miss elements
+    with more than one class.
+
+    Args:
+        class_names: CSS class names (without the dot)
+
+    Returns:
+        SoupStrainer for BaseScraper.parse_html / fetch_page
+    """
+    names = '|'.join(re.escape(name) for name in class_names)
+    return SoupStrainer(class_=re.compile(rf'(?:^|\s)(?:{names})(?:\s|$)'))
+
 
 class BaseScraper(ABC):
     """Abstract base class for async news scrapers"""
 
-    def __init__(self, source_name: str, base_url: str):
+    def __init__(self, source_name: str, base_url: str, scheduler: Optional[FetchScheduler] = None):
         self.source_name = source_name
         self.base_url = base_url
         self.headers = {
@@ -31,57 +85,272 @@ class BaseScraper(ABC):
             'Cache-Control': 'max-age=0'
         }
         self.session = None
-        self.semaphore = asyncio.Semaphore(5)  # Limit concurrent requests
+        self.parser = resolve_html_parser()
+        # Where parsing runs: inline, thread or process (see parse_pool.py)
+        self.parser_mode = get_parser_mode()
+        # Optional SoupStrainer limiting article pages to the parts scrape_article reads
+        self.article_parse_only: Optional[SoupStrainer] = None
+        # Global + per-host concurrency budget shared with all other sources
+        self.scheduler = scheduler or get_default_scheduler()
+        # Attempts and backoff for transient fetch failures
+        self.retry_policy = RetryPolicy()
+        # Incremental crawl (see stream_incremental): stop after this many stored URLs
+        # in a row, and never read more listing pages than this
+        self.known_run_stop = max(1, int(os.getenv('SCRAPER_KNOWN_RUN_STOP', '5')))
+        self.max_listing_pages = max(1, int(os.getenv('SCRAPER_MAX_LISTING_PAGES', '10')))
+        # Pauses a source that failed several runs in a row (see source_state.py)
+        self.source_backoff = SourceBackoff()
+
+        # Listing-page validators from the last stored run (news.source_state), sent
+        # even when the local HTTP cache has no copy of the page
+        self.saved_validators: Dict[str, Dict] = {}
+        # Filled while crawling: validators of each listing page, the first listing
+        # URL requested and whether it was unchanged since the last stored run
+        self.listing_validators: Dict[str, Dict] = {}
+        self.first_listing_url: Optional[str] = None
+        self.listing_unchanged = False
+        # Outcome of the last crawl for news.source_state (None if it was skipped)
+        self.crawl_state: Optional[Dict] = None
+        self.skip_reason: Optional[str] = None
+        self.newest_listing_url: Optional[str] = None
+
+        # Per-run statistics (filled by scrape_all)
+        self.stats = {
+            'listing_pages': 0,    # Listing pages read
+            'listing_urls': 0,     # Unique article URLs found on listing pages
+            'known_skipped': 0,    # Article fetches avoided because the URL is already stored
+            'not_modified': 0,     # Listing pages answered with 304 (served from the HTTP cache)
+            'retries': 0,          # Fetch attempts repeated after a transient failure
+            'circuit_skipped': 0   # Fetches skipped because the host's circuit breaker was open
+        }
 
     async def __aenter__(self):
         """Async context manager entry"""
-        self.session = aiohttp.ClientSession(headers=self.headers)
+        await self._acquire_session()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit"""
-        if self.session:
-            await self.session.close()
+        await self.close()
+
+    async def _acquire_session(self):
+        """Take a reference on the shared pooled session (see http_pool.py)"""
+        if self.session is None:
+            self.session = await http_pool.acquire()
 
-    async def fetch_page(self, url: str) -> Optional[BeautifulSoup]:
+    async def fetch_raw(self, url: str, conditional: bool = False) -> Optional[bytes]:
         """
-        Fetch and parse a webpage asynchronously
+        Download a webpage asynchronously without parsing it
+
+        Transient failures (5xx, 429, timeouts, dropped connections) are retried
+        with jittered backoff and Retry-After; requests to a host whose circuit
+        breaker is open are skipped (see retry_policy.py).
 
         Args:
             url: URL to fetch
+            conditional: Revalidate against the HTTP cache (see http_cache.py) -
+                sends If-None-Match / If-Modified-Since and returns the cached
+                body on 304 Not Modified (None if only the validators stored in
+                news.source_state matched: the page has nothing new)
 
         Returns:
-            BeautifulSoup object or None if failed
+            Raw response body or None if failed
+        """
+        # Replay mode: pages come from the local HTML store (see html_store.py), never the network
+        if html_store.replay:
+            return html_store.replay_page(url)
+
+        cached = await http_cache.get_async(url) if conditional else None
+        if conditional:
+            if self.first_listing_url is None:
+                self.first_listing_url = url
+            if cached is None and url in self.saved_validators:
+                cached = {**self.saved_validators[url], 'body': None}
+        breaker = self.scheduler.breaker(url)
+
+        for attempt in range(1, self.retry_policy.attempts + 1):
+            if not breaker.allow_request():
+                # Host is down: don't spend a timeout on every remaining page
+                self.stats['circuit_skipped'] += 1
+                return None
+
+            try:
+                body = await self._fetch_once(url, cached, conditional)
+                breaker.record_success()
+                return body
+            except CircuitOpenError:
+                # Breaker opened while this request was queued
+                self.stats['circuit_skipped'] += 1
+                return None
+            except RetryableFetchError as e:
+                breaker.record_failure()
+                if attempt == self.retry_policy.attempts:
+                    print(f"[ERROR] {e} (gave up after {attempt} attempts)")
+                    return None
+
+                delay = self.retry_policy.delay(attempt, e.retry_after)
+                if delay is None:
+                    print(f"[ERROR] {e} (Retry-After {e.retry_after:.0f}s is too long, skipping)")
+                    return None
+
+                self.stats['retries'] += 1
+                await asyncio.sleep(delay)
+
+        return None
+
+    async def _fetch_once(self, url: str, cached: Optional[Dict], conditional: bool) -> Optional[bytes]:
+        """
+        One download attempt
+
+        Returns:
+            Raw response body, or None for failures that retrying won't fix (404, 403, ...)
+
+        Raises:
+            RetryableFetchError: 5xx, 429, timeout or connection error
         """
-        async with self.semaphore:  # Limit concurrent requests
+        source = self.source_name
+        queued = time.perf_counter()
+        # Adaptive per-host budget (see fetch_scheduler.py); the outcome is reported back
+        async with self.scheduler.slot(url) as slot:
+            started = time.perf_counter()
+            run_metrics.observe(source, 'queue_ms', (started - queued) * 1000)
+            run_metrics.count(source, 'requests')
             try:
                 if not self.session:
-                    self.session = aiohttp.ClientSession(headers=self.headers)
+                    await self._acquire_session()
+
+                # Headers are sent per request because the session is shared by all sources
+                headers = self.headers
+                if cached:
+                    headers = {**self.headers, **http_cache.conditional_headers(cached)}
+
+                # DNS, connect and TTFB are recorded by the session's trace config (metrics.py)
+                async with self.session.get(url, headers=headers,
+                                            timeout=aiohttp.ClientTimeout(total=30),
+                                            trace_request_ctx={'source': source}) as response:
+                    slot.record_status(response.status)
+                    if response.status == 304 and cached:
+                        self.stats['not_modified'] += 1
+                        self.listing_validators[url] = {'etag': cached.get('etag'),
+                                                        'last_modified': cached.get('last_modified')}
+                        if cached['body'] is None:
+                            # Unchanged since the last stored run, which already has its articles
+                            self.listing_unchanged = True
+                            return None
+                        # The local cache is written at fetch time, before the articles
+                        # are saved, so its body is parsed again (already stored URLs are
+                        # filtered out later); only source_state validators skip the parse
+                        http_cache.hits += 1
+                        return cached['body']
+
+                    if response.status in RETRY_STATUSES:
+                        run_metrics.count(source, f"errors.http_{'429' if response.status == 429 else '5xx'}")
+                        raise RetryableFetchError(
+                            f"HTTP {response.status} fetching {url}",
+                            retry_after=parse_retry_after(response.headers.get('Retry-After'))
+                        )
 
-                async with self.session.get(url, timeout=aiohttp.ClientTimeout(total=30)) as response:
                     response.raise_for_status()
-                    html = await response.text(encoding='utf-8')
-                    return BeautifulSoup(html, 'html.parser')
+                    body_started = time.perf_counter()
+                    body = await response.read()
+
+                finished = time.perf_counter()
+                run_metrics.observe(source, 'body_ms', (finished - body_started) * 1000)
+                run_metrics.observe(source, 'fetch_ms', (finished - started) * 1000)
+                run_metrics.observe(source, 'page_kb', len(body) / 1024)
+                run_metrics.count(source, 'bytes', len(body))
+
+                if conditional:
+                    await http_cache.store_async(url, response.headers.get('ETag'),
+                                                 response.headers.get('Last-Modified'), body)
+                    self.listing_validators[url] = {'etag': response.headers.get('ETag'),
+                                                    'last_modified': response.headers.get('Last-Modified')}
+                await html_store.put_async(url, body)
+                return body
+            except RetryableFetchError:
+                raise
             except asyncio.TimeoutError:
-                print(f"[ERROR] Timeout fetching {url}")
-                return None
-            except aiohttp.ClientError as e:
+                slot.record_failure()
+                run_metrics.count(source, 'errors.timeout')
+                raise RetryableFetchError(f"Timeout fetching {url}")
+            except aiohttp.ClientResponseError as e:
+                # 403/404 are split out: bot protection and running out of pages
+                if e.status in (403, 404):
+                    run_metrics.count(source, f"errors.http_{e.status}")
+                else:
+                    run_metrics.count(source, 'errors.http_4xx' if e.status < 500 else 'errors.http_5xx')
                 # Don't log 404s as errors - they're expected when we run out of pages
-                if '404' in str(e):
+                if e.status == 404:
                     # Silently return None for 404s - this is normal pagination behavior
                     return None
                 # Suppress 403 errors for known bot-protected sites
                 bot_protected_sites = ['oxu.az', 'iqtisadiyyat.az', 'report.az']
-                if '403' in str(e) and any(site in url.lower() for site in bot_protected_sites):
+                if e.status == 403 and any(site in url.lower() for site in bot_protected_sites):
                     # These sites use aggressive bot protection (likely Cloudflare)
                     # This is expected and not an error we can fix without browser automation
                     return None
                 print(f"[ERROR] Client error fetching {url}: {e}")
                 return None
+            except aiohttp.ClientError as e:
+                # Connection refused/reset, server disconnected, truncated body
+                slot.record_failure()
+                run_metrics.count(source, 'errors.connection')
+                raise RetryableFetchError(f"Client error fetching {url}: {e}")
             except Exception as e:
+                run_metrics.count(source, 'errors.other')
                 print(f"[ERROR] Error fetching {url}: {e}")
                 return None
 
+    def limiter_state(self) -> Optional[Dict]:
+        """
+        Adaptive rate limiter state for this source's host
+
+        Returns:
+            Dictionary with concurrency, rate and counters (see HostLimiter.get_state),
+            or None before the first request
+        """
+        return self.scheduler.get_host_state(self.base_url)
+
+    def parse_html(self, markup: Union[bytes, str],
+                   parse_only: Optional[SoupStrainer] = None) -> BeautifulSoup:
+        """
+        Parse HTML with the configured parser backend
+
+        Args:
+            markup: Raw page body (bytes are decoded as UTF-8) or text
+            parse_only: Optional SoupStrainer - only matching elements (and their
+                children) are built into the tree, which saves CPU and memory
+
+        Returns:
+            BeautifulSoup object
+        """
+        if isinstance(markup, bytes):
+            markup = markup.decode('utf-8', errors='replace')
+        return BeautifulSoup(markup, self.parser, parse_only=parse_only)
+
+    async def fetch_page(self, url: str, parse_only: Optional[SoupStrainer] = None) -> Optional[BeautifulSoup]:
+        """
+        Fetch and parse a webpage asynchronously
+
+        Args:
+            url: URL to fetch
+            parse_only: Optional SoupStrainer to parse only part of the page
+
+        Returns:
+            BeautifulSoup object or None if failed
+        """
+        # fetch_page serves listing pages, which are worth revalidating between runs
+        html = await self.fetch_raw(url, conditional=True)
+        if html is None:
+            return None
+
+        # Listing pages are parsed here and used by scrape_article_list, so only
+        # the thread pool applies (soup objects can't cross process boundaries)
+        if self.parser_mode == 'thread':
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(get_parse_executor('thread'), self.parse_html, html, parse_only)
+        return self.parse_html(html, parse_only=parse_only)
+
     @abstractmethod
     async def scrape_article_list(self, page: int = 1) -> List[str]:
         """
@@ -96,6 +365,23 @@ class BaseScraper(ABC):
         pass
 
     @abstractmethod
+    def parse_article(self, html: bytes, url: str) -> Optional[Dict]:
+        """
+        Parse a downloaded article page (CPU only, no I/O)
+
+        Runs inline, in a thread pool or in a worker process depending on
+        PARSER_EXECUTOR, so it must only use the page and the scraper's
+        configuration.
+
+        Args:
+            html: Raw article page
+            url: Article URL
+
+        Returns:
+            Dictionary with article data: {title, content, url, published_date, source, language}
+        """
+        pass
+
     async def scrape_article(self, url: str) -> Optional[Dict]:
         """
         Scrape a single article asynchronously
@@ -106,62 +392,153 @@ class BaseScraper(ABC):
         Returns:
             Dictionary with article data: {title, content, url, published_date, source, language}
         """
-        pass
+        html = await self.fetch_raw(url)
+        if html is None:
+            return None
+
+        started = time.perf_counter()
+        try:
+            executor = get_parse_executor(self.parser_mode)
+            if executor is None:
+                article, cpu_seconds = timed_parse(self.parse_article, html, url)
+            else:
+                loop = asyncio.get_running_loop()
+                if self.parser_mode == 'process':
+                    article, cpu_seconds = await loop.run_in_executor(
+                        executor, parse_article_in_worker, type(self), html, url)
+                else:
+                    article, cpu_seconds = await loop.run_in_executor(
+                        executor, timed_parse, self.parse_article, html, url)
+        except Exception as e:
+            run_metrics.count(self.source_name, 'errors.parse')
+            print(f"[ERROR] Error parsing article {url}: {e}")
+            return None
+
+        # Wall time includes waiting for a free parser worker; CPU time doesn't
+        run_metrics.observe(self.source_name, 'parse_ms', (time.perf_counter() - started) * 1000)
+        run_metrics.observe(self.source_name, 'parse_cpu_ms', cpu_seconds * 1000)
+        run_metrics.count(self.source_name, 'parse_cpu_seconds', cpu_seconds)
+        return article
+
+    async def _scrape_window(self, urls: List[str], window: int) -> AsyncIterator[Tuple[int, Dict]]:
+        """
+        Sliding window behind stream_articles and scrape_articles_batch
+
+        Yields:
+            (index in urls, article) as articles finish; failed pages are skipped
+        """
+        url_iter = enumerate(urls)
+        pending: Dict[asyncio.Future, int] = {}
+
+        def refill():
+            while len(pending) < window:
+                item = next(url_iter, None)
+                if item is None:
+                    return
+                index, url = item
+                pending[asyncio.ensure_future(self.scrape_article(url))] = index
+
+        refill()
+        try:
+            while pending:
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                finished = {task: pending.pop(task) for task in done}
+                # Start the next downloads before handing results to the consumer
+                refill()
+
+                for task, index in finished.items():
+                    if task.exception() is not None:
+                        print(f"[ERROR] Exception during scraping: {task.exception()}")
+                    elif task.result() is not None:
+                        yield index, task.result()
+        finally:
+            # Consumer stopped early (break / error): don't leave downloads running
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+    async def stream_articles(self, urls: List[str], window: int = 10) -> AsyncIterator[Dict]:
+        """
+        Scrape articles with a sliding window, yielding each one as soon as it is done
+
+        Up to `window` articles are in flight at once; whenever one finishes the
+        next URL starts, so a slow page never holds back the others. Results come
+        out in completion order. Politeness is enforced per host by the fetch
+        scheduler, not by pauses here.
+
+        Args:
+            urls: Article URLs
+            window: Maximum number of articles in flight for this source
+
+        Yields:
+            Article dictionaries (failed pages are skipped)
+        """
+        results = self._scrape_window(urls, window)
+        try:
+            async for _, article in results:
+                yield article
+        finally:
+            await results.aclose()
 
     async def scrape_articles_batch(self, urls: List[str], batch_size: int = 10) -> List[Dict]:
         """
-        Scrape multiple articles concurrently in batches
+        Scrape multiple articles concurrently
 
         Args:
             urls: List of article URLs
-            batch_size: Number of articles to scrape concurrently
+            batch_size: Number of articles to scrape concurrently (sliding window)
 
         Returns:
-            List of article dictionaries
+            List of article dictionaries, in the order of urls (failed pages are skipped)
         """
-        articles = []
+        by_index = {index: article async for index, article in self._scrape_window(urls, batch_size)}
+        return [by_index[index] for index in sorted(by_index)]
 
-        # Process in batches to avoid overwhelming the server
-        for i in range(0, len(urls), batch_size):
-            batch = urls[i:i + batch_size]
-            print(f"[INFO] Scraping batch {i//batch_size + 1}/{(len(urls)-1)//batch_size + 1} ({len(batch)} articles)")
+    async def filter_known_urls(self, urls: List[str],
+                                known_urls_filter: Optional[Callable] = None) -> List[str]:
+        """
+        Drop URLs that are already stored so their pages are never downloaded
 
-            # Scrape batch concurrently
-            tasks = [self.scrape_article(url) for url in batch]
-            results = await asyncio.gather(*tasks, return_exceptions=True)
+        Args:
+            urls: Article URLs found on listing pages
+            known_urls_filter: Callable taking a list of URLs and returning the set
+                of already-known ones (sync or async, e.g. Database.articles_exist)
 
-            # Filter out None and exceptions
-            for result in results:
-                if isinstance(result, Exception):
-                    print(f"[ERROR] Exception during scraping: {result}")
-                elif result is not None:
-                    articles.append(result)
+        Returns:
+            URLs that still need to be scraped
+        """
+        if not known_urls_filter or not urls:
+            return urls
 
-            # Small delay between batches
-            if i + batch_size < len(urls):
-                await asyncio.sleep(1)
+        known = known_urls_filter(urls)
+        if inspect.isawaitable(known):
+            known = await known
 
-        return articles
+        new_urls = [url for url in urls if url not in known]
+        self.stats['known_skipped'] += len(urls) - len(new_urls)
+        return new_urls
 
-    async def scrape_all(self, num_pages: int = 1, limit_per_page: Optional[int] = None,
-                        batch_size: int = 10) -> List[Dict]:
+    async def collect_article_urls(self, num_pages: int = 1, limit_per_page: Optional[int] = None,
+                                   known_urls_filter: Optional[Callable[[List[str]], Set[str]]] = None) -> List[str]:
         """
-        Scrape all articles from the source asynchronously
+        Gather article URLs from the listing pages and drop already-known ones
 
         Args:
-            num_pages: Number of pages to scrape
+            num_pages: Number of listing pages to read
             limit_per_page: Maximum number of articles per page
-            batch_size: Number of articles to scrape concurrently
+            known_urls_filter: Optional callable returning already-stored URLs
 
         Returns:
-            List of article dictionaries
+            Unique article URLs that still need to be scraped
         """
-        print(f"Starting async scraper for {self.source_name}...")
-
+        for key in self.stats:
+            self.stats[key] = 0
         all_article_urls = []
 
         # Scrape article lists from all pages concurrently
         print(f"[INFO] Fetching article lists from {num_pages} page(s)...")
+        self.stats['listing_pages'] = num_pages
         list_tasks = [self.scrape_article_list(page=p) for p in range(1, num_pages + 1)]
         list_results = await asyncio.gather(*list_tasks, return_exceptions=True)
 
@@ -171,20 +548,328 @@ class BaseScraper(ABC):
                 print(f"[ERROR] Exception fetching page {i}: {result}")
             elif result:
                 urls = result[:limit_per_page] if limit_per_page else result
+                if i == 1:
+                    self.newest_listing_url = urls[0]
                 all_article_urls.extend(urls)
                 print(f"[Page {i}] Found {len(urls)} articles")
 
         if not all_article_urls:
-            print(f"[WARNING] No articles found")
+            if self.listing_unchanged:
+                print(f"[INFO] Listing unchanged since the last run (304) - nothing new")
+            else:
+                print(f"[WARNING] No articles found")
             return []
 
-        print(f"[INFO] Total articles to scrape: {len(all_article_urls)}")
+        # The same article can appear on more than one listing page
+        all_article_urls = list(dict.fromkeys(all_article_urls))
+        self.stats['listing_urls'] = len(all_article_urls)
+
+        # Skip articles we already have before downloading them
+        all_article_urls = await self.filter_known_urls(all_article_urls, known_urls_filter)
+        if self.stats['known_skipped']:
+            print(f"[INFO] Skipped {self.stats['known_skipped']} already-stored articles (fetches saved)")
+
+        if not all_article_urls:
+            print(f"[INFO] No new articles to scrape")
+
+        return all_article_urls
+
+    async def stream_incremental(self, num_pages: int = 1, limit_per_page: Optional[int] = None,
+                                 window: int = 10,
+                                 known_urls_filter: Optional[Callable[[List[str]], Set[str]]] = None,
+                                 high_water_mark: Optional[datetime] = None,
+                                 last_url: Optional[str] = None) -> AsyncIterator[Dict]:
+        """
+        Walk the listing pages in order, scraping each page's new articles before reading the next
+
+        Pagination stops as soon as the crawl reaches articles from earlier runs:
+        - a run of SCRAPER_KNOWN_RUN_STOP already-stored URLs in listing order
+          (counted across pages), a page with nothing new on it, or the newest
+          article of the last stored run (last_url)
+        - a first listing page unchanged since the last stored run (304)
+        - a page whose dated articles are all no newer than high_water_mark
+
+        Otherwise it keeps going, up to SCRAPER_MAX_LISTING_PAGES (or num_pages if
+        larger), so a routine run usually reads page 1 only while the first run
+        after an outage goes as deep as the backlog. The next listing page is
+        fetched while the current page's articles download; it is dropped if the
+        crawl stops.
+
+        Args:
+            num_pages: Minimum page limit (the fixed crawl depth of the source)
+            limit_per_page: Maximum number of articles per page
+            window: Maximum number of articles in flight (see stream_articles)
+            known_urls_filter: Optional callable returning already-stored URLs
+            high_water_mark: Publish time of the newest article already stored
+                for this source (naive local time, as in news.articles)
+            last_url: Newest article URL of the last stored run
+
+        Yields:
+            Article dictionaries (only new ones when a filter is given)
+        """
+        for key in self.stats:
+            self.stats[key] = 0
+        max_pages = max(num_pages, self.max_listing_pages)
+        if high_water_mark is not None:
+            high_water_mark = high_water_mark.replace(tzinfo=None)
+
+        seen: Set[str] = set()
+        known_run = 0
+        count = 0
+        stop_reason = f"page limit ({max_pages})"
+        next_list = asyncio.ensure_future(self.scrape_article_list(page=1))
+        try:
+            for page in range(1, max_pages + 1):
+                try:
+                    urls = await next_list
+                except Exception as e:
+                    print(f"[ERROR] Exception fetching page {page}: {e}")
+                    urls = None
+                next_list = None
+                self.stats['listing_pages'] += 1
+
+                if not urls:
+                    if page == 1 and self.listing_unchanged:
+                        stop_reason = "page 1 unchanged since the last run (304)"
+                    else:
+                        stop_reason = f"no articles on page {page}"
+                    break
+
+                urls = urls[:limit_per_page] if limit_per_page else urls
+                if page == 1:
+                    self.newest_listing_url = urls[0]
+                urls = [url for url in dict.fromkeys(urls) if url not in seen]
+                if not urls:
+                    # Past the last page some sites repeat an earlier one
+                    stop_reason = f"page {page} repeats earlier pages"
+                    break
+                seen.update(urls)
+                self.stats['listing_urls'] += len(urls)
+
+                new_urls = await self.filter_known_urls(urls, known_urls_filter)
+                new_set = set(new_urls)
+                reached_known = not new_urls or (last_url is not None and last_url in urls)
+                for url in urls:
+                    known_run = 0 if url in new_set else known_run + 1
+                    reached_known = reached_known or known_run >= self.known_run_stop
+                print(f"[Page {page}] Found {len(urls)} articles, {len(new_urls)} new")
+
+                # Read ahead while this page's articles download
+                if not reached_known and page < max_pages:
+                    next_list = asyncio.ensure_future(self.scrape_article_list(page=page + 1))
+
+                dated = newer = 0
+                articles = self.stream_articles(new_urls, window=window)
+                try:
+                    async for article in articles:
+                        published = article.get('published_date')
+                        if high_water_mark is not None and isinstance(published, datetime):
+                            dated += 1
+                            newer += published.replace(tzinfo=None) > high_water_mark
+                        count += 1
+                        yield article
+                finally:
+                    await articles.aclose()
+
+                if reached_known:
+                    stop_reason = f"already-stored articles on page {page}"
+                    break
+                if dated and not newer:
+                    stop_reason = f"page {page} is older than the newest stored article"
+                    break
+        finally:
+            if next_list is not None:
+                next_list.cancel()
+                await asyncio.gather(next_list, return_exceptions=True)
+
+        if self.stats['known_skipped']:
+            print(f"[INFO] Skipped {self.stats['known_skipped']} already-stored articles (fetches saved)")
+        print(f"[INFO] Incremental crawl read {self.stats['listing_pages']} page(s), stopped: {stop_reason}")
+        print(f"[SUCCESS] Successfully scraped {count} articles from {self.source_name}")
+
+    async def stream_fixed(self, num_pages: int = 1, limit_per_page: Optional[int] = None,
+                           window: int = 10,
+                           known_urls_filter: Optional[Callable[[List[str]], Set[str]]] = None) -> AsyncIterator[Dict]:
+        """
+        Read num_pages listing pages concurrently, then scrape their new articles
+
+        Args:
+            num_pages: Number of listing pages to read
+            limit_per_page: Maximum number of articles per page
+            window: Maximum number of articles in flight (see stream_articles)
+            known_urls_filter: Optional callable returning already-stored URLs
+
+        Yields:
+            Article dictionaries (only new ones when a filter is given)
+        """
+        urls = await self.collect_article_urls(num_pages, limit_per_page, known_urls_filter)
+        if not urls:
+            return
+
+        print(f"[INFO] Total articles to scrape: {len(urls)} (window: {window})")
 
-        # Scrape all articles in batches
-        articles = await self.scrape_articles_batch(all_article_urls, batch_size=batch_size)
+        count = 0
+        articles = self.stream_articles(urls, window=window)
+        try:
+            async for article in articles:
+                count += 1
+                yield article
+        finally:
+            # Close the inner generator right away so its downloads are cancelled
+            await articles.aclose()
 
-        print(f"[SUCCESS] Successfully scraped {len(articles)} articles from {self.source_name}")
-        return articles
+        print(f"[SUCCESS] Successfully scraped {count} articles from {self.source_name}")
+
+    def start_crawl(self, state: Optional[Dict] = None):
+        """
+        Reset per-crawl bookkeeping and load the source's stored state
+
+        Args:
+            state: news.source_state row of this source, if any
+        """
+        for key in self.stats:
+            self.stats[key] = 0
+        self.listing_validators = {}
+        self.first_listing_url = None
+        self.listing_unchanged = False
+        self.newest_listing_url = None
+        self.crawl_state = None
+
+        state = state or {}
+        self.saved_validators = {}
+        if state.get('listing_url'):
+            self.saved_validators[state['listing_url']] = {
+                'etag': state.get('listing_etag'),
+                'last_modified': state.get('listing_last_modified')
+            }
+        self.skip_reason = self.source_backoff.skip_reason(state)
+
+    def finish_crawl(self, newest_published_date: Optional[datetime]) -> Dict:
+        """
+        Outcome of the crawl, for news.source_state (see source_state.state_row)
+
+        The crawl succeeded if the first listing page produced article links or
+        was unchanged since the last stored run.
+
+        Args:
+            newest_published_date: Newest publish time among the scraped articles
+
+        Returns:
+            Dictionary with source, succeeded, error, last_url, last_published_date,
+            listing_url, listing_etag and listing_last_modified
+        """
+        succeeded = bool(self.newest_listing_url) or self.listing_unchanged
+        error = None
+        if not succeeded:
+            error = ("site down (circuit breaker open)" if self.stats['circuit_skipped']
+                     else "no articles on the first listing page")
+
+        validators = self.listing_validators.get(self.first_listing_url) or {}
+        has_validators = bool(validators.get('etag') or validators.get('last_modified'))
+        return {
+            'source': self.source_name,
+            'succeeded': succeeded,
+            'error': error,
+            'last_url': self.newest_listing_url,
+            'last_published_date': newest_published_date,
+            'listing_url': self.first_listing_url if has_validators else None,
+            'listing_etag': validators.get('etag'),
+            'listing_last_modified': validators.get('last_modified')
+        }
+
+    async def stream(self, num_pages: int = 1, limit_per_page: Optional[int] = None,
+                     window: int = 10,
+                     known_urls_filter: Optional[Callable[[List[str]], Set[str]]] = None,
+                     incremental: bool = False,
+                     high_water_mark: Optional[datetime] = None,
+                     state: Optional[Dict] = None) -> AsyncIterator[Dict]:
+        """
+        Scrape the source as a stream: articles are yielded as soon as each one is parsed
+
+        Afterwards crawl_state describes the outcome for news.source_state; a
+        source paused after repeated failures is skipped (skip_reason is set
+        and crawl_state stays None).
+
+        Usage:
+            async for article in scraper.stream(num_pages=2):
+                ...
+
+        Args:
+            num_pages: Number of listing pages to read
+            limit_per_page: Maximum number of articles per page
+            window: Maximum number of articles in flight (see stream_articles)
+            known_urls_filter: Optional callable returning already-stored URLs;
+                matching articles are skipped before their pages are fetched
+            incremental: Read listing pages one by one and stop at articles from
+                earlier runs (see stream_incremental); needs known_urls_filter or
+                a high-water mark, otherwise num_pages pages are read
+            high_water_mark: Publish time of the newest stored article of the
+                source (default: last_published_date from state)
+            state: news.source_state row of this source (see source_state.py)
+
+        Yields:
+            Article dictionaries (only new ones when a filter is given)
+        """
+        print(f"Starting async scraper for {self.source_name}...")
+
+        self.start_crawl(state)
+        if self.skip_reason:
+            print(f"[INFO] Skipping {self.source_name}: {self.skip_reason}")
+            return
+
+        state = state or {}
+        if high_water_mark is None:
+            high_water_mark = state.get('last_published_date')
+
+        if incremental and (known_urls_filter or high_water_mark is not None):
+            articles = self.stream_incremental(num_pages, limit_per_page, window, known_urls_filter,
+                                               high_water_mark, last_url=state.get('last_url'))
+        else:
+            articles = self.stream_fixed(num_pages, limit_per_page, window, known_urls_filter)
+
+        newest = None
+        try:
+            async for article in articles:
+                newest = newest_published(newest, article.get('published_date'))
+                yield article
+        finally:
+            await articles.aclose()
+            self.crawl_state = self.finish_crawl(newest)
+
+    async def scrape_all(self, num_pages: int = 1, limit_per_page: Optional[int] = None,
+                        batch_size: int = 10,
+                        known_urls_filter: Optional[Callable[[List[str]], Set[str]]] = None,
+                        incremental: bool = False,
+                        high_water_mark: Optional[datetime] = None,
+                        state: Optional[Dict] = None) -> List[Dict]:
+        """
+        Scrape all articles from the source asynchronously
+
+        Args:
+            num_pages: Number of pages to scrape
+            limit_per_page: Maximum number of articles per page
+            batch_size: Number of articles to scrape concurrently
+            known_urls_filter: Optional callable returning already-stored URLs;
+                matching articles are skipped before their pages are fetched
+            incremental: Stop paginating at articles from earlier runs (see stream_incremental)
+            high_water_mark: Publish time of the newest stored article of the source
+            state: news.source_state row of this source; drives the incremental
+                crawl, conditional listing requests and skipping a failing source
+
+        Returns:
+            List of article dictionaries (only new ones when a filter is given)
+        """
+        return [
+            article async for article in self.stream(
+                num_pages=num_pages,
+                limit_per_page=limit_per_page,
+                window=batch_size,
+                known_urls_filter=known_urls_filter,
+                incremental=incremental,
+                high_water_mark=high_water_mark,
+                state=state
+            )
+        ]
 
     def clean_text(self, text: str) -> str:
         """Clean and normalize text"""
@@ -195,6 +880,7 @@ class BaseScraper(ABC):
         return text.strip()
 
     async def close(self):
-        """Close the session"""
+        """Release the shared session (closed once no scraper uses it)"""
         if self.session:
-            await self.session.close()
+            self.session = None
+            await http_pool.release()
@@ -0,0 +1,195 @@
+"""
+Parser micro-benchmark
+Compares article parse + extract time per source for each HTML parser backend
+on saved fixture pages (benchmarks/fixtures/<source>/article.html)
+
+Usage:
+    python scraper/benchmarks/parse_benchmark.py                 # all sources, 50 iterations
+    python scraper/benchmarks/parse_benchmark.py -n 200 fed_az   # one source
+    python scraper/benchmarks/parse_benchmark.py --record        # refresh fixtures from live sites
+"""
+
+import sys
+import os
+import time
+import asyncio
+import argparse
+import importlib
+from typing import Dict, List, Optional, Type
+
+# Fix encoding for Azerbaijani characters on Windows
+if sys.platform == 'win32' and hasattr(sys.stdout, 'buffer'):
+    import io
+    try:
+        sys.stdout.reconfigure(encoding='utf-8')
+        sys.stderr.reconfigure(encoding='utf-8')
+    except AttributeError:
+        sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+        sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8')
+
+# Add parent directory to path
+SCRAPER_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(SCRAPER_DIR)
+
+from base_scraper import BaseScraper
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+SOURCE_KEYS = [
+    'banker_az', 'marja_az', 'report_az', 'fed_az', 'sonxeber_az',
+    'iqtisadiyyat_az', 'trend_az', 'apa_az', 'qafqazinfo_az', 'oxu_az'
+]
+
+
+def load_scraper_class(key: str) -> Type[BaseScraper]:
+    """Find the BaseScraper subclass defined in sources/<key>.py"""
+    module = importlib.import_module(f'sources.{key}')
+    for value in vars(module).values():
+        if isinstance(value, type) and issubclass(value, BaseScraper) and value is not BaseScraper:
+            return value
+    raise LookupError(f"No scraper class in sources/{key}.py")
+
+
+def fixture_path(key: str, name: str) -> str:
+    """Path of a fixture page for a source"""
+    return os.path.join(FIXTURES_DIR, key, name)
+
+
+def serve_fixture(scraper: BaseScraper, body: bytes):
+    """Make the scraper read every page from the given body instead of the network"""
+    async def fetch_raw(url: str, **kwargs) -> Optional[bytes]:
+        return body
+    scraper.fetch_raw = fetch_raw
+
+
+async def time_backend(scraper: BaseScraper, url: str, iterations: int) -> (float, Optional[Dict]):
+    """
+    Run scrape_article repeatedly with the scraper's current parser settings
+
+    Returns:
+        (milliseconds per page, extracted article)
+    """
+    article = await scraper.scrape_article(url)
+    start = time.perf_counter()
+    for _ in range(iterations):
+        await scraper.scrape_article(url)
+    elapsed = time.perf_counter() - start
+    return elapsed / iterations * 1000, article
+
+
+async def benchmark_source(key: str, iterations: int) -> Optional[Dict]:
+    """
+    Benchmark one source across parser backends
+
+    Returns:
+        Dictionary with timings per backend, or None if there is no fixture
+    """
+    path = fixture_path(key, 'article.html')
+    if not os.path.exists(path):
+        print(f"[WARNING] No fixture for {key} ({path}) - run with --record")
+        return None
+
+    with open(path, 'rb') as f:
+        body = f.read()
+
+    scraper = load_scraper_class(key)()
+    serve_fixture(scraper, body)
+    # Measure the parser itself, not executor hand-off
+    scraper.parser_mode = 'inline'
+    strainer = scraper.article_parse_only
+    url = f"{scraper.base_url}/benchmark-article"
+
+    backends = [('html.parser', None), ('lxml', None)]
+    if strainer is not None:
+        backends.append(('lxml+strainer', strainer))
+
+    results = {'source': scraper.source_name, 'bytes': len(body), 'timings': {}, 'consistent': True}
+    baseline = None
+
+    for label, parse_only in backends:
+        scraper.parser = label.split('+')[0]
+        scraper.article_parse_only = parse_only
+        ms, article = await time_backend(scraper, url, iterations)
+        results['timings'][label] = ms
+
+        # Every backend must extract exactly the same article
+        if baseline is None:
+            baseline = article
+            if article is None:
+                print(f"[WARNING] {key}: fixture did not produce an article")
+        elif article != baseline:
+            results['consistent'] = False
+            print(f"[WARNING] {key}: {label} output differs from html.parser")
+
+    return results
+
+
+async def record_fixtures(keys: List[str]):
+    """Save the first listing page and its first article for each source from the live site"""
+    for key in keys:
+        os.makedirs(os.path.join(FIXTURES_DIR, key), exist_ok=True)
+        async with load_scraper_class(key)() as scraper:
+            captured = []
+            fetch_raw = scraper.fetch_raw
+
+            async def capture(url: str, **kwargs) -> Optional[bytes]:
+                body = await fetch_raw(url, **kwargs)
+                if body is not None:
+                    captured.append(body)
+                return body
+
+            scraper.fetch_raw = capture
+            urls = await scraper.scrape_article_list(page=1)
+            if not captured or not urls:
+                print(f"[ERROR] {key}: could not fetch listing page")
+                continue
+            listing = captured[-1]
+
+            captured.clear()
+            await scraper.scrape_article(urls[0])
+            if not captured:
+                print(f"[ERROR] {key}: could not fetch article {urls[0]}")
+                continue
+
+            with open(fixture_path(key, 'listing.html'), 'wb') as f:
+                f.write(listing)
+            with open(fixture_path(key, 'article.html'), 'wb') as f:
+                f.write(captured[-1])
+            print(f"[SUCCESS] {key}: recorded listing ({len(listing)} bytes) and {urls[0]}")
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Compare HTML parser backends on fixture pages")
+    parser.add_argument('sources', nargs='*', default=SOURCE_KEYS, help="Source keys (e.g. fed_az)")
+    parser.add_argument('-n', '--iterations', type=int, default=50, help="Parses per backend")
+    parser.add_argument('--record', action='store_true', help="Refresh fixtures from the live sites")
+    args = parser.parse_args()
+
+    if args.record:
+        await record_fixtures(args.sources)
+        return
+
+    rows = []
+    for key in args.sources:
+        result = await benchmark_source(key, args.iterations)
+        if result:
+            rows.append(result)
+
+    print("\n" + "=" * 78)
+    print(f"{'Source':<18}{'KB':>7}{'html.parser':>14}{'lxml':>10}{'lxml+strainer':>16}{'speedup':>10}")
+    print("=" * 78)
+    for row in rows:
+        timings = row['timings']
+        best = min(timings.values())
+        strained = timings.get('lxml+strainer')
+        print(
+            f"{row['source']:<18}{row['bytes'] / 1024:>7.1f}"
+            f"{timings['html.parser']:>12.2f}ms{timings['lxml']:>8.2f}ms"
+            f"{(f'{strained:.2f}ms' if strained else '-'):>16}"
+            f"{timings['html.parser'] / best:>9.1f}x"
+            f"{'' if row['consistent'] else '  (output differs!)'}"
+        )
+    print("=" * 78)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
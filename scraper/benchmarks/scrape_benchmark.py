@@ -0,0 +1,244 @@
+"""
+End-to-end scraping benchmark
+Runs each scraper, then the full multi-source pipeline of main.py, against the
+local stand-in server (standin_server.py) and reports articles/sec, CPU time per
+article and peak memory. Nothing touches the network, the database, Gemini or
+Telegram.
+
+Usage:
+    python scraper/benchmarks/scrape_benchmark.py                          # every scraper + pipeline
+    python scraper/benchmarks/scrape_benchmark.py fed_az oxu_az --repeat 5
+    python scraper/benchmarks/scrape_benchmark.py --latency 80 --jitter 40 --error-rate 0.05
+    python scraper/benchmarks/scrape_benchmark.py --json after.json --compare before.json
+"""
+
+import sys
+import os
+import io
+import json
+import time
+import asyncio
+import argparse
+import statistics
+import tracemalloc
+from contextlib import redirect_stdout
+from datetime import datetime, timezone
+from typing import Awaitable, Callable, Dict, List, Optional
+
+# Fix encoding for Azerbaijani characters on Windows
+if sys.platform == 'win32' and hasattr(sys.stdout, 'buffer'):
+    try:
+        sys.stdout.reconfigure(encoding='utf-8')
+        sys.stderr.reconfigure(encoding='utf-8')
+    except AttributeError:
+        sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+        sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8')
+
+# Benchmark runs must not read or fill the real listing cache and HTML store.
+# Every site is served from one local address, so the connector's per-host
+# limit would otherwise apply to all sources together.
+os.environ['HTTP_CACHE_ENABLED'] = 'false'
+os.environ['HTML_STORE_ENABLED'] = 'false'
+os.environ['HTTP_POOL_PER_HOST'] = '0'
+
+# Add parent directory to path
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(BENCHMARKS_DIR)
+sys.path.append(os.path.dirname(BENCHMARKS_DIR))
+
+from parse_benchmark import SOURCE_KEYS, load_scraper_class
+from standin_server import StandInServer, load_sites
+from main import SOURCES, scrape_source, scrape_all_sources
+from http_pool import http_pool
+from metrics import run_metrics
+from fetch_scheduler import reset_default_scheduler
+from parse_pool import get_parser_mode, shutdown_parse_executor
+
+PIPELINE = 'pipeline'
+
+
+async def measure(run: Callable[[], Awaitable[List[Dict]]], trace_memory: bool, verbose: bool) -> Dict:
+    """
+    Run one benchmark pass from a cold scheduler and a fresh HTTP session
+
+    Args:
+        run: Coroutine function returning per-source stats (as from scrape_source)
+        trace_memory: Track peak Python memory with tracemalloc (slows the pass down)
+        verbose: Show the scrapers' own output
+
+    Returns:
+        Dictionary with articles, seconds, cpu_seconds, peak_mb, errors, retries
+    """
+    reset_default_scheduler()
+    run_metrics.reset()
+    await http_pool.acquire()
+
+    if trace_memory:
+        tracemalloc.start()
+    try:
+        started, cpu_started = time.perf_counter(), time.process_time()
+        if verbose:
+            sources_stats = await run()
+        else:
+            with redirect_stdout(io.StringIO()):
+                sources_stats = await run()
+        seconds = time.perf_counter() - started
+        cpu_seconds = time.process_time() - cpu_started
+        peak = tracemalloc.get_traced_memory()[1] if trace_memory else None
+    finally:
+        if trace_memory:
+            tracemalloc.stop()
+        await http_pool.release()
+
+    errors = sum(value for group in run_metrics.counters.values()
+                 for name, value in group.items() if name.startswith('errors.'))
+    return {
+        'articles': sum(s.get('scraped', 0) for s in sources_stats),
+        'seconds': seconds,
+        'cpu_seconds': cpu_seconds,
+        'peak_mb': peak / 1024 / 1024 if peak is not None else None,
+        'errors': int(errors),
+        'retries': sum(s.get('retries', 0) for s in sources_stats)
+    }
+
+
+async def benchmark(name: str, run: Callable[[], Awaitable[List[Dict]]], repeat: int,
+                    trace_memory: bool, verbose: bool) -> Dict:
+    """
+    Time `repeat` passes (median reported), then one pass under tracemalloc
+
+    Returns:
+        Result row: name, articles, seconds, articles_per_second, cpu_ms_per_article, peak_mb, errors, retries
+    """
+    passes = [await measure(run, trace_memory=False, verbose=verbose) for _ in range(repeat)]
+    seconds = statistics.median(p['seconds'] for p in passes)
+    cpu_seconds = statistics.median(p['cpu_seconds'] for p in passes)
+    articles = passes[-1]['articles']
+
+    peak_mb = None
+    if trace_memory:
+        peak_mb = (await measure(run, trace_memory=True, verbose=False))['peak_mb']
+
+    return {
+        'name': name,
+        'articles': articles,
+        'seconds': round(seconds, 3),
+        'articles_per_second': round(articles / seconds, 1) if seconds else None,
+        'cpu_ms_per_article': round(cpu_seconds / articles * 1000, 2) if articles else None,
+        'peak_mb': round(peak_mb, 1) if peak_mb is not None else None,
+        'errors': passes[-1]['errors'],
+        'retries': passes[-1]['retries']
+    }
+
+
+def source_entry(key: str):
+    """(scraper class, source name, listing pages) from main.SOURCES for a source key"""
+    scraper_class = load_scraper_class(key)
+    for entry in SOURCES:
+        if entry[0] is scraper_class:
+            return entry
+    raise LookupError(f"{key} is not in main.SOURCES")
+
+
+def change(new: Optional[float], old: Optional[float]) -> str:
+    """Relative change as a signed percentage"""
+    if not new or not old:
+        return '-'
+    return f"{(new - old) / old * 100:+.0f}%"
+
+
+def print_results(rows: List[Dict], baseline: Optional[Dict[str, Dict]] = None):
+    """Result table, with changes against a previous --json file if given"""
+    width = 88 if baseline else 72
+    print("\n" + "=" * width)
+    header = f"{'Benchmark':<18}{'Articles':>9}{'Time':>9}{'Art/s':>9}{'CPU/art':>10}{'Peak MB':>9}{'Errors':>8}"
+    if baseline:
+        header += f"{'Δ art/s':>9}{'Δ CPU':>7}"
+    print(header)
+    print("=" * width)
+    for row in rows:
+        cpu = f"{row['cpu_ms_per_article']:.2f}ms" if row['cpu_ms_per_article'] else '-'
+        peak = f"{row['peak_mb']:.1f}" if row['peak_mb'] is not None else '-'
+        line = (
+            f"{row['name']:<18}{row['articles']:>9}{row['seconds']:>8.2f}s"
+            f"{row['articles_per_second'] or 0:>9.1f}{cpu:>10}{peak:>9}{row['errors']:>8}"
+        )
+        if baseline:
+            old = baseline.get(row['name'], {})
+            line += (f"{change(row['articles_per_second'], old.get('articles_per_second')):>9}"
+                     f"{change(row['cpu_ms_per_article'], old.get('cpu_ms_per_article')):>7}")
+        print(line)
+    print("=" * width)
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Benchmark the scrapers against a local stand-in server")
+    parser.add_argument('sources', nargs='*', default=SOURCE_KEYS, help="Source keys (e.g. fed_az)")
+    parser.add_argument('--repeat', type=int, default=3, help="Timed passes per benchmark (median is reported)")
+    parser.add_argument('--latency', type=float, default=0.0, help="Server delay per response (ms)")
+    parser.add_argument('--jitter', type=float, default=0.0, help="Extra random server delay, up to (ms)")
+    parser.add_argument('--error-rate', type=float, default=0.0, help="Fraction of requests that fail (0-1)")
+    parser.add_argument('--error-status', type=int, default=503,
+                        help="Status of failed requests; 0 drops the connection")
+    parser.add_argument('--seed', type=int, default=1, help="Random seed for jitter and errors")
+    parser.add_argument('--no-memory', action='store_true', help="Skip the tracemalloc pass")
+    parser.add_argument('--no-pipeline', action='store_true', help="Only benchmark individual scrapers")
+    parser.add_argument('--pipeline-only', action='store_true', help="Only benchmark the full pipeline")
+    parser.add_argument('--json', help="Write results to this file")
+    parser.add_argument('--compare', help="Show changes against results from an earlier --json run")
+    parser.add_argument('--verbose', action='store_true', help="Show scraper output")
+    args = parser.parse_args()
+
+    sites = await load_sites(args.sources)
+    server = StandInServer(sites, latency=args.latency, jitter=args.jitter,
+                           error_rate=args.error_rate, error_status=args.error_status, seed=args.seed)
+    server.start()
+    http_pool.middlewares = (server.middleware,)
+
+    print(f"[INFO] Stand-in server on port {server.port}: latency {args.latency:g}ms +{args.jitter:g}ms, "
+          f"error rate {args.error_rate:g} ({args.error_status or 'dropped connection'})")
+    print(f"[INFO] Parser mode: {get_parser_mode()}, {args.repeat} timed passes per benchmark")
+
+    rows = []
+    try:
+        if not args.pipeline_only:
+            for key in args.sources:
+                scraper_class, source_name, num_pages = source_entry(key)
+
+                async def run_source(scraper_class=scraper_class, source_name=source_name, num_pages=num_pages):
+                    return [await scrape_source(scraper_class, source_name, None, num_pages=num_pages,
+                                                seen_urls=set())]
+
+                rows.append(await benchmark(key, run_source, args.repeat, not args.no_memory, args.verbose))
+                print(f"[INFO] {key}: {rows[-1]['articles_per_second']} articles/s")
+
+        if not args.no_pipeline:
+            if set(args.sources) != set(SOURCE_KEYS):
+                print("[INFO] Pipeline benchmark skipped (needs every source)")
+            else:
+                async def run_pipeline():
+                    return await scrape_all_sources(None, concurrent=True)
+
+                rows.append(await benchmark(PIPELINE, run_pipeline, args.repeat, not args.no_memory, args.verbose))
+    finally:
+        server.stop()
+        shutdown_parse_executor()
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            baseline = {row['name']: row for row in json.load(f)['results']}
+    print_results(rows, baseline)
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({
+                'created_at': datetime.now(timezone.utc).isoformat(),
+                'config': {key: value for key, value in vars(args).items() if key not in ('json', 'compare')},
+                'results': rows
+            }, f, indent=2)
+        print(f"[SUCCESS] Wrote results to {args.json}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
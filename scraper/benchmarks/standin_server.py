@@ -0,0 +1,207 @@
+"""
+Stand-in HTTP server for the news sites
+Answers for every host the scrapers talk to with the recorded fixtures
+(benchmarks/fixtures/<source>/listing.html and article.html), with configurable
+latency and error injection, so the whole fetch -> parse pipeline can be
+benchmarked offline
+
+The server runs in its own process so its CPU time is not counted against the
+scrapers. Requests reach it through an aiohttp client middleware that keeps the
+original URL (and Host header) but connects to 127.0.0.1.
+
+Usage (normally started by scrape_benchmark.py):
+    python scraper/benchmarks/standin_server.py --port 8900 --latency 50 --error-rate 0.05
+"""
+
+import sys
+import os
+import time
+import socket
+import hashlib
+import random
+import asyncio
+import argparse
+import multiprocessing
+from typing import Dict, List, Optional
+from urllib.parse import urlparse
+
+from aiohttp import web
+
+# Add parent directory to path
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(BENCHMARKS_DIR)
+sys.path.append(os.path.dirname(BENCHMARKS_DIR))
+
+from parse_benchmark import SOURCE_KEYS, load_scraper_class, fixture_path, serve_fixture
+
+
+async def load_sites(keys: List[str]) -> Dict[str, Dict]:
+    """
+    Read the fixtures of each source and find which paths are article pages
+
+    The article paths are the links the scraper itself extracts from
+    listing.html; every other path on the host is answered with the listing.
+
+    Args:
+        keys: Source keys (e.g. fed_az)
+
+    Returns:
+        {host: {'listing': bytes, 'etag': str, 'article': bytes, 'article_paths': set}}
+    """
+    sites = {}
+    for key in keys:
+        listing_path = fixture_path(key, 'listing.html')
+        article_path = fixture_path(key, 'article.html')
+        if not (os.path.exists(listing_path) and os.path.exists(article_path)):
+            print(f"[WARNING] Missing fixtures for {key} - run parse_benchmark.py --record")
+            continue
+
+        with open(listing_path, 'rb') as f:
+            listing = f.read()
+        with open(article_path, 'rb') as f:
+            article = f.read()
+
+        scraper = load_scraper_class(key)()
+        scraper.parser_mode = 'inline'
+        serve_fixture(scraper, listing)
+        urls = await scraper.scrape_article_list(page=1)
+        if not urls:
+            print(f"[WARNING] {key}: listing fixture has no article links")
+
+        host = urlparse(scraper.base_url).netloc
+        sites[host] = {
+            'listing': listing,
+            'etag': f'"{hashlib.sha1(listing).hexdigest()[:16]}"',
+            'article': article,
+            'article_paths': {urlparse(url).path for url in urls}
+        }
+    return sites
+
+
+def create_app(sites: Dict[str, Dict], latency: float = 0.0, jitter: float = 0.0,
+               error_rate: float = 0.0, error_status: int = 503, seed: Optional[int] = None) -> web.Application:
+    """
+    Build the stand-in application
+
+    Args:
+        sites: Output of load_sites()
+        latency: Delay before every response, in milliseconds
+        jitter: Extra random delay of up to this many milliseconds
+        error_rate: Fraction of requests (0-1) that fail
+        error_status: HTTP status of failed requests; 0 drops the connection instead
+        seed: Random seed, so error injection is the same run to run
+    """
+    rng = random.Random(seed)
+
+    async def handle(request: web.Request) -> web.StreamResponse:
+        site = sites.get(request.host.split(':')[0])
+        if site is None:
+            return web.Response(status=404)
+
+        delay = latency + (rng.uniform(0, jitter) if jitter else 0)
+        if delay:
+            await asyncio.sleep(delay / 1000)
+
+        if error_rate and rng.random() < error_rate:
+            if error_status == 0:
+                # Connection reset before a response: the client sees ServerDisconnected
+                request.transport.close()
+                return web.Response(status=500)
+            return web.Response(status=error_status)
+
+        if request.path in site['article_paths']:
+            return web.Response(body=site['article'], content_type='text/html', charset='utf-8')
+
+        # Listing pages carry an ETag and answer conditional requests, like the real sites' CDNs
+        if request.headers.get('If-None-Match') == site['etag']:
+            return web.Response(status=304, headers={'ETag': site['etag']})
+        return web.Response(body=site['listing'], content_type='text/html', charset='utf-8',
+                            headers={'ETag': site['etag']})
+
+    app = web.Application()
+    app.router.add_route('GET', '/{path:.*}', handle)
+    return app
+
+
+def run_server(sites: Dict[str, Dict], port: int, **options):
+    """Serve until the process is terminated (entry point of the server process)"""
+    web.run_app(create_app(sites, **options), host='127.0.0.1', port=port, print=None,
+                handle_signals=True)
+
+
+def free_port() -> int:
+    """An unused local TCP port"""
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+class StandInServer:
+    """
+    Stand-in server in a child process, plus the client middleware that routes to it
+
+    Usage:
+        server = StandInServer(sites, latency=50)
+        server.start()
+        http_pool.middlewares = (server.middleware,)
+        ...
+        server.stop()
+    """
+
+    def __init__(self, sites: Dict[str, Dict], port: Optional[int] = None, **options):
+        self.sites = sites
+        self.port = port or free_port()
+        self.options = options
+        self.process: Optional[multiprocessing.Process] = None
+
+    def start(self, timeout: float = 10.0):
+        """Start the server process and wait until it accepts connections"""
+        self.process = multiprocessing.Process(
+            target=run_server, args=(self.sites, self.port), kwargs=self.options, daemon=True
+        )
+        self.process.start()
+
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            try:
+                with socket.create_connection(('127.0.0.1', self.port), timeout=0.2):
+                    return
+            except OSError:
+                time.sleep(0.05)
+        self.stop()
+        raise RuntimeError(f"Stand-in server did not start on port {self.port}")
+
+    def stop(self):
+        """Terminate the server process"""
+        if self.process is not None:
+            self.process.terminate()
+            self.process.join(timeout=5)
+            self.process = None
+
+    async def middleware(self, request, handler):
+        """aiohttp client middleware: send the request to the stand-in server instead of the site"""
+        request.url = request.url.with_scheme('http').with_host('127.0.0.1').with_port(self.port)
+        return await handler(request)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve the news-site fixtures locally")
+    parser.add_argument('sources', nargs='*', default=SOURCE_KEYS, help="Source keys (e.g. fed_az)")
+    parser.add_argument('--port', type=int, default=8900)
+    parser.add_argument('--latency', type=float, default=0.0, help="Delay per response (ms)")
+    parser.add_argument('--jitter', type=float, default=0.0, help="Extra random delay, up to (ms)")
+    parser.add_argument('--error-rate', type=float, default=0.0, help="Fraction of requests that fail (0-1)")
+    parser.add_argument('--error-status', type=int, default=503,
+                        help="Status of failed requests; 0 drops the connection")
+    parser.add_argument('--seed', type=int, default=None, help="Random seed for jitter and errors")
+    args = parser.parse_args()
+
+    sites = asyncio.run(load_sites(args.sources))
+    print(f"[INFO] Serving {len(sites)} sites on http://127.0.0.1:{args.port} "
+          f"(latency {args.latency:g}ms +{args.jitter:g}ms, error rate {args.error_rate:g})")
+    run_server(sites, args.port, latency=args.latency, jitter=args.jitter,
+               error_rate=args.error_rate, error_status=args.error_status, seed=args.seed)
+
+
+if __name__ == "__main__":
+    main()
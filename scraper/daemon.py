@@ -0,0 +1,322 @@
+"""
+Resident scraper daemon
+Runs instead of one cold-started main.py process per cron slot: the HTTP
+session, DB pool, listing cache, fetch scheduler, parser workers and Gemini
+client stay warm. Every source is crawled on its own interval, new articles
+are buffered, and on a separate cadence the buffer is summarized, saved in one
+transaction and reported exactly like a main.py run.
+
+Usage:
+    python scraper/daemon.py
+    python scraper/main.py --daemon
+"""
+
+import sys
+import os
+import signal
+import asyncio
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Set
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from main import (
+    SOURCES,
+    load_crawl_state,
+    report_run,
+    scrape_source_safely,
+    summarize_and_save,
+)
+from async_db import AsyncDatabase
+from telegram import TelegramReporter
+from summarizer import GeminiSummarizer
+from http_pool import http_pool
+from http_cache import http_cache
+from html_store import html_store
+from metrics import run_metrics
+from parse_pool import shutdown_parse_executor
+from source_state import merge_state, state_row
+
+# News agencies publish around the clock; the other sites a few times a day
+DEFAULT_SOURCE_INTERVALS = {
+    'Report.az': 15,
+    'Trend.az': 15,
+    'APA.az': 15,
+    'Oxu.az': 15,
+}
+
+
+def parse_intervals(value: Optional[str]) -> Dict[str, float]:
+    """
+    Parse per-source intervals
+
+    Args:
+        value: Comma-separated name=minutes pairs, e.g. "Report.az=10,Fed.az=60"
+
+    Returns:
+        {source name: minutes}
+    """
+    intervals = {}
+    for item in (value or '').split(','):
+        name, _, minutes = item.partition('=')
+        if name.strip() and minutes.strip():
+            try:
+                intervals[name.strip()] = float(minutes)
+            except ValueError:
+                print(f"[WARNING] Ignoring invalid interval {item.strip()!r}")
+    return intervals
+
+
+def add_source_stats(window: Dict[str, Dict], stats: Dict):
+    """
+    Add one crawl's statistics to the totals of the current flush window
+
+    Counters are summed, new articles are appended, everything else (limiter
+    state, pause, error) keeps the latest value.
+    """
+    totals = window.get(stats['name'])
+    if totals is None:
+        window[stats['name']] = {**stats, 'new_articles': list(stats.get('new_articles', []))}
+        return
+
+    for key, value in stats.items():
+        if key == 'new_articles':
+            totals['new_articles'].extend(value)
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            totals[key] = totals.get(key, 0) + value
+        else:
+            totals[key] = value
+    # A later successful crawl clears an earlier failure
+    if not stats.get('error'):
+        totals.pop('error', None)
+
+
+class NewsDaemon:
+    """
+    Long-running scheduler: one crawl loop per source plus a flush loop
+
+    Articles are only saved by a flush (AI summary + one transaction, as in
+    main.py); until then their URLs count as known, so later crawls don't fetch
+    them again, and the sources' crawl progress is only written to
+    news.source_state once their articles are stored. A failed flush keeps up
+    to DAEMON_MAX_RETAINED of its articles for the next one; the rest, and its
+    near-duplicates, are forgotten so later crawls can fetch them again.
+    SIGTERM/SIGINT finish the running crawls, flush once more and exit.
+
+    Configuration (environment variables):
+    - DAEMON_INTERVAL_MINUTES: minutes between crawls of a source (default: 30)
+    - DAEMON_SOURCE_INTERVALS: per-source overrides, e.g. "Report.az=10,Fed.az=60"
+      (defaults: 15 for Report.az, Trend.az, APA.az and Oxu.az)
+    - DAEMON_FLUSH_MINUTES: minutes between summaries/saves/reports (default: 240)
+    - DAEMON_MAX_RETAINED: articles a failed flush keeps for the next one (default: 1000)
+    """
+
+    def __init__(self):
+        self.default_interval = float(os.getenv('DAEMON_INTERVAL_MINUTES', '30'))
+        self.intervals = {**DEFAULT_SOURCE_INTERVALS, **parse_intervals(os.getenv('DAEMON_SOURCE_INTERVALS'))}
+        self.flush_minutes = float(os.getenv('DAEMON_FLUSH_MINUTES', '240'))
+        self.max_retained = max(0, int(os.getenv('DAEMON_MAX_RETAINED', '1000')))
+
+        self.db = AsyncDatabase()
+        self.telegram = TelegramReporter()
+        self.summarizer = GeminiSummarizer()
+
+        # Crawl state per source, ahead of news.source_state while articles are buffered
+        self.states: Dict[str, Dict] = {}
+        self.latest_published: Dict[str, datetime] = {}
+
+        # Current flush window: per-source totals and the URLs of unsaved articles
+        self.window: Dict[str, Dict] = {}
+        self.window_start = datetime.now(timezone.utc)
+        self.pending_urls: Set[str] = set()
+
+        self.stopping = asyncio.Event()
+
+    def interval(self, source_name: str) -> float:
+        """Minutes between crawls of a source"""
+        return self.intervals.get(source_name, self.default_interval)
+
+    async def sleep(self, minutes: float) -> bool:
+        """Wait, returning early (True) when the daemon is stopping"""
+        try:
+            await asyncio.wait_for(self.stopping.wait(), timeout=minutes * 60)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+    async def known_urls(self, urls: List[str]) -> Set[str]:
+        """Stored URLs plus the ones buffered for the next flush"""
+        known = await self.db.articles_exist(urls)
+        return known | {url for url in urls if url in self.pending_urls}
+
+    async def crawl(self, scraper_class, source_name: str, num_pages: int):
+        """Crawl one source and add its new articles to the flush window"""
+        attempted_at = datetime.now(timezone.utc)
+        stats = await scrape_source_safely(
+            scraper_class, source_name, self.db, num_pages,
+            seen_urls=self.pending_urls,
+            high_water_mark=self.latest_published.get(source_name),
+            state=self.states.get(source_name),
+            known_urls_filter=self.known_urls
+        )
+        add_source_stats(self.window, stats)
+
+        crawl_state = stats.get('crawl_state')
+        if crawl_state:
+            self.states[source_name] = merge_state(self.states.get(source_name), crawl_state, attempted_at)
+            # Progress can be stored right away only while nothing of the source is buffered
+            buffered = bool(self.window[source_name]['new_articles'])
+            await self.db.save_source_states([state_row(crawl_state, attempted_at, include_progress=not buffered)])
+
+        print(f"[INFO] {source_name}: {stats.get('scraped', 0)} new, "
+              f"{len(self.pending_urls)} buffered, next crawl in {self.interval(source_name):g} min")
+
+    async def source_loop(self, scraper_class, source_name: str, num_pages: int):
+        """Crawl a source every interval until the daemon stops"""
+        while not self.stopping.is_set():
+            try:
+                await self.crawl(scraper_class, source_name, num_pages)
+            except Exception as e:
+                print(f"[ERROR] {source_name} crawl failed: {e}")
+            if await self.sleep(self.interval(source_name)):
+                return
+
+    async def flush(self):
+        """Summarize, save and report the articles of the current window"""
+        sources_stats = [self.window[name] for _, name, _ in SOURCES if name in self.window]
+        start_time = self.window_start
+        # Progress to commit if this flush saves its articles (later crawls may run meanwhile)
+        committed_states = [dict(self.states[name]) for name in self.window if name in self.states]
+        self.window = {}
+        self.window_start = datetime.now(timezone.utc)
+        if not sources_stats:
+            return
+
+        # Quiet windows are only reported when something needs attention
+        if not any(s['new_articles'] for s in sources_stats):
+            troubled = [s for s in sources_stats if s.get('error') or s.get('paused')]
+            print("[INFO] Nothing new since the last flush")
+            if troubled:
+                errors = [f"{s['name']}: {s.get('error') or 'paused - ' + s['paused']}" for s in troubled]
+                await report_run(self.db, self.telegram, sources_stats, start_time,
+                                 datetime.now(timezone.utc), False, None, None, errors)
+            run_metrics.reset()
+            return
+
+        print("\n" + "=" * 60)
+        print(f"FLUSH: {sum(len(s['new_articles']) for s in sources_stats)} buffered articles")
+        print("=" * 60)
+
+        errors = [f"{s['name']}: {s['error']}" for s in sources_stats if s.get('error')]
+        session_id, session_summary = None, None
+        try:
+            session_id, session_summary = await summarize_and_save(
+                self.db, self.summarizer, self.telegram, sources_stats, start_time, errors
+            )
+        except Exception as e:
+            error_msg = f"Unexpected error: {str(e)}"
+            print(f"\n[ERROR] {error_msg}")
+            errors.append(error_msg)
+            self.telegram.send_error_alert(error_msg)
+        success = session_id is not None
+
+        if success:
+            for stats in sources_stats:
+                self.pending_urls.difference_update(article.get('url') for article in stats['new_articles'])
+            await self.db.save_source_states([state_row(state, None, include_progress=True)
+                                              for state in committed_states])
+        else:
+            self.retain_unsaved(sources_stats)
+
+        await report_run(self.db, self.telegram, sources_stats, start_time, datetime.now(timezone.utc),
+                         success, session_id, session_summary, errors)
+        run_metrics.reset()
+
+    def retain_unsaved(self, sources_stats: List[Dict]):
+        """
+        Carry a failed flush's articles over to the next flush
+
+        Up to DAEMON_MAX_RETAINED of them stay buffered. Near-duplicates (their
+        signatures were not stored) and the articles over the cap are dropped
+        from pending_urls, so later crawls fetch them again instead of treating
+        them as known forever.
+        """
+        budget = self.max_retained
+        for stats in sources_stats:
+            unsaved = [article for article in stats['new_articles'] if not article.get('duplicate_of')]
+            unsaved, budget = unsaved[:budget], budget - min(budget, len(unsaved))
+            retained = {id(article) for article in unsaved}
+            self.pending_urls.difference_update(article.get('url') for article in stats['new_articles']
+                                                if id(article) not in retained)
+            if unsaved:
+                add_source_stats(self.window, {
+                    'name': stats['name'], 'total': 0, 'scraped': len(unsaved),
+                    'saved': len(unsaved), 'skipped': 0, 'fetches_saved': 0,
+                    'new_articles': unsaved
+                })
+
+    async def flush_loop(self):
+        """Flush every DAEMON_FLUSH_MINUTES until the daemon stops"""
+        while not await self.sleep(self.flush_minutes):
+            try:
+                await self.flush()
+            except Exception as e:
+                print(f"[ERROR] Flush failed: {e}")
+
+    async def run(self):
+        """Start the loops and run until SIGTERM/SIGINT"""
+        print("\n" + "=" * 60)
+        print("NEWS SCRAPER DAEMON STARTED")
+        print("=" * 60)
+        for _, name, _ in SOURCES:
+            print(f"  {name:<18} every {self.interval(name):g} min")
+        print(f"  Flush every {self.flush_minutes:g} min")
+
+        if not await self.db.connect():
+            error_msg = "Failed to connect to database"
+            print(f"[ERROR] {error_msg}")
+            self.telegram.send_error_alert(error_msg)
+            return
+
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, self.stopping.set)
+            except (NotImplementedError, RuntimeError):
+                pass  # Windows: Ctrl+C raises KeyboardInterrupt instead
+
+        # Held for the daemon's lifetime so connections stay open between crawls
+        await http_pool.acquire()
+        run_metrics.reset()
+        try:
+            self.states, self.latest_published = await load_crawl_state(self.db)
+            await asyncio.gather(
+                self.flush_loop(),
+                *(self.source_loop(*source) for source in SOURCES)
+            )
+        finally:
+            print("\n[INFO] Daemon stopping - flushing buffered articles...")
+            try:
+                await self.flush()
+            finally:
+                await self.db.close()
+                await http_pool.release()
+                http_cache.close()
+                html_store.close()
+                shutdown_parse_executor()
+
+
+def run_daemon():
+    """Entry point (also used by main.py --daemon)"""
+    # psycopg's async connections need a selector event loop on Windows
+    if sys.platform == 'win32':
+        asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
+    try:
+        asyncio.run(NewsDaemon().run())
+    except KeyboardInterrupt:
+        print("\n[INFO] Daemon interrupted")
+
+
+if __name__ == "__main__":
+    run_daemon()
@@ -5,13 +5,16 @@ Handles PostgreSQL connections with proper UTF-8 encoding for Azerbaijani charac
 
 import sys
 import os
+import json
 import psycopg2
-from psycopg2.extras import RealDictCursor
+from psycopg2.extras import RealDictCursor, execute_values
 from psycopg2 import sql
-from datetime import datetime
-from typing import Optional, Dict, List
+from datetime import datetime, timedelta, timezone
+from typing import Optional, Dict, List, Set
 from dotenv import load_dotenv
 
+from near_dup import near_dup_enabled
+
 # Fix encoding for Azerbaijani characters on Windows
 if sys.platform == 'win32' and hasattr(sys.stdout, 'buffer'):
     import io
@@ -27,6 +30,279 @@ import pathlib
 env_path = pathlib.Path(__file__).parent.parent / '.env.local'
 load_dotenv(env_path)
 
+# Queries shared by the sync (psycopg2) and async (psycopg 3, see async_db.py) layers
+INSERT_ARTICLE_SQL = """
+    INSERT INTO news.articles (title, content, source, url, published_date, language, scraping_session_id)
+    VALUES (%s, %s, %s, %s, %s, %s, %s)
+    ON CONFLICT (url) DO UPDATE
+    SET title = EXCLUDED.title,
+        content = EXCLUDED.content,
+        published_date = EXCLUDED.published_date,
+        scraping_session_id = EXCLUDED.scraping_session_id,
+        updated_at = CURRENT_TIMESTAMP
+    RETURNING id
+"""
+
+INSERT_SUMMARY_SQL = """
+    INSERT INTO news.scraping_summaries
+    (summary, articles_count, sources_count, new_articles_count, scraping_duration_seconds, performance_metrics)
+    VALUES (%s, %s, %s, %s, %s, %s::jsonb)
+    RETURNING id
+"""
+
+UPDATE_SUMMARY_SQL = """
+    UPDATE news.scraping_summaries
+    SET summary = %s,
+        articles_count = %s,
+        new_articles_count = %s,
+        scraping_duration_seconds = %s,
+        updated_at = CURRENT_TIMESTAMP
+    WHERE id = %s
+"""
+
+# Multi-row upsert: one statement for the whole batch (psycopg2 execute_values)
+BULK_INSERT_ARTICLES_SQL = """
+    INSERT INTO news.articles (title, content, source, url, published_date, language, scraping_session_id)
+    VALUES %s
+    ON CONFLICT (url) DO UPDATE
+    SET title = EXCLUDED.title,
+        content = EXCLUDED.content,
+        published_date = EXCLUDED.published_date,
+        scraping_session_id = EXCLUDED.scraping_session_id,
+        updated_at = CURRENT_TIMESTAMP
+    RETURNING id, url
+"""
+
+# Same upsert for psycopg 3, with the batch passed as one array per column
+BULK_INSERT_ARTICLES_UNNEST_SQL = """
+    INSERT INTO news.articles (title, content, source, url, published_date, language, scraping_session_id)
+    SELECT * FROM unnest(
+        %s::text[], %s::text[], %s::text[], %s::text[], %s::timestamp[], %s::text[], %s::integer[]
+    )
+    ON CONFLICT (url) DO UPDATE
+    SET title = EXCLUDED.title,
+        content = EXCLUDED.content,
+        published_date = EXCLUDED.published_date,
+        scraping_session_id = EXCLUDED.scraping_session_id,
+        updated_at = CURRENT_TIMESTAMP
+    RETURNING id, url
+"""
+
+ARTICLE_EXISTS_SQL = "SELECT id FROM news.articles WHERE url = %s"
+
+ARTICLES_EXIST_SQL = "SELECT url FROM news.articles WHERE url = ANY(%s)"
+
+# Also counts the URLs of near-duplicates that were not stored (see near_dup.py)
+KNOWN_URLS_SQL = """
+    SELECT url FROM news.articles WHERE url = ANY(%(urls)s)
+    UNION
+    SELECT url FROM news.article_signatures WHERE url = ANY(%(urls)s) AND duplicate_of IS NOT NULL
+"""
+
+# Signatures of the stories stored recently, for near-duplicate matching
+RECENT_SIGNATURES_SQL = """
+    SELECT url, simhash FROM news.article_signatures
+    WHERE duplicate_of IS NULL AND created_at >= NOW() - %s * INTERVAL '1 hour'
+"""
+
+UPSERT_SIGNATURE_SQL = """
+    INSERT INTO news.article_signatures (url, source, simhash, duplicate_of)
+    VALUES (%(url)s, %(source)s, %(simhash)s, %(duplicate_of)s)
+    ON CONFLICT (url) DO UPDATE SET
+        simhash = EXCLUDED.simhash,
+        duplicate_of = EXCLUDED.duplicate_of
+"""
+
+# Gemini relevance verdicts, the pre-filter model's training labels (see relevance.py)
+UPSERT_RELEVANCE_SQL = """
+    INSERT INTO news.article_relevance (content_hash, prompt_version, relevant, url, title, snippet)
+    VALUES (%(content_hash)s, %(prompt_version)s, %(relevant)s, %(url)s, %(title)s, %(snippet)s)
+    ON CONFLICT (content_hash, prompt_version) DO UPDATE SET
+        relevant = EXCLUDED.relevant,
+        created_at = NOW()
+"""
+
+# Stored verdicts for articles about to be filtered: each article goes to Gemini once
+RELEVANCE_VERDICTS_SQL = """
+    SELECT content_hash, relevant FROM news.article_relevance
+    WHERE prompt_version = %s AND content_hash = ANY(%s)
+"""
+
+RELEVANCE_EXAMPLES_SQL = """
+    SELECT title, snippet, relevant FROM news.article_relevance
+    WHERE prompt_version = %s
+    ORDER BY created_at DESC
+    LIMIT %s
+"""
+
+# Newest stored publish time per source: the high-water mark of the incremental
+# crawl (far-future dates from mis-parsed pages are ignored)
+LATEST_PUBLISHED_SQL = """
+    SELECT source, MAX(published_date) AS latest
+    FROM news.articles
+    WHERE published_date <= NOW() + INTERVAL '1 day'
+    GROUP BY source
+"""
+
+ARTICLES_BY_SOURCE_SQL = """
+    SELECT * FROM news.articles
+    WHERE source = %s
+    ORDER BY published_date DESC
+    LIMIT %s
+"""
+
+INSERT_SCRAPING_METRICS_SQL = """
+    INSERT INTO news.scraping_metrics
+    (run_started_at, run_duration_seconds, run_success, scraping_session_id, source,
+     requests, bytes, errors, error_classes, articles_found, articles_saved,
+     latency_p50_ms, latency_p95_ms, latency_p99_ms, time_spent_ms, parse_cpu_seconds,
+     tokens_input, tokens_output, details)
+    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s::jsonb, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s::jsonb)
+"""
+
+SOURCE_STATES_SQL = """
+    SELECT source, last_url, last_published_date, listing_url, listing_etag, listing_last_modified,
+           last_attempt_at, last_success_at, consecutive_failures, last_error
+    FROM news.source_state
+"""
+
+# Progress columns only move forward (NULL keeps the stored value); a run without
+# a successful crawl bumps consecutive_failures instead of resetting it, and a
+# row without attempted_at only advances progress (the attempt was recorded before)
+UPSERT_SOURCE_STATE_SQL = """
+    INSERT INTO news.source_state
+    (source, last_url, last_published_date, listing_url, listing_etag, listing_last_modified,
+     last_attempt_at, last_success_at, consecutive_failures, last_error)
+    VALUES (%(source)s, %(last_url)s, %(last_published_date)s, %(listing_url)s, %(listing_etag)s,
+            %(listing_last_modified)s, %(attempted_at)s, %(succeeded_at)s,
+            CASE WHEN %(attempted_at)s::timestamptz IS NOT NULL
+                      AND %(succeeded_at)s::timestamptz IS NULL THEN 1 ELSE 0 END,
+            %(error)s)
+    ON CONFLICT (source) DO UPDATE SET
+        last_url = COALESCE(EXCLUDED.last_url, news.source_state.last_url),
+        last_published_date = GREATEST(EXCLUDED.last_published_date, news.source_state.last_published_date),
+        listing_url = COALESCE(EXCLUDED.listing_url, news.source_state.listing_url),
+        listing_etag = CASE WHEN EXCLUDED.listing_url IS NULL
+                            THEN news.source_state.listing_etag ELSE EXCLUDED.listing_etag END,
+        listing_last_modified = CASE WHEN EXCLUDED.listing_url IS NULL
+                                     THEN news.source_state.listing_last_modified
+                                     ELSE EXCLUDED.listing_last_modified END,
+        last_attempt_at = COALESCE(EXCLUDED.last_attempt_at, news.source_state.last_attempt_at),
+        last_success_at = COALESCE(EXCLUDED.last_success_at, news.source_state.last_success_at),
+        consecutive_failures = CASE WHEN EXCLUDED.last_attempt_at IS NULL
+                                    THEN news.source_state.consecutive_failures
+                                    WHEN EXCLUDED.last_success_at IS NULL
+                                    THEN news.source_state.consecutive_failures + 1 ELSE 0 END,
+        last_error = CASE WHEN EXCLUDED.last_attempt_at IS NULL
+                          THEN news.source_state.last_error ELSE EXCLUDED.last_error END
+"""
+
+
+# news.articles.published_date is a plain TIMESTAMP in Baku time (UTC+4, no DST since 2016)
+BAKU_TZ = timezone(timedelta(hours=4))
+
+
+def local_published_date(value: Optional[datetime]) -> Optional[datetime]:
+    """
+    Publish time as naive Baku time
+
+    Most sources give naive local times, Banker.az gives +04:00. Converting
+    the aware ones keeps a batch homogeneous: psycopg 3 types a datetime list
+    from its elements, and a mixed one could otherwise drop the offset.
+    """
+    if isinstance(value, datetime) and value.tzinfo is not None:
+        return value.astimezone(BAKU_TZ).replace(tzinfo=None)
+    return value
+
+
+def article_params(article: Dict, scraping_session_id: Optional[int]) -> tuple:
+    """Positional parameters for INSERT_ARTICLE_SQL"""
+    return (
+        article.get('title'),
+        article.get('content'),
+        article.get('source'),
+        article.get('url'),
+        local_published_date(article.get('published_date')),
+        article.get('language', 'az'),
+        scraping_session_id
+    )
+
+
+def known_urls_query(urls: List[str]) -> tuple:
+    """Query and parameters returning the already-known URLs of a list"""
+    if near_dup_enabled():
+        return KNOWN_URLS_SQL, {'urls': list(urls)}
+    return ARTICLES_EXIST_SQL, (list(urls),)
+
+
+def unique_articles(articles: List[Dict]) -> List[Dict]:
+    """
+    Collapse articles sharing a URL into one row (the last one wins, as with
+    row-by-row upserts). A single INSERT ... ON CONFLICT cannot touch the same
+    row twice, so bulk statements need unique URLs.
+    """
+    by_url = {}
+    for article in articles:
+        by_url[article.get('url')] = article
+    return list(by_url.values())
+
+
+def bulk_article_columns(articles: List[Dict], scraping_session_id: Optional[int]) -> tuple:
+    """Column arrays for BULK_INSERT_ARTICLES_UNNEST_SQL"""
+    rows = [article_params(article, scraping_session_id) for article in articles]
+    return tuple(list(column) for column in zip(*rows))
+
+
+def ids_in_order(articles: List[Dict], rows: List[Dict]) -> List[int]:
+    """Map RETURNING (id, url) rows back to the order of the input articles"""
+    id_by_url = {row['url']: row['id'] for row in rows}
+    return [id_by_url[article.get('url')] for article in articles]
+
+
+def summary_params(summary_data: Dict) -> tuple:
+    """Positional parameters for INSERT_SUMMARY_SQL"""
+    performance_metrics = summary_data.get('performance_metrics')
+    return (
+        summary_data.get('summary'),
+        summary_data.get('articles_count'),
+        summary_data.get('sources_count'),
+        summary_data.get('new_articles_count'),
+        summary_data.get('scraping_duration_seconds'),
+        json.dumps(performance_metrics) if performance_metrics is not None else None
+    )
+
+
+def scraping_metrics_params(row: Dict, run: Dict) -> tuple:
+    """
+    Positional parameters for INSERT_SCRAPING_METRICS_SQL
+
+    Args:
+        row: One group from metrics.RunMetrics.table_rows()
+        run: started_at, duration_seconds, success and scraping_session_id of the run
+    """
+    return (
+        run['started_at'],
+        run.get('duration_seconds'),
+        bool(run.get('success')),
+        run.get('scraping_session_id'),
+        row['source'],
+        row['requests'],
+        row['bytes'],
+        row['errors'],
+        json.dumps(row['error_classes']),
+        row.get('articles_found'),
+        row.get('articles_saved'),
+        row.get('latency_p50_ms'),
+        row.get('latency_p95_ms'),
+        row.get('latency_p99_ms'),
+        row.get('time_spent_ms'),
+        row.get('parse_cpu_seconds'),
+        row.get('tokens_input', 0),
+        row.get('tokens_output', 0),
+        json.dumps(row.get('details') or {})
+    )
+
+
 class Database:
     def __init__(self):
         self.connection_string = os.getenv('DATABASE_URL')
@@ -94,27 +370,8 @@ class Database:
                 print("[ERROR] Failed to establish database connection")
                 return None
 
-            query = sql.SQL("""
-                INSERT INTO news.articles (title, content, source, url, published_date, language, scraping_session_id)
-                VALUES (%s, %s, %s, %s, %s, %s, %s)
-                ON CONFLICT (url) DO UPDATE
-                SET title = EXCLUDED.title,
-                    content = EXCLUDED.content,
-                    published_date = EXCLUDED.published_date,
-                    scraping_session_id = EXCLUDED.scraping_session_id,
-                    updated_at = CURRENT_TIMESTAMP
-                RETURNING id
-            """)
-
-            self.cursor.execute(query, (
-                article.get('title'),
-                article.get('content'),
-                article.get('source'),
-                article.get('url'),
-                article.get('published_date'),
-                article.get('language', 'az'),
-                scraping_session_id
-            ))
+            query = sql.SQL(INSERT_ARTICLE_SQL)
+            self.cursor.execute(query, article_params(article, scraping_session_id))
 
             result = self.cursor.fetchone()
             self.conn.commit()
@@ -138,6 +395,56 @@ class Database:
                 self.conn.rollback()
             return None
 
+    def _upsert_articles(self, articles: List[Dict], scraping_session_id: Optional[int]) -> List[int]:
+        """
+        Upsert a batch of articles with one multi-row statement (no commit)
+
+        Returns:
+            Article IDs in the order of the given articles
+        """
+        rows = unique_articles(articles)
+        if not rows:
+            return []
+
+        result = execute_values(
+            self.cursor,
+            BULK_INSERT_ARTICLES_SQL,
+            [article_params(article, scraping_session_id) for article in rows],
+            page_size=len(rows),  # whole batch in a single round trip
+            fetch=True
+        )
+        return ids_in_order(articles, result)
+
+    def upsert_articles(self, articles: List[Dict], scraping_session_id: Optional[int] = None) -> List[int]:
+        """
+        Insert or update many articles in one statement and one transaction
+
+        Args:
+            articles: List of article dictionaries
+            scraping_session_id: Optional ID of the scraping session
+
+        Returns:
+            Article IDs in input order (empty list on failure, nothing is saved)
+        """
+        if not articles:
+            return []
+
+        try:
+            # Ensure connection is alive
+            if not self.ensure_connection():
+                print("[ERROR] Failed to establish database connection")
+                return []
+
+            article_ids = self._upsert_articles(articles, scraping_session_id)
+            self.conn.commit()
+            return article_ids
+
+        except Exception as e:
+            print(f"[ERROR] Error bulk inserting articles: {e}")
+            if self.conn and not self.conn.closed:
+                self.conn.rollback()
+            return []
+
     def bulk_insert_articles(self, articles: List[Dict], scraping_session_id: Optional[int] = None) -> int:
         """
         Insert multiple articles in a single transaction
@@ -149,13 +456,10 @@ class Database:
         Returns:
             Number of articles successfully inserted
         """
-        inserted_count = 0
-        for article in articles:
-            if self.insert_article(article, scraping_session_id):
-                inserted_count += 1
-        return inserted_count
+        return len(self.upsert_articles(articles, scraping_session_id))
 
-    def save_complete_session(self, articles: List[Dict], summary_data: Dict) -> Optional[int]:
+    def save_complete_session(self, articles: List[Dict], summary_data: Dict,
+                              signatures: Optional[List[Dict]] = None) -> Optional[int]:
         """
         Save a complete scraping session (summary + articles) in a single transaction.
         If anything fails, everything is rolled back.
@@ -168,6 +472,9 @@ class Database:
                 - sources_count: int (number of sources)
                 - new_articles_count: int (new articles saved)
                 - scraping_duration_seconds: float (optional)
+                - performance_metrics: dict (optional, see metrics.RunMetrics.summary)
+            signatures: news.article_signatures rows of the articles and their
+                near-duplicates (optional, see near_dup.signature_rows)
 
         Returns:
             Session ID if successful, None if anything failed (with full rollback)
@@ -182,20 +489,8 @@ class Database:
             print("[INFO] Starting database transaction...")
 
             # Step 1: Create scraping session
-            query = sql.SQL("""
-                INSERT INTO news.scraping_summaries
-                (summary, articles_count, sources_count, new_articles_count, scraping_duration_seconds)
-                VALUES (%s, %s, %s, %s, %s)
-                RETURNING id
-            """)
-
-            self.cursor.execute(query, (
-                summary_data.get('summary'),
-                summary_data.get('articles_count'),
-                summary_data.get('sources_count'),
-                summary_data.get('new_articles_count'),
-                summary_data.get('scraping_duration_seconds')
-            ))
+            query = sql.SQL(INSERT_SUMMARY_SQL)
+            self.cursor.execute(query, summary_params(summary_data))
 
             result = self.cursor.fetchone()
             session_id = result['id'] if result else None
@@ -207,33 +502,15 @@ class Database:
 
             print(f"[SUCCESS] Created scraping session (ID: {session_id})")
 
-            # Step 2: Insert all articles with session ID
-            articles_saved = 0
-            article_query = sql.SQL("""
-                INSERT INTO news.articles (title, content, source, url, published_date, language, scraping_session_id)
-                VALUES (%s, %s, %s, %s, %s, %s, %s)
-                ON CONFLICT (url) DO UPDATE
-                SET title = EXCLUDED.title,
-                    content = EXCLUDED.content,
-                    published_date = EXCLUDED.published_date,
-                    scraping_session_id = EXCLUDED.scraping_session_id,
-                    updated_at = CURRENT_TIMESTAMP
-                RETURNING id
-            """)
-
-            for article in articles:
-                self.cursor.execute(article_query, (
-                    article.get('title'),
-                    article.get('content'),
-                    article.get('source'),
-                    article.get('url'),
-                    article.get('published_date'),
-                    article.get('language', 'az'),
-                    session_id
-                ))
-                articles_saved += 1
-
-            print(f"[SUCCESS] Inserted {articles_saved} articles")
+            # Step 2: Insert all articles with session ID (one statement)
+            article_ids = self._upsert_articles(articles, session_id)
+
+            print(f"[SUCCESS] Inserted {len(article_ids)} articles")
+
+            # Step 3: Signatures for near-duplicate detection
+            if signatures:
+                self.cursor.executemany(sql.SQL(UPSERT_SIGNATURE_SQL), signatures)
+                print(f"[SUCCESS] Stored {len(signatures)} article signatures")
 
             # Commit transaction
             self.conn.commit()
@@ -255,13 +532,56 @@ class Database:
             if not self.ensure_connection():
                 return False
 
-            query = sql.SQL("SELECT id FROM news.articles WHERE url = %s")
+            query = sql.SQL(ARTICLE_EXISTS_SQL)
             self.cursor.execute(query, (url,))
             return self.cursor.fetchone() is not None
         except Exception as e:
             print(f"[ERROR] Error checking article existence: {e}")
             return False
 
+    def articles_exist(self, urls: List[str]) -> Set[str]:
+        """
+        Check which of the given URLs are already stored, in a single query
+
+        Args:
+            urls: List of article URLs
+
+        Returns:
+            Set of URLs that already exist in news.articles (or were dropped as
+            near-duplicates, see near_dup.py)
+        """
+        if not urls:
+            return set()
+
+        try:
+            # Ensure connection is alive
+            if not self.ensure_connection():
+                return set()
+
+            query, params = known_urls_query(urls)
+            self.cursor.execute(sql.SQL(query), params)
+            return {row['url'] for row in self.cursor.fetchall()}
+        except Exception as e:
+            print(f"[ERROR] Error checking article existence: {e}")
+            return set()
+
+    def latest_published_dates(self) -> Dict[str, datetime]:
+        """
+        Publish time of the newest stored article of each source
+
+        Returns:
+            {source name: published_date}; empty if the query fails
+        """
+        try:
+            if not self.ensure_connection():
+                return {}
+
+            self.cursor.execute(LATEST_PUBLISHED_SQL)
+            return {row['source']: row['latest'] for row in self.cursor.fetchall()}
+        except Exception as e:
+            print(f"[ERROR] Error reading latest publish dates: {e}")
+            return {}
+
     def insert_scraping_summary(self, summary_data: Dict) -> Optional[int]:
         """
         Insert a scraping session summary
@@ -273,6 +593,7 @@ class Database:
                 - sources_count: int (number of sources)
                 - new_articles_count: int (new articles saved)
                 - scraping_duration_seconds: float (optional)
+                - performance_metrics: dict (optional, see metrics.RunMetrics.summary)
 
         Returns:
             Summary ID if successful, None otherwise
@@ -283,20 +604,8 @@ class Database:
                 print("[ERROR] Failed to establish database connection")
                 return None
 
-            query = sql.SQL("""
-                INSERT INTO news.scraping_summaries
-                (summary, articles_count, sources_count, new_articles_count, scraping_duration_seconds)
-                VALUES (%s, %s, %s, %s, %s)
-                RETURNING id
-            """)
-
-            self.cursor.execute(query, (
-                summary_data.get('summary'),
-                summary_data.get('articles_count'),
-                summary_data.get('sources_count'),
-                summary_data.get('new_articles_count'),
-                summary_data.get('scraping_duration_seconds')
-            ))
+            query = sql.SQL(INSERT_SUMMARY_SQL)
+            self.cursor.execute(query, summary_params(summary_data))
 
             result = self.cursor.fetchone()
             self.conn.commit()
@@ -333,16 +642,7 @@ class Database:
                 print("[ERROR] Failed to establish database connection")
                 return False
 
-            query = sql.SQL("""
-                UPDATE news.scraping_summaries
-                SET summary = %s,
-                    articles_count = %s,
-                    new_articles_count = %s,
-                    scraping_duration_seconds = %s,
-                    updated_at = CURRENT_TIMESTAMP
-                WHERE id = %s
-            """)
-
+            query = sql.SQL(UPDATE_SUMMARY_SQL)
             self.cursor.execute(query, (
                 summary_data.get('summary'),
                 summary_data.get('articles_count'),
@@ -361,6 +661,196 @@ class Database:
                 self.conn.rollback()
             return False
 
+    def save_run_metrics(self, rows: List[Dict], run: Dict) -> int:
+        """
+        Store per-source performance metrics for one run in news.scraping_metrics
+
+        Args:
+            rows: Groups from metrics.RunMetrics.table_rows()
+            run: Dictionary with keys:
+                - started_at: datetime
+                - duration_seconds: float
+                - success: bool
+                - scraping_session_id: int (None if the run saved nothing)
+
+        Returns:
+            Number of rows written (0 on failure)
+        """
+        if not rows:
+            return 0
+
+        try:
+            # Ensure connection is alive
+            if not self.ensure_connection():
+                print("[ERROR] Failed to establish database connection")
+                return 0
+
+            query = sql.SQL(INSERT_SCRAPING_METRICS_SQL)
+            self.cursor.executemany(query, [scraping_metrics_params(row, run) for row in rows])
+            self.conn.commit()
+            return len(rows)
+
+        except Exception as e:
+            print(f"[ERROR] Error saving run metrics: {e}")
+            if self.conn and not self.conn.closed:
+                self.conn.rollback()
+            return 0
+
+    def get_source_states(self) -> Dict[str, Dict]:
+        """
+        Stored crawl state of every source (see source_state.py)
+
+        Returns:
+            {source name: news.source_state row}; empty if the query fails
+        """
+        try:
+            if not self.ensure_connection():
+                return {}
+
+            self.cursor.execute(SOURCE_STATES_SQL)
+            return {row['source']: dict(row) for row in self.cursor.fetchall()}
+        except Exception as e:
+            print(f"[ERROR] Error reading source state: {e}")
+            return {}
+
+    def save_source_states(self, rows: List[Dict]) -> int:
+        """
+        Update news.source_state after a run
+
+        Args:
+            rows: Parameters from source_state.state_row(), one per crawled source
+
+        Returns:
+            Number of sources updated (0 on failure)
+        """
+        if not rows:
+            return 0
+
+        try:
+            # Ensure connection is alive
+            if not self.ensure_connection():
+                print("[ERROR] Failed to establish database connection")
+                return 0
+
+            query = sql.SQL(UPSERT_SOURCE_STATE_SQL)
+            self.cursor.executemany(query, rows)
+            self.conn.commit()
+            return len(rows)
+
+        except Exception as e:
+            print(f"[ERROR] Error saving source state: {e}")
+            if self.conn and not self.conn.closed:
+                self.conn.rollback()
+            return 0
+
+    def recent_signatures(self, hours: float) -> List[Dict]:
+        """
+        Signatures of the stories stored in the last hours (see near_dup.py)
+
+        Returns:
+            news.article_signatures rows with url and simhash; empty if the query fails
+        """
+        try:
+            if not self.ensure_connection():
+                return []
+
+            self.cursor.execute(sql.SQL(RECENT_SIGNATURES_SQL), (hours,))
+            return self.cursor.fetchall()
+        except Exception as e:
+            print(f"[ERROR] Error reading article signatures: {e}")
+            if self.conn and not self.conn.closed:
+                self.conn.rollback()
+            return []
+
+    def save_signatures(self, rows: List[Dict]) -> int:
+        """
+        Store near-duplicate signatures outside a session (see near_dup.signature_rows)
+
+        Returns:
+            Number of rows written (0 on failure)
+        """
+        if not rows:
+            return 0
+
+        try:
+            if not self.ensure_connection():
+                return 0
+
+            self.cursor.executemany(sql.SQL(UPSERT_SIGNATURE_SQL), rows)
+            self.conn.commit()
+            return len(rows)
+
+        except Exception as e:
+            print(f"[ERROR] Error saving article signatures: {e}")
+            if self.conn and not self.conn.closed:
+                self.conn.rollback()
+            return 0
+
+    def relevance_verdicts(self, hashes: List[str], prompt_version: str) -> Dict[str, bool]:
+        """
+        Stored Gemini relevance verdicts of articles (see relevance.content_hash)
+
+        Returns:
+            {content hash: relevant} for the hashes with a verdict; empty if the query fails
+        """
+        if not hashes:
+            return {}
+
+        try:
+            if not self.ensure_connection():
+                return {}
+
+            self.cursor.execute(sql.SQL(RELEVANCE_VERDICTS_SQL), (prompt_version, list(hashes)))
+            return {row['content_hash']: row['relevant'] for row in self.cursor.fetchall()}
+        except Exception as e:
+            print(f"[ERROR] Error reading relevance verdicts: {e}")
+            if self.conn and not self.conn.closed:
+                self.conn.rollback()
+            return {}
+
+    def relevance_examples(self, prompt_version: str, limit: int) -> List[Dict]:
+        """
+        Newest Gemini relevance verdicts for a filter prompt version (see relevance.py)
+
+        Returns:
+            news.article_relevance rows with title, snippet and relevant; empty if the query fails
+        """
+        try:
+            if not self.ensure_connection():
+                return []
+
+            self.cursor.execute(sql.SQL(RELEVANCE_EXAMPLES_SQL), (prompt_version, limit))
+            return self.cursor.fetchall()
+        except Exception as e:
+            print(f"[ERROR] Error reading relevance verdicts: {e}")
+            if self.conn and not self.conn.closed:
+                self.conn.rollback()
+            return []
+
+    def save_relevance(self, rows: List[Dict]) -> int:
+        """
+        Store Gemini relevance verdicts (see relevance.verdict_rows)
+
+        Returns:
+            Number of rows written (0 on failure)
+        """
+        if not rows:
+            return 0
+
+        try:
+            if not self.ensure_connection():
+                return 0
+
+            self.cursor.executemany(sql.SQL(UPSERT_RELEVANCE_SQL), rows)
+            self.conn.commit()
+            return len(rows)
+
+        except Exception as e:
+            print(f"[ERROR] Error saving relevance verdicts: {e}")
+            if self.conn and not self.conn.closed:
+                self.conn.rollback()
+            return 0
+
     def get_articles_by_source(self, source: str, limit: int = 10) -> List[Dict]:
         """Retrieve articles from a specific source"""
         try:
@@ -368,12 +858,7 @@ class Database:
             if not self.ensure_connection():
                 return []
 
-            query = sql.SQL("""
-                SELECT * FROM news.articles
-                WHERE source = %s
-                ORDER BY published_date DESC
-                LIMIT %s
-            """)
+            query = sql.SQL(ARTICLES_BY_SOURCE_SQL)
             self.cursor.execute(query, (source, limit))
             return self.cursor.fetchall()
         except Exception as e:
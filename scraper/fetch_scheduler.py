@@ -0,0 +1,333 @@
+"""
+Global fetch scheduler shared by all async scrapers
+Bounds the total number of in-flight HTTP requests and adapts the budget of
+each host to how it responds, so that all sources can run concurrently
+without overwhelming any site
+"""
+
+import os
+import time
+import asyncio
+from typing import Dict, Optional
+from urllib.parse import urlparse
+from contextlib import asynccontextmanager
+
+from http_pool import http_pool
+from retry_policy import CircuitBreaker, CircuitOpenError
+
+# Responses that mean "slow down": rate limiting, bot protection, overload
+THROTTLE_STATUSES = {403, 429}
+
+
+def host_of(url: str) -> str:
+    """Lower-case host (netloc) of a URL"""
+    return urlparse(url).netloc.lower()
+
+
+class HostLimiter:
+    """
+    Adaptive request budget for one host
+
+    Two limits apply to every request:
+    - a concurrency window (AIMD): grows by about one slot per window of fast,
+      successful responses (one per response until the first back-off, like
+      TCP slow start) and is halved on 403/429/5xx, timeouts or connection
+      errors
+    - a token bucket: requests per second, adjusted the same way, so a host is
+      never hit faster than it has recently been able to answer
+
+    Back-offs are applied at most once per cooldown, so a burst of failures
+    from requests that were already in flight only halves the budget once.
+
+    Requests still queued here when the host's circuit breaker opens are
+    refused with CircuitOpenError instead of trickling out at the reduced rate.
+    Once it is half-open, only one of them goes out as the trial request.
+    """
+
+    def __init__(self, host: str, initial_concurrency: int, max_concurrency: int,
+                 initial_rate: float, max_rate: float, latency_target: float, adaptive: bool = True):
+        self.host = host
+        self.adaptive = adaptive
+        self.max_concurrency = max(1, max_concurrency)
+        self.limit = float(min(max(1, initial_concurrency), self.max_concurrency))
+        self.max_rate = max_rate
+        self.min_rate = 0.5
+        self.rate = min(initial_rate, max_rate)
+        self.latency_target = latency_target
+        self.breaker = CircuitBreaker(host)
+
+        self.in_flight = 0
+        self.tokens = 1.0
+        self._refilled_at = time.monotonic()
+        self._slots = asyncio.Condition()
+        self._bucket = asyncio.Lock()
+        self._backed_off_at = 0.0
+
+        # Counters exposed through get_state()
+        self.requests = 0
+        self.successes = 0
+        self.throttled = 0     # 403/429 responses
+        self.errors = 0        # 5xx, timeouts, connection errors
+        self.backoffs = 0
+        self.peak_limit = self.limit
+        self.latency_ewma: Optional[float] = None
+
+    async def acquire(self):
+        """
+        Wait for a concurrency slot, then for a token
+
+        Raises:
+            CircuitOpenError: the host's circuit breaker opened while waiting
+        """
+        # A request arriving half-open already holds the trial permit (allow_request)
+        trial_of = self.breaker.times_opened if self.breaker.state == 'half-open' else None
+
+        async with self._slots:
+            await self._slots.wait_for(lambda: self.in_flight < int(self.limit))
+            self.in_flight += 1
+
+        try:
+            async with self._bucket:
+                while True:
+                    if not self._may_send(trial_of):
+                        raise CircuitOpenError(self.host)
+                    now = time.monotonic()
+                    # Bucket holds at most one window's worth of burst
+                    self.tokens = min(max(1.0, self.limit),
+                                      self.tokens + (now - self._refilled_at) * self.rate)
+                    self._refilled_at = now
+                    if self.tokens >= 1:
+                        self.tokens -= 1
+                        break
+                    await asyncio.sleep((1 - self.tokens) / self.rate)
+        except BaseException:
+            await self.release()
+            raise
+
+        self.requests += 1
+
+    def _may_send(self, trial_of: Optional[int]) -> bool:
+        """
+        Whether a queued request may still go out
+
+        Args:
+            trial_of: breaker.times_opened when the request arrived as the
+                half-open trial, None if it arrived while the circuit was closed
+        """
+        state = self.breaker.state
+        if state == 'closed':
+            return True
+        if state == 'open':
+            return False
+        # Half-open: the trial goes out; of the requests queued before the
+        # circuit opened, only one takes over the trial if nobody holds it
+        return trial_of == self.breaker.times_opened or self.breaker.allow_request()
+
+    async def release(self):
+        """Give the concurrency slot back"""
+        async with self._slots:
+            self.in_flight -= 1
+            # The limit may have grown by more than one slot
+            self._slots.notify_all()
+
+    def on_success(self, latency: float):
+        """Healthy response: additive increase while latency stays under target"""
+        self.successes += 1
+        self.latency_ewma = latency if self.latency_ewma is None else 0.8 * self.latency_ewma + 0.2 * latency
+
+        if self.adaptive and latency <= self.latency_target:
+            if self.backoffs == 0:
+                # Slow start: until the host first pushes back, grow by one per
+                # response (the budget doubles every window)
+                self.limit = min(self.max_concurrency, self.limit + 1)
+                self.rate = min(self.max_rate, self.rate + 1)
+            else:
+                # Congestion avoidance: about +1 slot and +1 req/s per window
+                self.limit = min(self.max_concurrency, self.limit + 1 / self.limit)
+                self.rate = min(self.max_rate, self.rate + 1 / self.limit)
+            self.peak_limit = max(self.peak_limit, self.limit)
+
+    def on_failure(self, throttled: bool = False):
+        """Throttle or server/network error: multiplicative decrease"""
+        if throttled:
+            self.throttled += 1
+        else:
+            self.errors += 1
+
+        if not self.adaptive:
+            return
+
+        now = time.monotonic()
+        cooldown = max(1.0, self.latency_ewma or 0.0)
+        if now - self._backed_off_at < cooldown:
+            return
+
+        self._backed_off_at = now
+        self.backoffs += 1
+        self.limit = max(1.0, self.limit / 2)
+        self.rate = max(self.min_rate, self.rate / 2)
+        self.tokens = min(self.tokens, 1.0)
+
+    def get_state(self) -> Dict:
+        """Current budget and counters"""
+        return {
+            'host': self.host,
+            'concurrency': int(self.limit),
+            'peak_concurrency': int(self.peak_limit),
+            'rate_per_second': round(self.rate, 2),
+            'in_flight': self.in_flight,
+            'requests': self.requests,
+            'throttled': self.throttled,
+            'errors': self.errors,
+            'backoffs': self.backoffs,
+            'circuit': self.breaker.state,
+            'latency_ms': round(self.latency_ewma * 1000) if self.latency_ewma is not None else None
+        }
+
+
+class FetchSlot:
+    """
+    Handle for one request inside FetchScheduler.slot()
+
+    The caller reports how the request went; latency is measured from the
+    moment the slot was granted to the report (roughly time to first byte).
+    """
+
+    def __init__(self, limiter: HostLimiter):
+        self.limiter = limiter
+        self.started = time.monotonic()
+        self.reported = False
+
+    def record_status(self, status: int):
+        """Report the HTTP status of the response"""
+        if self.reported:
+            return
+        self.reported = True
+        if status in THROTTLE_STATUSES:
+            self.limiter.on_failure(throttled=True)
+        elif status >= 500:
+            self.limiter.on_failure()
+        else:
+            self.limiter.on_success(time.monotonic() - self.started)
+
+    def record_failure(self):
+        """Report a timeout or connection error (no-op if a status was already recorded)"""
+        if self.reported:
+            return
+        self.reported = True
+        self.limiter.on_failure()
+
+
+class FetchScheduler:
+    """
+    Concurrency budget for page fetches across all sources
+
+    Configuration (environment variables):
+    - SCRAPER_MAX_CONCURRENCY: total in-flight requests across all sources (default: 20)
+    - SCRAPER_PER_HOST_CONCURRENCY: starting in-flight requests per host (default: 5)
+    - SCRAPER_PER_HOST_MAX_CONCURRENCY: upper bound per host (default: HTTP_POOL_PER_HOST)
+    - SCRAPER_PER_HOST_RATE: starting requests per second per host (default: 10)
+    - SCRAPER_PER_HOST_MAX_RATE: upper bound in requests per second (default: 50)
+    - SCRAPER_LATENCY_TARGET: responses slower than this (seconds) don't grow the budget (default: 2)
+    - SCRAPER_ADAPTIVE_LIMITS: adapt per-host budgets (default: true); false keeps them fixed
+
+    Per-host concurrency never exceeds the connection pool's HTTP_POOL_PER_HOST:
+    requests above it would only queue for a connection, and that wait would be
+    measured as the host's latency.
+    """
+
+    def __init__(self, max_concurrency: int = None, per_host_concurrency: int = None):
+        self.max_concurrency = max_concurrency or int(os.getenv('SCRAPER_MAX_CONCURRENCY', '20'))
+        self.per_host_concurrency = per_host_concurrency or int(os.getenv('SCRAPER_PER_HOST_CONCURRENCY', '5'))
+        pool_limit = http_pool.per_host  # 0 = no per-host connection limit
+        self.per_host_max_concurrency = int(os.getenv('SCRAPER_PER_HOST_MAX_CONCURRENCY', str(pool_limit or 16)))
+        if pool_limit > 0:
+            self.per_host_concurrency = min(self.per_host_concurrency, pool_limit)
+            self.per_host_max_concurrency = min(self.per_host_max_concurrency, pool_limit)
+        self.per_host_rate = float(os.getenv('SCRAPER_PER_HOST_RATE', '10'))
+        self.per_host_max_rate = float(os.getenv('SCRAPER_PER_HOST_MAX_RATE', '50'))
+        self.latency_target = float(os.getenv('SCRAPER_LATENCY_TARGET', '2'))
+        self.adaptive = os.getenv('SCRAPER_ADAPTIVE_LIMITS', 'true').lower() in ('true', '1', 'yes', 'on')
+        self._global = asyncio.Semaphore(self.max_concurrency)
+        self._hosts: Dict[str, HostLimiter] = {}
+
+    def _host_limiter(self, host: str) -> HostLimiter:
+        """Get (or lazily create) the limiter for a host"""
+        if host not in self._hosts:
+            self._hosts[host] = HostLimiter(
+                host,
+                initial_concurrency=self.per_host_concurrency,
+                max_concurrency=max(self.per_host_concurrency, self.per_host_max_concurrency),
+                initial_rate=self.per_host_rate,
+                max_rate=max(self.per_host_rate, self.per_host_max_rate),
+                latency_target=self.latency_target,
+                adaptive=self.adaptive
+            )
+        return self._hosts[host]
+
+    @asynccontextmanager
+    async def slot(self, url: str):
+        """
+        Acquire a fetch slot for the given URL
+
+        The per-host slot is taken first so that a slow host only queues its
+        own requests and never holds global slots while waiting.
+
+        Args:
+            url: URL about to be fetched
+
+        Yields:
+            FetchSlot to report the outcome on
+
+        Raises:
+            CircuitOpenError: the host's circuit breaker is open
+        """
+        limiter = self._host_limiter(host_of(url))
+        await limiter.acquire()
+        try:
+            async with self._global:
+                yield FetchSlot(limiter)
+        finally:
+            await limiter.release()
+
+    def breaker(self, url: str) -> CircuitBreaker:
+        """Circuit breaker for the URL's host (see retry_policy.py)"""
+        return self._host_limiter(host_of(url)).breaker
+
+    def get_host_state(self, url_or_host: str) -> Optional[Dict]:
+        """
+        Limiter state for one host
+
+        Args:
+            url_or_host: A URL on the host, or the host itself
+
+        Returns:
+            Dictionary from HostLimiter.get_state(), or None if the host was never fetched
+        """
+        host = host_of(url_or_host) if '://' in url_or_host else url_or_host.lower()
+        limiter = self._hosts.get(host)
+        if limiter is None:
+            return None
+        return limiter.get_state()
+
+    def get_stats(self) -> Dict[str, Dict]:
+        """Limiter state for every host seen so far"""
+        return {host: limiter.get_state() for host, limiter in self._hosts.items()}
+
+
+# Default scheduler used by every BaseScraper unless one is passed explicitly
+_default_scheduler = None
+
+
+def get_default_scheduler() -> FetchScheduler:
+    """Return the process-wide scheduler, creating it on first use"""
+    global _default_scheduler
+    if _default_scheduler is None:
+        _default_scheduler = FetchScheduler()
+    return _default_scheduler
+
+
+def reset_default_scheduler():
+    """Forget all per-host state; scrapers created afterwards start from the configured defaults"""
+    global _default_scheduler
+    _default_scheduler = None
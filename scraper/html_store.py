@@ -0,0 +1,229 @@
+"""
+Content-addressed store of raw HTML pages
+Every downloaded page is kept gzip-compressed under its SHA-256 digest, with an
+index of (url, fetch time) -> digest, so parsers can be re-run offline against
+real pages (replay mode) without hitting the sites again
+"""
+
+import os
+import time
+import gzip
+import asyncio
+import sqlite3
+import hashlib
+import pathlib
+import threading
+from typing import Dict, Optional
+
+DEFAULT_STORE_DIR = pathlib.Path(__file__).parent / '.cache' / 'html'
+
+
+class HtmlStore:
+    """
+    Size-bounded raw HTML store with least-recently-used eviction
+
+    Layout:
+        <dir>/index.sqlite3          fetch index and object sizes / access times
+        <dir>/objects/ab/abcdef.gz   page bodies, named by SHA-256 of the body
+
+    Identical bodies (e.g. the same article fetched by two runs) are stored once.
+    A debugging/replay tool, off by default; scrapers write through put_async,
+    so hashing, compression and SQLite commits run in a worker thread.
+
+    Configuration (environment variables):
+    - HTML_STORE_ENABLED: keep every fetched page (default: false)
+    - HTML_STORE_DIR: store directory (default: scraper/.cache/html)
+    - HTML_STORE_MAX_MB: compressed size limit before eviction (default: 200)
+    - HTML_STORE_REPLAY: serve pages from the store instead of the network (default: false)
+    """
+
+    def __init__(self, directory: Optional[str] = None):
+        self.enabled = os.getenv('HTML_STORE_ENABLED', 'false').lower() in ('true', '1', 'yes', 'on')
+        self.replay = os.getenv('HTML_STORE_REPLAY', 'false').lower() in ('true', '1', 'yes', 'on')
+        self.directory = str(directory or os.getenv('HTML_STORE_DIR') or DEFAULT_STORE_DIR)
+        self.max_bytes = int(float(os.getenv('HTML_STORE_MAX_MB', '200')) * 1024 * 1024)
+        self.conn: Optional[sqlite3.Connection] = None
+        self.total_bytes = 0
+        # Writes come from worker threads (put_async)
+        self.lock = threading.RLock()
+
+        # Per-process counters
+        self.stored = 0     # Pages written (new objects or new fetches of known ones)
+        self.replayed = 0   # Pages served in replay mode
+        self.missing = 0    # Replay lookups with no stored page
+        self.evicted = 0    # Objects removed by the size limit
+
+    def _connect(self) -> Optional[sqlite3.Connection]:
+        """Open the index on first use (disables the store if that fails)"""
+        if self.conn is None and (self.enabled or self.replay):
+            try:
+                os.makedirs(os.path.join(self.directory, 'objects'), exist_ok=True)
+                self.conn = sqlite3.connect(os.path.join(self.directory, 'index.sqlite3'),
+                                            check_same_thread=False)
+                self.conn.executescript("""
+                    CREATE TABLE IF NOT EXISTS objects (
+                        digest TEXT PRIMARY KEY,
+                        size INTEGER NOT NULL,
+                        last_access REAL NOT NULL
+                    );
+                    CREATE TABLE IF NOT EXISTS fetches (
+                        url TEXT NOT NULL,
+                        fetched_at REAL NOT NULL,
+                        digest TEXT NOT NULL REFERENCES objects(digest),
+                        PRIMARY KEY (url, fetched_at)
+                    );
+                    CREATE INDEX IF NOT EXISTS idx_fetches_digest ON fetches(digest);
+                """)
+                self.total_bytes = self.conn.execute("SELECT COALESCE(SUM(size), 0) FROM objects").fetchone()[0]
+            except (OSError, sqlite3.Error) as e:
+                print(f"[WARNING] HTML store unavailable ({self.directory}): {e}")
+                self.enabled = False
+                self.conn = None
+        return self.conn
+
+    def _object_path(self, digest: str) -> str:
+        return os.path.join(self.directory, 'objects', digest[:2], f"{digest}.gz")
+
+    def put(self, url: str, body: bytes) -> Optional[str]:
+        """
+        Store a fetched page
+
+        Args:
+            url: Page URL
+            body: Raw response body
+
+        Returns:
+            SHA-256 digest of the body, or None if the store is disabled
+        """
+        if not self.enabled or self.replay:
+            return None
+
+        with self.lock:
+            return self._put(url, body)
+
+    async def put_async(self, url: str, body: bytes) -> Optional[str]:
+        """put() in a worker thread, keeping disk and SQLite I/O off the event loop"""
+        if not self.enabled or self.replay:
+            return None
+        return await asyncio.to_thread(self.put, url, body)
+
+    def _put(self, url: str, body: bytes) -> Optional[str]:
+        """put() with the lock held"""
+        conn = self._connect()
+        if conn is None:
+            return None
+
+        digest = hashlib.sha256(body).hexdigest()
+        now = time.time()
+
+        try:
+            row = conn.execute("SELECT size FROM objects WHERE digest = ?", (digest,)).fetchone()
+            if row is None:
+                path = self._object_path(digest)
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                data = gzip.compress(body)
+                with open(path, 'wb') as f:
+                    f.write(data)
+                conn.execute("INSERT INTO objects (digest, size, last_access) VALUES (?, ?, ?)",
+                             (digest, len(data), now))
+                self.total_bytes += len(data)
+            else:
+                conn.execute("UPDATE objects SET last_access = ? WHERE digest = ?", (now, digest))
+
+            conn.execute("INSERT OR REPLACE INTO fetches (url, fetched_at, digest) VALUES (?, ?, ?)",
+                         (url, now, digest))
+            conn.commit()
+            self.stored += 1
+        except (OSError, sqlite3.Error) as e:
+            print(f"[WARNING] HTML store write failed for {url}: {e}")
+            return None
+
+        if self.total_bytes > self.max_bytes:
+            self.evict()
+        return digest
+
+    def get(self, url: str) -> Optional[bytes]:
+        """
+        Latest stored body for a URL
+
+        Returns:
+            Raw page body, or None if the URL was never stored
+        """
+        with self.lock:
+            conn = self._connect()
+            if conn is None:
+                return None
+
+            try:
+                row = conn.execute(
+                    "SELECT digest FROM fetches WHERE url = ? ORDER BY fetched_at DESC LIMIT 1", (url,)
+                ).fetchone()
+                if row is None:
+                    return None
+
+                with open(self._object_path(row[0]), 'rb') as f:
+                    body = gzip.decompress(f.read())
+                conn.execute("UPDATE objects SET last_access = ? WHERE digest = ?", (time.time(), row[0]))
+                conn.commit()
+                return body
+            except (OSError, sqlite3.Error) as e:
+                print(f"[WARNING] HTML store read failed for {url}: {e}")
+                return None
+
+    def replay_page(self, url: str) -> Optional[bytes]:
+        """Replay-mode lookup: stored body for a URL, counted as replayed or missing"""
+        body = self.get(url)
+        if body is None:
+            self.missing += 1
+        else:
+            self.replayed += 1
+        return body
+
+    def evict(self):
+        """Remove least recently used objects until the store is under 90% of its limit"""
+        with self.lock:
+            conn = self._connect()
+            if conn is None:
+                return
+
+            target = int(self.max_bytes * 0.9)
+            try:
+                for digest, size in conn.execute(
+                    "SELECT digest, size FROM objects ORDER BY last_access"
+                ).fetchall():
+                    if self.total_bytes <= target:
+                        break
+                    try:
+                        os.remove(self._object_path(digest))
+                    except FileNotFoundError:
+                        pass
+                    conn.execute("DELETE FROM fetches WHERE digest = ?", (digest,))
+                    conn.execute("DELETE FROM objects WHERE digest = ?", (digest,))
+                    self.total_bytes -= size
+                    self.evicted += 1
+                conn.commit()
+            except (OSError, sqlite3.Error) as e:
+                print(f"[WARNING] HTML store eviction failed: {e}")
+
+    def get_stats(self) -> Dict:
+        """Store counters for this process"""
+        return {
+            'enabled': self.enabled,
+            'replay': self.replay,
+            'stored': self.stored,
+            'replayed': self.replayed,
+            'missing': self.missing,
+            'evicted': self.evicted,
+            'size_mb': round(self.total_bytes / 1024 / 1024, 1)
+        }
+
+    def close(self):
+        """Close the index"""
+        with self.lock:
+            if self.conn is not None:
+                self.conn.close()
+                self.conn = None
+
+
+# Process-wide store used by BaseScraper.fetch_raw
+html_store = HtmlStore()
@@ -0,0 +1,158 @@
+"""
+Persistent HTTP validator cache for listing pages
+Stores ETag / Last-Modified and the last body per URL in a local SQLite file so
+unchanged category pages are answered with 304 Not Modified instead of being
+downloaded again on the next run
+"""
+
+import os
+import time
+import zlib
+import asyncio
+import sqlite3
+import pathlib
+import threading
+from typing import Dict, Optional
+
+DEFAULT_CACHE_PATH = pathlib.Path(__file__).parent / '.cache' / 'http_cache.sqlite3'
+
+
+class HttpCache:
+    """
+    URL -> (ETag, Last-Modified, body) store backed by SQLite
+
+    Scrapers use get_async / store_async, so SQLite and zlib work runs in a
+    worker thread instead of on the event loop.
+
+    Configuration (environment variables):
+    - HTTP_CACHE_ENABLED: send conditional requests for listing pages (default: true)
+    - HTTP_CACHE_PATH: SQLite file (default: scraper/.cache/http_cache.sqlite3)
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.enabled = os.getenv('HTTP_CACHE_ENABLED', 'true').lower() in ('true', '1', 'yes', 'on')
+        self.path = str(path or os.getenv('HTTP_CACHE_PATH') or DEFAULT_CACHE_PATH)
+        self.conn: Optional[sqlite3.Connection] = None
+        # Reads and writes come from worker threads (get_async / store_async)
+        self.lock = threading.RLock()
+
+        # Per-process counters for the monitoring report
+        self.hits = 0       # 304 responses served from the cache
+        self.stores = 0     # Responses saved with validators
+
+    def _connect(self) -> Optional[sqlite3.Connection]:
+        """Open the cache file on first use (disables the cache if that fails)"""
+        if self.conn is None and self.enabled:
+            try:
+                os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+                self.conn = sqlite3.connect(self.path, check_same_thread=False)
+                self.conn.execute("""
+                    CREATE TABLE IF NOT EXISTS http_cache (
+                        url TEXT PRIMARY KEY,
+                        etag TEXT,
+                        last_modified TEXT,
+                        body BLOB NOT NULL,
+                        stored_at REAL NOT NULL
+                    )
+                """)
+                self.conn.commit()
+            except sqlite3.Error as e:
+                print(f"[WARNING] HTTP cache unavailable ({self.path}): {e}")
+                self.enabled = False
+                self.conn = None
+        return self.conn
+
+    def get(self, url: str) -> Optional[Dict]:
+        """
+        Cached entry for a URL
+
+        Returns:
+            Dictionary with etag, last_modified and body, or None if not cached
+        """
+        with self.lock:
+            conn = self._connect()
+            if conn is None:
+                return None
+
+            try:
+                row = conn.execute(
+                    "SELECT etag, last_modified, body FROM http_cache WHERE url = ?", (url,)
+                ).fetchone()
+            except sqlite3.Error as e:
+                print(f"[WARNING] HTTP cache read failed for {url}: {e}")
+                return None
+
+        if row is None:
+            return None
+        try:
+            return {'etag': row[0], 'last_modified': row[1], 'body': zlib.decompress(row[2])}
+        except zlib.error as e:
+            print(f"[WARNING] HTTP cache read failed for {url}: {e}")
+            return None
+
+    async def get_async(self, url: str) -> Optional[Dict]:
+        """get() in a worker thread, keeping SQLite and zlib work off the event loop"""
+        if not self.enabled:
+            return None
+        return await asyncio.to_thread(self.get, url)
+
+    def conditional_headers(self, entry: Optional[Dict]) -> Dict[str, str]:
+        """If-None-Match / If-Modified-Since headers for a cached entry"""
+        headers = {}
+        if entry:
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def store(self, url: str, etag: Optional[str], last_modified: Optional[str], body: bytes):
+        """
+        Save a response; pages without any validator are not cached
+
+        Args:
+            url: Requested URL
+            etag: ETag response header
+            last_modified: Last-Modified response header
+            body: Response body
+        """
+        if not etag and not last_modified:
+            return
+
+        data = zlib.compress(body)
+        with self.lock:
+            conn = self._connect()
+            if conn is None:
+                return
+
+            try:
+                conn.execute(
+                    "INSERT OR REPLACE INTO http_cache (url, etag, last_modified, body, stored_at) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (url, etag, last_modified, data, time.time())
+                )
+                conn.commit()
+                self.stores += 1
+            except sqlite3.Error as e:
+                print(f"[WARNING] HTTP cache write failed for {url}: {e}")
+
+    async def store_async(self, url: str, etag: Optional[str], last_modified: Optional[str], body: bytes):
+        """store() in a worker thread, keeping zlib and SQLite work off the event loop"""
+        if not self.enabled or (not etag and not last_modified):
+            return
+        await asyncio.to_thread(self.store, url, etag, last_modified, body)
+
+    def get_stats(self) -> Dict:
+        """Cache counters for this process"""
+        return {'enabled': self.enabled, 'hits': self.hits, 'stores': self.stores}
+
+    def close(self):
+        """Close the cache file"""
+        with self.lock:
+            if self.conn is not None:
+                self.conn.close()
+                self.conn = None
+
+
+# Process-wide cache used by BaseScraper.fetch_page
+http_cache = HttpCache()
@@ -0,0 +1,134 @@
+"""
+Shared, pooled aiohttp session for all async scrapers
+One connector is reused by every source so DNS lookups, TCP connections and
+TLS handshakes are paid once per host instead of once per scraper instance
+"""
+
+import os
+import aiohttp
+from typing import Dict, Optional, Tuple
+
+from metrics import run_metrics, request_timing_trace_config
+
+
+class HttpSessionPool:
+    """
+    Reference-counted owner of the process-wide aiohttp ClientSession
+
+    Each user (a scraper, main(), a long-running process) calls acquire() and
+    release(); the session is closed when the last user releases it, so a
+    process that holds a reference keeps its warm connections between runs.
+
+    Configuration (environment variables):
+    - HTTP_POOL_SIZE: maximum open connections in total (default: 100)
+    - HTTP_POOL_PER_HOST: maximum open connections per host (default: 10)
+    - HTTP_DNS_CACHE_TTL: seconds to cache DNS lookups (default: 300)
+    - HTTP_KEEPALIVE_TIMEOUT: seconds to keep idle connections open (default: 30)
+    """
+
+    def __init__(self):
+        self.pool_size = int(os.getenv('HTTP_POOL_SIZE', '100'))
+        self.per_host = int(os.getenv('HTTP_POOL_PER_HOST', '10'))
+        self.dns_cache_ttl = int(os.getenv('HTTP_DNS_CACHE_TTL', '300'))
+        self.keepalive_timeout = float(os.getenv('HTTP_KEEPALIVE_TIMEOUT', '30'))
+
+        self.session: Optional[aiohttp.ClientSession] = None
+        self.connector: Optional[aiohttp.TCPConnector] = None
+        self._refs = 0
+
+        # Client middlewares for sessions created from now on (aiohttp 3.12+); the
+        # benchmark harness uses one to route requests to its stand-in server
+        self.middlewares: Tuple = ()
+
+        # Counters fed by the trace config below
+        self.requests = 0
+        self.connections_created = 0
+        self.connections_reused = 0
+
+    def _create_trace_config(self) -> aiohttp.TraceConfig:
+        """Trace config that counts new vs reused connections"""
+        trace_config = aiohttp.TraceConfig()
+
+        async def on_request_start(session, ctx, params):
+            self.requests += 1
+
+        async def on_connection_create_end(session, ctx, params):
+            self.connections_created += 1
+
+        async def on_connection_reuseconn(session, ctx, params):
+            self.connections_reused += 1
+
+        trace_config.on_request_start.append(on_request_start)
+        trace_config.on_connection_create_end.append(on_connection_create_end)
+        trace_config.on_connection_reuseconn.append(on_connection_reuseconn)
+        return trace_config
+
+    def _create_session(self) -> aiohttp.ClientSession:
+        """Create the pooled connector and the session that owns it"""
+        self.connector = aiohttp.TCPConnector(
+            limit=self.pool_size,
+            limit_per_host=self.per_host,
+            use_dns_cache=True,
+            ttl_dns_cache=self.dns_cache_ttl,
+            keepalive_timeout=self.keepalive_timeout
+        )
+        options = {'middlewares': self.middlewares} if self.middlewares else {}
+        return aiohttp.ClientSession(
+            connector=self.connector,
+            trace_configs=[self._create_trace_config(), request_timing_trace_config(run_metrics)],
+            **options
+        )
+
+    async def acquire(self) -> aiohttp.ClientSession:
+        """
+        Get the shared session, creating it if needed
+
+        Returns:
+            Shared aiohttp ClientSession
+        """
+        if self.session is None or self.session.closed:
+            self.session = self._create_session()
+        self._refs += 1
+        return self.session
+
+    async def release(self):
+        """Drop one reference; close the session when nobody uses it anymore"""
+        self._refs = max(0, self._refs - 1)
+        if self._refs == 0:
+            await self.close()
+
+    async def close(self):
+        """Close the shared session and its connections"""
+        if self.session and not self.session.closed:
+            await self.session.close()
+        self.session = None
+        self.connector = None
+
+    def get_stats(self) -> Dict:
+        """
+        Get connection pool statistics for the monitoring report
+
+        Returns:
+            Dictionary with pool stats
+        """
+        open_connections = 0
+        if self.connector is not None and not self.connector.closed:
+            # aiohttp has no public API for this; read the connector's bookkeeping
+            idle = getattr(self.connector, '_conns', {})
+            acquired = getattr(self.connector, '_acquired', set())
+            open_connections = sum(len(conns) for conns in idle.values()) + len(acquired)
+
+        total = self.connections_created + self.connections_reused
+        return {
+            'requests': self.requests,
+            'open_connections': open_connections,
+            'connections_created': self.connections_created,
+            'connections_reused': self.connections_reused,
+            'reuse_ratio': self.connections_reused / total if total else 0.0,
+            'pool_size': self.pool_size,
+            'per_host_limit': self.per_host
+        }
+
+
+# Process-wide pool shared by every BaseScraper
+http_pool = HttpSessionPool()
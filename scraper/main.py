@@ -5,9 +5,11 @@ Runs all news source scrapers asynchronously and ONLY saves if everything succee
 
 import sys
 import os
+import json
 import asyncio
+import argparse
 from datetime import datetime, timezone
-from typing import Dict, List
+from typing import Awaitable, Callable, Dict, List, Optional, Set, Tuple
 
 # Load environment variables from .env file
 from dotenv import load_dotenv
@@ -26,7 +28,7 @@ if sys.platform == 'win32' and hasattr(sys.stdout, 'buffer'):
 # Add parent directory to path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from db import Database
+from async_db import AsyncDatabase
 from sources.banker_az import BankerAzScraper
 from sources.marja_az import MarjaAzScraper
 from sources.report_az import ReportAzScraper
@@ -38,18 +40,55 @@ from sources.apa_az import ApaAzScraper
 from sources.qafqazinfo_az import QafqazinfoAzScraper
 from sources.oxu_az import OxuAzScraper
 from telegram import TelegramReporter
-from summarizer import GeminiSummarizer
-
-
-async def scrape_source(scraper_class, source_name: str, db: Database, num_pages: int) -> Dict:
+from summarizer import GeminiSummarizer, FILTER_PROMPT_VERSION, in_order
+from http_pool import http_pool
+from http_cache import http_cache
+from html_store import html_store
+from metrics import run_metrics, GEMINI_GROUP
+from parse_pool import shutdown_parse_executor
+from source_state import state_row
+from near_dup import NearDuplicateDetector, near_dup_enabled, signature_rows
+from relevance import content_hash, verdict_rows
+
+
+# (scraper class, source name, number of listing pages) - reporting order
+SOURCES = [
+    (BankerAzScraper, "Banker.az", 2),
+    (MarjaAzScraper, "Marja.az", 2),
+    (ReportAzScraper, "Report.az", 1),
+    (FedAzScraper, "Fed.az", 2),
+    (SonxeberAzScraper, "Sonxeber.az", 2),
+    (IqtisadiyyatAzScraper, "Iqtisadiyyat.az", 2),
+    (TrendAzScraper, "Trend.az", 1),
+    (ApaAzScraper, "APA.az", 2),
+    (QafqazinfoAzScraper, "Qafqazinfo.az", 2),
+    (OxuAzScraper, "Oxu.az", 2),
+]
+
+
+async def scrape_source(scraper_class, source_name: str, db: Optional[AsyncDatabase], num_pages: int,
+                        seen_urls: Optional[Set[str]] = None,
+                        high_water_mark: Optional[datetime] = None,
+                        state: Optional[Dict] = None,
+                        known_urls_filter: Optional[Callable[[List[str]], Awaitable[Set[str]]]] = None) -> Dict:
     """
     Generic scraper function that collects articles without saving to DB
 
+    Articles are consumed from scraper.stream() as each one finishes, so a slow
+    page never holds back the rest of the source. With SCRAPER_INCREMENTAL
+    (default: on) listing pages are read until the crawl reaches articles from
+    earlier runs instead of a fixed num_pages (see BaseScraper.stream_incremental).
+
     Args:
         scraper_class: Scraper class to use
         source_name: Name of the source
-        db: Database instance (for duplicate checking)
-        num_pages: Number of pages to scrape
+        db: AsyncDatabase instance (for duplicate checking), None to keep every article
+        num_pages: Number of pages to scrape (minimum depth in incremental mode)
+        seen_urls: URLs already collected in this run (shared across sources)
+        high_water_mark: Publish time of the newest stored article of the source
+            (used when state has none yet)
+        state: news.source_state row of the source (see source_state.py)
+        known_urls_filter: Returns the already-known URLs of a list (default: db.articles_exist)
 
     Returns:
         Dictionary with scraping statistics and collected articles
@@ -59,37 +98,467 @@ async def scrape_source(scraper_class, source_name: str, db: Database, num_pages
     print("=" * 60)
 
     new_articles = []
+    seen_urls = seen_urls if seen_urls is not None else set()
+    window = int(os.getenv('SCRAPER_ARTICLE_WINDOW', '10'))
+    incremental = os.getenv('SCRAPER_INCREMENTAL', 'true').lower() == 'true'
+    if known_urls_filter is None and db:
+        known_urls_filter = db.articles_exist
 
     async with scraper_class() as scraper:
-        articles = await scraper.scrape_all(num_pages=num_pages, batch_size=10)
-
-        total_found = len(articles)
-        total_skipped = 0
-
-        # Check for duplicates but don't save yet
-        for article in articles:
-            if db.article_exists(article['url']):
-                total_skipped += 1
+        # Already-stored URLs are filtered out before their pages are downloaded
+        async for article in scraper.stream(
+            num_pages=num_pages,
+            window=window,
+            known_urls_filter=known_urls_filter,
+            incremental=incremental,
+            high_water_mark=high_water_mark,
+            state=state
+        ):
+            # Drop articles another source already delivered in this run
+            if article.get('url') in seen_urls:
                 continue
+            seen_urls.add(article.get('url'))
             new_articles.append(article)
 
+        total_found = scraper.stats['listing_urls']
+        listing_pages = scraper.stats['listing_pages']
+        total_skipped = scraper.stats['known_skipped']
+        not_modified = scraper.stats['not_modified']
+        retries = scraper.stats['retries']
+        circuit_skipped = scraper.stats['circuit_skipped']
+        limiter = scraper.limiter_state()
+        crawl_state = scraper.crawl_state
+        paused = scraper.skip_reason
+
     print("\n" + "=" * 60)
     print(f"{source_name.upper()} SUMMARY")
-    print(f"Total found: {total_found}")
+    if paused:
+        print(f"Paused: {paused}")
+    print(f"Total found: {total_found} ({listing_pages} listing page(s))")
     print(f"New articles: {len(new_articles)}")
-    print(f"Duplicates skipped: {total_skipped}")
+    print(f"Duplicates skipped: {total_skipped} (fetches saved)")
+    if not_modified:
+        print(f"Listing pages unchanged: {not_modified} (304, served from cache)")
+    if retries or circuit_skipped:
+        print(f"Retries: {retries}, skipped while site was down: {circuit_skipped}")
+    if limiter:
+        print(f"Rate limit: {limiter['concurrency']} concurrent (peak {limiter['peak_concurrency']}), "
+              f"{limiter['rate_per_second']} req/s, {limiter['backoffs']} back-offs")
     print("=" * 60)
 
     return {
         'name': source_name,
         'total': total_found,
-        'scraped': total_found,
+        'listing_pages': listing_pages,
+        'scraped': len(new_articles),
         'saved': len(new_articles),
         'skipped': total_skipped,
+        'fetches_saved': total_skipped,
+        'not_modified': not_modified,
+        'retries': retries,
+        'circuit_skipped': circuit_skipped,
+        'limiter': limiter,
+        'crawl_state': crawl_state,
+        'paused': paused,
         'new_articles': new_articles
     }
 
 
+async def scrape_source_safely(scraper_class, source_name: str, db: Optional[AsyncDatabase], num_pages: int,
+                               **options) -> Dict:
+    """
+    scrape_source() that reports a failing source in its statistics instead of raising
+
+    Args:
+        scraper_class, source_name, db, num_pages: As for scrape_source()
+        options: Further keyword arguments of scrape_source()
+
+    Returns:
+        Per-source statistics (with 'error' set if the source failed)
+    """
+    try:
+        return await scrape_source(scraper_class, source_name, db, num_pages=num_pages, **options)
+    except Exception as e:
+        print(f"[ERROR] {source_name} scraping failed: {e}")
+        return {
+            'name': source_name,
+            'total': 0,
+            'scraped': 0,
+            'saved': 0,
+            'skipped': 0,
+            'fetches_saved': 0,
+            'crawl_state': {'source': source_name, 'succeeded': False, 'error': str(e)},
+            'new_articles': [],
+            'error': str(e)
+        }
+
+
+async def load_crawl_state(db: Optional[AsyncDatabase]) -> Tuple[Dict[str, Dict], Dict[str, datetime]]:
+    """
+    Crawl state of every source, plus fallback high-water marks
+
+    Sources without a stored high-water mark yet start from their newest stored article.
+
+    Returns:
+        (news.source_state rows by source, newest stored publish time by source)
+    """
+    if not db:
+        return {}, {}
+    states = await db.get_source_states()
+    latest_published = {}
+    if any(not states.get(name, {}).get('last_published_date') for _, name, _ in SOURCES):
+        latest_published = await db.latest_published_dates()
+    return states, latest_published
+
+
+class ArticlePipeline:
+    """
+    Near-duplicate merging and relevance filtering, fed source by source
+
+    Each finished source's articles are clustered against the stored stories
+    and the sources before it (see near_dup.py). The kept articles go through
+    the local relevance pre-filter (see relevance.py); every
+    GEMINI_FILTER_BATCH_SIZE ambiguous ones start a Gemini filter call right
+    away, so Gemini latency overlaps the sources that are still being scraped.
+    Gemini's verdicts are stored in news.article_relevance, keyed by content
+    hash and prompt version: they train the pre-filter's model, and an article
+    with a stored verdict (e.g. from a run that failed after filtering) is not
+    sent again.
+
+    Duplicates are left out of the AI prompts and news.articles; only their
+    signatures are stored, so their URLs still count as known. Each source's
+    'saved' count drops by its duplicates, recorded as 'near_duplicates'.
+    """
+
+    def __init__(self, db: AsyncDatabase, summarizer: GeminiSummarizer):
+        self.db = db
+        self.summarizer = summarizer
+        self.detector = NearDuplicateDetector() if near_dup_enabled() else None
+        self.prefilter = summarizer.prefilter if summarizer.enabled else None
+        self.index = None
+        self.prepared = False
+        self.lock = asyncio.Lock()
+
+        self.articles: List[Dict] = []
+        self.duplicates: List[Dict] = []
+        self.relevant: List[Dict] = []
+        self.accepted = 0
+        self.irrelevant = 0
+        self.cached = 0
+        self.pending: List[Dict] = []
+        self.batches: List[Tuple[List[Dict], asyncio.Task]] = []
+
+    async def _prepare(self):
+        """Load the stored signatures and train the pre-filter's model (first source only)"""
+        self.prepared = True
+        if self.detector:
+            stored = await self.db.recent_signatures(self.detector.lookback_hours)
+            self.index = self.detector.build_index(stored)
+        if self.prefilter and self.prefilter.enabled and self.prefilter.model_enabled:
+            verdicts = await self.db.relevance_examples(FILTER_PROMPT_VERSION, self.prefilter.max_examples)
+            # CPU-bound: keep the event loop free for the sources still being scraped
+            await asyncio.to_thread(self.prefilter.train, verdicts)
+
+    async def add(self, stats: Dict):
+        """Take the new articles of a finished source"""
+        articles = stats.get('new_articles', [])
+        if not articles:
+            return
+
+        async with self.lock:
+            if not self.prepared:
+                await self._prepare()
+
+            kept, duplicates = articles, []
+            if self.detector:
+                kept, duplicates = self.detector.cluster(articles, self.index)
+                stats['near_duplicates'] = len(duplicates)
+                stats['saved'] -= len(duplicates)
+
+            self.articles.extend(kept)
+            self.duplicates.extend(duplicates)
+
+            ambiguous = kept
+            if self.prefilter:
+                relevant, irrelevant, ambiguous = self.prefilter.split(kept)
+                self.relevant.extend(relevant)
+                self.accepted += len(relevant)
+                self.irrelevant += len(irrelevant)
+                ambiguous = await self._apply_stored_verdicts(ambiguous)
+            self.pending.extend(ambiguous)
+            while len(self.pending) >= self.summarizer.filter_batch_size:
+                self._start_batch()
+
+    async def _apply_stored_verdicts(self, articles: List[Dict]) -> List[Dict]:
+        """
+        Settle articles Gemini has already judged with the same prompt version
+
+        Returns:
+            The articles without a stored verdict
+        """
+        hashes = {id(article): content_hash(article) for article in articles}
+        verdicts = await self.db.relevance_verdicts(list(set(hashes.values())), FILTER_PROMPT_VERSION)
+        if not verdicts:
+            return articles
+
+        unjudged = []
+        for article in articles:
+            verdict = verdicts.get(hashes[id(article)])
+            if verdict is None:
+                unjudged.append(article)
+            elif verdict:
+                self.relevant.append(article)
+        cached = len(articles) - len(unjudged)
+        self.cached += cached
+        run_metrics.count(GEMINI_GROUP, 'relevance_cache.hits', cached)
+        return unjudged
+
+    def _start_batch(self):
+        """Start filtering the pending articles (up to one batch)"""
+        batch = self.pending[:self.summarizer.filter_batch_size]
+        self.pending = self.pending[len(batch):]
+        if self.summarizer.enabled and not self.summarizer.quota_exhausted:
+            print(f"[INFO] Filtering {len(batch)} articles for banking/finance relevance...")
+        self.batches.append((batch, asyncio.create_task(self.summarizer.judge_batch_async(batch))))
+
+    async def finish(self) -> Tuple[List[Dict], List[Dict], List[Dict]]:
+        """
+        Filter what is left, wait for every batch and store Gemini's verdicts
+
+        Returns:
+            (articles to summarize and save, near-duplicates, banking-relevant articles)
+        """
+        async with self.lock:
+            if self.pending:
+                self._start_batch()
+            batches, self.batches = self.batches, []
+
+        if self.detector and self.articles:
+            print(f"[INFO] Near-duplicates: {len(self.duplicates)} of {len(self.articles) + len(self.duplicates)} "
+                  f"articles repeat another story ({self.index.size} signatures indexed)")
+        if self.prefilter and self.prefilter.enabled and self.articles:
+            print(f"[INFO] Relevance pre-filter: {self.accepted} relevant, {self.irrelevant} irrelevant, "
+                  f"{self.cached} judged by Gemini before, {sum(len(batch) for batch, _ in batches)} for Gemini")
+
+        judged_relevant, verdicts = [], []
+        for batch, judged in zip([batch for batch, _ in batches],
+                                 await asyncio.gather(*(task for _, task in batches))):
+            if judged is None:
+                judged_relevant.extend(batch)
+            else:
+                judged_relevant.extend(judged)
+                verdicts.extend(verdict_rows(batch, judged, FILTER_PROMPT_VERSION))
+        await self.db.save_relevance(verdicts)
+
+        relevant = in_order(self.articles, self.relevant, judged_relevant)
+        if self.summarizer.enabled and self.articles:
+            print(f"[SUCCESS] Filtered: {len(relevant)}/{len(self.articles)} articles are banking-relevant "
+                  f"({len(batches)} Gemini batch(es))")
+        return self.articles, self.duplicates, relevant
+
+
+async def scrape_all_sources(db: Optional[AsyncDatabase], concurrent: bool = True,
+                             pipeline: Optional[ArticlePipeline] = None) -> List[Dict]:
+    """
+    Scrape every configured source and collect per-source statistics
+
+    In concurrent mode all sources run under one event loop and share the
+    global fetch scheduler (see fetch_scheduler.py), so the run takes roughly
+    as long as the slowest source. A failing source never cancels the others.
+
+    Args:
+        db: AsyncDatabase instance (for duplicate checking), None to keep every article
+        concurrent: Run all sources at once (True) or one after another (False)
+        pipeline: Receives each source's results as soon as it finishes
+
+    Returns:
+        List of per-source statistics, in SOURCES order
+    """
+    seen_urls: Set[str] = set()
+    states, latest_published = await load_crawl_state(db)
+
+    async def run_one(scraper_class, source_name: str, num_pages: int) -> Dict:
+        stats = await scrape_source_safely(scraper_class, source_name, db, num_pages,
+                                           seen_urls=seen_urls,
+                                           high_water_mark=latest_published.get(source_name),
+                                           state=states.get(source_name))
+        if pipeline:
+            await pipeline.add(stats)
+        return stats
+
+    if not concurrent:
+        return [await run_one(*source) for source in SOURCES]
+
+    return list(await asyncio.gather(*(run_one(*source) for source in SOURCES)))
+
+
+async def summarize_and_save(db: AsyncDatabase, summarizer: GeminiSummarizer, telegram: TelegramReporter,
+                             sources_stats: List[Dict], start_time: datetime, errors: List[str],
+                             pipeline: Optional[ArticlePipeline] = None) -> Tuple[Optional[int], Optional[str]]:
+    """
+    AI summary of the new articles, then one transaction saving the session and its articles
+
+    Nothing is saved unless every step succeeds; the reason is appended to errors.
+    The Gemini calls are async, so a caller's other tasks keep running meanwhile.
+
+    Args:
+        db: Connected AsyncDatabase
+        summarizer: Gemini summarizer
+        telegram: Reporter for error alerts
+        sources_stats: Per-source results from scrape_source()
+        start_time: Start of the run (for the duration)
+        errors: Error list of the run
+        pipeline: Pipeline that was fed during scraping (see scrape_all_sources);
+            without one, every source is fed here
+
+    Returns:
+        (session ID or None if nothing was saved, AI summary or None)
+    """
+    if pipeline is None:
+        pipeline = ArticlePipeline(db, summarizer)
+        for stats in sources_stats:
+            await pipeline.add(stats)
+
+    print("\n" + "=" * 60)
+    print("SCRAPING PHASE COMPLETED")
+    print("=" * 60)
+
+    # One article per story; relevance batches may still be running
+    all_new_articles, duplicates, relevant_articles = await pipeline.finish()
+
+    # Calculate totals
+    total_found = sum(s['total'] for s in sources_stats)
+    total_saved = sum(s['saved'] for s in sources_stats)
+
+    print(f"Total articles found: {total_found}")
+    print(f"Total new articles: {total_saved}")
+
+    # Check if we have new articles
+    if not all_new_articles:
+        print("\n[WARNING] No new articles found - aborting (nothing to save)")
+        errors.append("No new articles found")
+        # Stories stored earlier: remember the copies so they aren't fetched again
+        await db.save_signatures(signature_rows(duplicates))
+        return None, None
+
+    print(f"\n[INFO] PHASE 2: CREATING AI SUMMARY for {len(all_new_articles)} articles...")
+
+    # Create AI summary
+    session_summary = await summarizer.create_session_summary_async(all_new_articles, sources_stats,
+                                                                    relevant_articles)
+
+    if not session_summary:
+        print("\n[ERROR] AI summary creation FAILED - aborting (nothing saved to DB)")
+        errors.append("AI summary creation failed - Gemini error or quota exhausted")
+        telegram.send_error_alert("Scraping failed: AI summary creation failed")
+        return None, None
+
+    # Check if summary indicates failure (insufficient banking news)
+    failure_keywords = [
+        "kifayət qədər xəbər tapılmadı",
+        "heç bir xəbər tapılmadı",
+        "No new articles",
+        "Məlumat yoxdur"
+    ]
+
+    if any(keyword in session_summary for keyword in failure_keywords):
+        print("\n[WARNING] AI summary indicates insufficient banking news - aborting")
+        errors.append("Insufficient banking-relevant articles")
+        return None, session_summary
+
+    print("[SUCCESS] AI summary created successfully")
+
+    print(f"\n[INFO] PHASE 3: SAVING TO DATABASE (transactional)...")
+
+    # Calculate duration
+    duration = (datetime.now(timezone.utc) - start_time).total_seconds()
+
+    # Prepare summary data
+    summary_data = {
+        'summary': session_summary,
+        'articles_count': total_found,
+        'sources_count': len(sources_stats),
+        'new_articles_count': total_saved,
+        'scraping_duration_seconds': duration,
+        'performance_metrics': run_metrics.summary()
+    }
+
+    # Save everything in one transaction
+    session_id = await db.save_complete_session(all_new_articles, summary_data,
+                                                signature_rows(all_new_articles + duplicates))
+
+    if not session_id:
+        print("\n[ERROR] Database save FAILED - all changes rolled back")
+        errors.append("Database transaction failed - rolled back")
+        telegram.send_error_alert("Scraping failed: Database save failed (rolled back)")
+        return None, session_summary
+
+    print(f"\n[SUCCESS] ✅ Complete session saved to DB (Session ID: {session_id})")
+    print(f"  - {len(all_new_articles)} articles saved")
+    print(f"  - AI summary created and saved")
+    print(f"  - Duration: {duration:.1f}s")
+
+    return session_id, session_summary
+
+
+async def report_run(db: AsyncDatabase, telegram: TelegramReporter, sources_stats: List[Dict],
+                     start_time: datetime, end_time: datetime, success: bool,
+                     session_id: Optional[int], session_summary: Optional[str], errors: List[str]):
+    """
+    Store the run's performance metrics and send the Telegram reports
+
+    Runs whether or not the run succeeded; the user report is only sent on success.
+    """
+    # Per-source performance of this run, kept even when the run failed
+    metrics_rows = await db.save_run_metrics(run_metrics.table_rows(sources_stats), {
+        'started_at': start_time,
+        'duration_seconds': (end_time - start_time).total_seconds(),
+        'success': success,
+        'scraping_session_id': session_id
+    })
+    if metrics_rows:
+        print(f"[INFO] Saved {metrics_rows} performance metric rows")
+
+    # Calculate totals (even if scraping failed)
+    total_found = sum(s['total'] for s in sources_stats) if sources_stats else 0
+    total_scraped = sum(s['scraped'] for s in sources_stats) if sources_stats else 0
+    total_saved = sum(s['saved'] for s in sources_stats) if sources_stats else 0
+    total_skipped = sum(s['skipped'] for s in sources_stats) if sources_stats else 0
+    total_fetches_saved = sum(s.get('fetches_saved', 0) for s in sources_stats)
+    total_near_duplicates = sum(s.get('near_duplicates', 0) for s in sources_stats)
+
+    # Prepare report statistics
+    report_stats = {
+        'start_time': start_time,
+        'end_time': end_time,
+        'sources': sources_stats,
+        'sources_count': len(sources_stats),
+        'total_found': total_found,
+        'total_scraped': total_scraped,
+        'total_saved': total_saved,
+        'total_skipped': total_skipped,
+        'total_fetches_saved': total_fetches_saved,
+        'total_near_duplicates': total_near_duplicates,
+        'session_summary': session_summary,
+        'errors': errors,
+        'http_pool': http_pool.get_stats(),
+        'http_cache': http_cache.get_stats(),
+        'performance': run_metrics.summary()
+    }
+
+    # Send dual Telegram reports
+    # 1. Monitoring report → NOTIFICATION_CHAT (detailed system health & performance)
+    #    - Sent regardless of success/failure
+    #    - Includes: metrics, source breakdown, errors, system health
+    telegram.send_monitoring_report(report_stats, success=success)
+
+    # 2. User report → CHANNEL_CHAT_ID (clean banking intelligence)
+    #    - Only sent on successful scraping
+    #    - Includes: only the banking intelligence summary for end users
+    if success:
+        telegram.send_user_report(report_stats)
+
+
 async def main():
     """Main async function to run all scrapers with transactional DB saves"""
     print("\n" + "=" * 60)
@@ -102,117 +571,47 @@ async def main():
 
     # Track overall statistics
     start_time = datetime.now(timezone.utc)
+    run_metrics.reset()
     sources_stats = []
-    all_new_articles = []
     errors = []
     end_time = None
+    session_id = None
+    session_summary = None
     success = False  # Track if scraping completed successfully
 
     # Initialize database connection
-    db = Database()
+    db = AsyncDatabase()
 
-    if not db.connect():
+    if not await db.connect():
         error_msg = "Failed to connect to database"
         print(f"[ERROR] {error_msg}")
         telegram.send_error_alert(error_msg)
         return
 
+    # Hold the shared HTTP session for the whole run so connections are reused across sources
+    await http_pool.acquire()
+
     try:
         print("\n[INFO] PHASE 1: SCRAPING ALL SOURCES (no DB saves yet)...")
 
         # Scrape all sources (without saving to DB)
-        sources_stats.append(await scrape_source(BankerAzScraper, "Banker.az", db, num_pages=2))
-        sources_stats.append(await scrape_source(MarjaAzScraper, "Marja.az", db, num_pages=2))
-        sources_stats.append(await scrape_source(ReportAzScraper, "Report.az", db, num_pages=1))
-        sources_stats.append(await scrape_source(FedAzScraper, "Fed.az", db, num_pages=2))
-        sources_stats.append(await scrape_source(SonxeberAzScraper, "Sonxeber.az", db, num_pages=2))
-        sources_stats.append(await scrape_source(IqtisadiyyatAzScraper, "Iqtisadiyyat.az", db, num_pages=2))
-        sources_stats.append(await scrape_source(TrendAzScraper, "Trend.az", db, num_pages=1))
-        sources_stats.append(await scrape_source(ApaAzScraper, "APA.az", db, num_pages=2))
-        sources_stats.append(await scrape_source(QafqazinfoAzScraper, "Qafqazinfo.az", db, num_pages=2))
-        sources_stats.append(await scrape_source(OxuAzScraper, "Oxu.az", db, num_pages=2))
-
-        # Collect all new articles
-        for stats in sources_stats:
-            all_new_articles.extend(stats.get('new_articles', []))
-
-        print("\n" + "=" * 60)
-        print("SCRAPING PHASE COMPLETED")
-        print("=" * 60)
-
-        # Calculate totals
-        total_found = sum(s['total'] for s in sources_stats)
-        total_saved = sum(s['saved'] for s in sources_stats)
-
-        print(f"Total articles found: {total_found}")
-        print(f"Total new articles: {total_saved}")
-
-        # Check if we have new articles
-        if not all_new_articles:
-            print("\n[WARNING] No new articles found - aborting (nothing to save)")
-            end_time = datetime.now(timezone.utc)
-            errors.append("No new articles found")
-            return
-
-        print(f"\n[INFO] PHASE 2: CREATING AI SUMMARY for {len(all_new_articles)} articles...")
-
-        # Create AI summary
-        session_summary = summarizer.create_session_summary(all_new_articles, sources_stats)
-
-        if not session_summary:
-            print("\n[ERROR] AI summary creation FAILED - aborting (nothing saved to DB)")
-            end_time = datetime.now(timezone.utc)
-            errors.append("AI summary creation failed - Gemini error or quota exhausted")
-            telegram.send_error_alert("Scraping failed: AI summary creation failed")
-            return
-
-        # Check if summary indicates failure (insufficient banking news)
-        failure_keywords = [
-            "kifayət qədər xəbər tapılmadı",
-            "heç bir xəbər tapılmadı",
-            "No new articles",
-            "Məlumat yoxdur"
-        ]
-
-        if any(keyword in session_summary for keyword in failure_keywords):
-            print("\n[WARNING] AI summary indicates insufficient banking news - aborting")
-            end_time = datetime.now(timezone.utc)
-            errors.append("Insufficient banking-relevant articles")
-            return
-
-        print("[SUCCESS] AI summary created successfully")
+        concurrent = os.getenv('SCRAPER_CONCURRENT_SOURCES', 'true').lower() in ('true', '1', 'yes', 'on')
+        print(f"[INFO] Source mode: {'concurrent' if concurrent else 'sequential'}")
+        # Near-duplicate merging and relevance filtering start as soon as each source finishes
+        pipeline = ArticlePipeline(db, summarizer)
+        sources_stats.extend(await scrape_all_sources(db, concurrent=concurrent, pipeline=pipeline))
 
-        print(f"\n[INFO] PHASE 3: SAVING TO DATABASE (transactional)...")
+        # Source-level failures are reported but don't abort the run
+        for stats in sources_stats:
+            if stats.get('error'):
+                errors.append(f"{stats['name']}: {stats['error']}")
 
-        # Calculate duration
+        session_id, session_summary = await summarize_and_save(db, summarizer, telegram, sources_stats,
+                                                               start_time, errors, pipeline)
         end_time = datetime.now(timezone.utc)
-        duration = (end_time - start_time).total_seconds()
-
-        # Prepare summary data
-        summary_data = {
-            'summary': session_summary,
-            'articles_count': total_found,
-            'sources_count': len(sources_stats),
-            'new_articles_count': total_saved,
-            'scraping_duration_seconds': duration
-        }
-
-        # Save everything in one transaction
-        session_id = db.save_complete_session(all_new_articles, summary_data)
-
-        if not session_id:
-            print("\n[ERROR] Database save FAILED - all changes rolled back")
-            errors.append("Database transaction failed - rolled back")
-            telegram.send_error_alert("Scraping failed: Database save failed (rolled back)")
-            return
-
-        print(f"\n[SUCCESS] ✅ Complete session saved to DB (Session ID: {session_id})")
-        print(f"  - {len(all_new_articles)} articles saved")
-        print(f"  - AI summary created and saved")
-        print(f"  - Duration: {duration:.1f}s")
 
         # Mark as successful
-        success = True
+        success = session_id is not None
 
     except KeyboardInterrupt:
         print("\n\n[INFO] Scraping interrupted by user")
@@ -229,45 +628,90 @@ async def main():
         end_time = datetime.now(timezone.utc)
 
     finally:
-        # Close database connection
-        db.close()
-
         # Ensure end_time is set
         if end_time is None:
             end_time = datetime.now(timezone.utc)
 
-        # Calculate totals (even if scraping failed)
-        total_found = sum(s['total'] for s in sources_stats) if sources_stats else 0
-        total_scraped = sum(s['scraped'] for s in sources_stats) if sources_stats else 0
-        total_saved = sum(s['saved'] for s in sources_stats) if sources_stats else 0
-        total_skipped = sum(s['skipped'] for s in sources_stats) if sources_stats else 0
-
-        # Prepare report statistics
-        report_stats = {
-            'start_time': start_time,
-            'end_time': end_time,
-            'sources': sources_stats,
-            'sources_count': len(sources_stats),
-            'total_found': total_found,
-            'total_scraped': total_scraped,
-            'total_saved': total_saved,
-            'total_skipped': total_skipped,
-            'session_summary': session_summary if 'session_summary' in locals() else None,
-            'errors': errors
-        }
+        # Crawl state: failures are always recorded, progress only once the
+        # source's articles are stored (or it had none)
+        state_rows = [state_row(s['crawl_state'], start_time, include_progress=success or not s.get('scraped'))
+                      for s in sources_stats if s.get('crawl_state')]
+        if await db.save_source_states(state_rows):
+            print(f"[INFO] Updated crawl state of {len(state_rows)} sources")
+
+        await report_run(db, telegram, sources_stats, start_time, end_time, success,
+                         session_id, session_summary, errors)
+
+        # Close database connection pool
+        await db.close()
+
+        await http_pool.release()
+        http_cache.close()
+        html_store.close()
+
+        # Stop parser worker threads/processes
+        shutdown_parse_executor()
+
+
+async def replay(output: Optional[str] = None):
+    """
+    Offline run: re-parse pages saved in the HTML store (see html_store.py)
 
-        # Send dual Telegram reports
-        # 1. Monitoring report → NOTIFICATION_CHAT (detailed system health & performance)
-        #    - Sent regardless of success/failure
-        #    - Includes: metrics, source breakdown, errors, system health
-        telegram.send_monitoring_report(report_stats, success=success)
+    Listing and article pages are read from disk instead of the network, and
+    nothing is written to the database, sent to Gemini or posted to Telegram.
+    Useful for debugging parsers against real pages at disk speed.
+
+    Args:
+        output: Optional JSON file to write the parsed articles to
+    """
+    print("\n" + "=" * 60)
+    print("REPLAY MODE - PARSING STORED PAGES (OFFLINE)")
+    print("=" * 60)
+
+    html_store.replay = True
+    start_time = datetime.now(timezone.utc)
+
+    try:
+        sources_stats = await scrape_all_sources(None, concurrent=True)
+    finally:
+        shutdown_parse_executor()
+
+    duration = (datetime.now(timezone.utc) - start_time).total_seconds()
+    store_stats = html_store.get_stats()
+    html_store.close()
+
+    print("\n" + "=" * 60)
+    print("REPLAY SUMMARY")
+    print("=" * 60)
+    for stats in sources_stats:
+        status = f"failed: {stats['error']}" if stats.get('error') else f"{stats['scraped']}/{stats['total']} parsed"
+        print(f"{stats['name']:<18} {status}")
+    print(f"Pages replayed: {store_stats['replayed']} (not in store: {store_stats['missing']})")
+    print(f"Duration: {duration:.2f}s")
 
-        # 2. User report → CHANNEL_CHAT_ID (clean banking intelligence)
-        #    - Only sent on successful scraping
-        #    - Includes: only the banking intelligence summary for end users
-        if success:
-            telegram.send_user_report(report_stats)
+    if output:
+        articles = [article for stats in sources_stats for article in stats.get('new_articles', [])]
+        with open(output, 'w', encoding='utf-8') as f:
+            json.dump(articles, f, ensure_ascii=False, indent=2, default=str)
+        print(f"[SUCCESS] Wrote {len(articles)} articles to {output}")
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    parser = argparse.ArgumentParser(description="Scrape Azerbaijani news sources")
+    parser.add_argument('--replay', action='store_true',
+                        help="Re-parse pages from the local HTML store instead of the network (no DB, AI or Telegram)")
+    parser.add_argument('--output', help="With --replay: write parsed articles to this JSON file")
+    parser.add_argument('--daemon', action='store_true',
+                        help="Keep running: crawl each source on its own interval and flush periodically (see daemon.py)")
+    args = parser.parse_args()
+
+    if args.replay:
+        asyncio.run(replay(output=args.output))
+    elif args.daemon:
+        from daemon import run_daemon
+        run_daemon()
+    else:
+        # psycopg's async connections need a selector event loop on Windows
+        if sys.platform == 'win32':
+            asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
+        asyncio.run(main())
@@ -0,0 +1,211 @@
+"""
+Run-level performance metrics
+Collects per-request timings (DNS, connect, time to first byte, body), parse
+time, page sizes, DB and Gemini call latency, grouped by source, and reduces
+them to p50/p95/p99 summaries for the session record and monitoring report
+"""
+
+import math
+import time
+from contextlib import contextmanager
+from typing import Dict, List, Optional
+
+import aiohttp
+
+# Group names used for work that doesn't belong to a news source
+DB_GROUP = 'database'
+GEMINI_GROUP = 'gemini'
+OTHER_GROUP = 'other'
+
+# Histogram that gives the latency and time-spent columns of a news.scraping_metrics row
+HEADLINE_LATENCY = {DB_GROUP: 'save_session_ms', GEMINI_GROUP: 'call_ms'}
+SOURCE_HEADLINE_LATENCY = 'ttfb_ms'
+TIME_SPENT = {DB_GROUP: ('save_session_ms', 'upsert_articles_ms'), GEMINI_GROUP: ('call_ms',)}
+SOURCE_TIME_SPENT = ('fetch_ms',)
+
+
+class Histogram:
+    """Raw samples of one metric; a run produces at most a few thousand"""
+
+    def __init__(self):
+        self.samples: List[float] = []
+
+    def add(self, value: float):
+        self.samples.append(value)
+
+    def percentile(self, p: float) -> Optional[float]:
+        """Nearest-rank percentile (p in 0-100)"""
+        if not self.samples:
+            return None
+        ordered = sorted(self.samples)
+        rank = max(1, math.ceil(len(ordered) * p / 100))
+        return ordered[rank - 1]
+
+    def summary(self) -> Dict:
+        """count, p50, p95, p99, max and mean, rounded for storage"""
+        if not self.samples:
+            return {'count': 0}
+        return {
+            'count': len(self.samples),
+            'p50': round(self.percentile(50), 1),
+            'p95': round(self.percentile(95), 1),
+            'p99': round(self.percentile(99), 1),
+            'max': round(max(self.samples), 1),
+            'mean': round(sum(self.samples) / len(self.samples), 1)
+        }
+
+
+class RunMetrics:
+    """
+    Histograms and counters per group (a source name, 'database' or 'gemini')
+
+    Histogram names end in their unit (e.g. ttfb_ms, page_kb); counters are
+    plain totals (requests, bytes, errors.timeout, ...).
+    """
+
+    def __init__(self):
+        self.histograms: Dict[str, Dict[str, Histogram]] = {}
+        self.counters: Dict[str, Dict[str, float]] = {}
+        self.started_at = time.time()
+
+    def reset(self):
+        """Start a new run"""
+        self.histograms.clear()
+        self.counters.clear()
+        self.started_at = time.time()
+
+    def observe(self, group: str, name: str, value: float):
+        """Add a sample to a histogram"""
+        self.histograms.setdefault(group, {}).setdefault(name, Histogram()).add(value)
+
+    def count(self, group: str, name: str, amount: float = 1):
+        """Increase a counter"""
+        group_counters = self.counters.setdefault(group, {})
+        group_counters[name] = group_counters.get(name, 0) + amount
+
+    @contextmanager
+    def timer(self, group: str, name: str):
+        """Record the wall time of a block in milliseconds under <name>_ms"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(group, f"{name}_ms", (time.perf_counter() - start) * 1000)
+
+    def summary(self) -> Dict[str, Dict]:
+        """
+        Per-group summaries
+
+        Returns:
+            {group: {'latency': {metric: {count, p50, p95, p99, max, mean}},
+                     'counters': {name: total}}}
+        """
+        groups = set(self.histograms) | set(self.counters)
+        return {
+            group: {
+                'latency': {name: hist.summary() for name, hist in self.histograms.get(group, {}).items()},
+                'counters': {name: round(value, 3) for name, value in self.counters.get(group, {}).items()}
+            }
+            for group in sorted(groups)
+        }
+
+    def table_rows(self, sources_stats: Optional[List[Dict]] = None) -> List[Dict]:
+        """
+        One row per group for news.scraping_metrics
+
+        Args:
+            sources_stats: Per-source results from scrape_source(), for article counts
+                (sources that failed before their first request still get a row)
+
+        Returns:
+            List of dicts with the table's per-group columns (see db.scraping_metrics_params)
+        """
+        sources = {s['name']: s for s in (sources_stats or [])}
+        rows = []
+        for group in sorted(set(self.histograms) | set(self.counters) | set(sources)):
+            histograms = self.histograms.get(group, {})
+            counters = self.counters.get(group, {})
+            source = sources.get(group, {})
+
+            headline = histograms.get(HEADLINE_LATENCY.get(group, SOURCE_HEADLINE_LATENCY))
+            spent = sum(sum(histograms[name].samples)
+                        for name in TIME_SPENT.get(group, SOURCE_TIME_SPENT) if name in histograms)
+            error_classes = {name.split('.', 1)[1]: int(value)
+                             for name, value in counters.items() if name.startswith('errors.')}
+            if group == GEMINI_GROUP and counters.get('errors'):
+                error_classes['api'] = int(counters['errors'])
+
+            # HTTP requests for sources, API calls for Gemini, timed queries for the database
+            requests = counters.get('requests', counters.get('calls'))
+            if requests is None:
+                requests = sum(len(hist.samples) for name, hist in histograms.items() if name.endswith('_ms'))
+
+            rows.append({
+                'source': group,
+                'requests': int(requests),
+                'bytes': int(counters.get('bytes', 0)),
+                'errors': sum(error_classes.values()),
+                'error_classes': error_classes,
+                'articles_found': source.get('total'),
+                'articles_saved': source.get('saved'),
+                'latency_p50_ms': headline.percentile(50) if headline else None,
+                'latency_p95_ms': headline.percentile(95) if headline else None,
+                'latency_p99_ms': headline.percentile(99) if headline else None,
+                'time_spent_ms': spent,
+                'parse_cpu_seconds': counters.get('parse_cpu_seconds', 0),
+                'tokens_input': int(counters.get('tokens_input', 0)),
+                'tokens_output': int(counters.get('tokens_output', 0)),
+                'details': {
+                    'latency': {name: hist.summary() for name, hist in histograms.items()},
+                    'counters': counters
+                }
+            })
+        return rows
+
+
+def request_timing_trace_config(metrics: 'RunMetrics') -> aiohttp.TraceConfig:
+    """
+    aiohttp trace config recording DNS, connect and time-to-first-byte per request
+
+    The group comes from the trace_request_ctx passed to session.get(), e.g.
+    session.get(url, trace_request_ctx={'source': 'Fed.az'}).
+    """
+    trace_config = aiohttp.TraceConfig()
+
+    def group_of(ctx) -> str:
+        request_ctx = getattr(ctx, 'trace_request_ctx', None)
+        if isinstance(request_ctx, dict):
+            return request_ctx.get('source', OTHER_GROUP)
+        return OTHER_GROUP
+
+    async def on_request_start(session, ctx, params):
+        ctx.request_start = time.perf_counter()
+
+    async def on_dns_resolvehost_start(session, ctx, params):
+        ctx.dns_start = time.perf_counter()
+
+    async def on_dns_resolvehost_end(session, ctx, params):
+        metrics.observe(group_of(ctx), 'dns_ms', (time.perf_counter() - ctx.dns_start) * 1000)
+
+    async def on_connection_create_start(session, ctx, params):
+        ctx.connect_start = time.perf_counter()
+
+    async def on_connection_create_end(session, ctx, params):
+        # Includes the TLS handshake
+        metrics.observe(group_of(ctx), 'connect_ms', (time.perf_counter() - ctx.connect_start) * 1000)
+
+    async def on_request_end(session, ctx, params):
+        # Fired once the response headers are in: time to first byte
+        metrics.observe(group_of(ctx), 'ttfb_ms', (time.perf_counter() - ctx.request_start) * 1000)
+
+    trace_config.on_request_start.append(on_request_start)
+    trace_config.on_dns_resolvehost_start.append(on_dns_resolvehost_start)
+    trace_config.on_dns_resolvehost_end.append(on_dns_resolvehost_end)
+    trace_config.on_connection_create_start.append(on_connection_create_start)
+    trace_config.on_connection_create_end.append(on_connection_create_end)
+    trace_config.on_request_end.append(on_request_end)
+    return trace_config
+
+
+# Process-wide metrics for the current run (reset by main at the start of each run)
+run_metrics = RunMetrics()
@@ -0,0 +1,197 @@
+"""
+Near-duplicate detection across sources
+The same press release (e.g. from the Central Bank) is published by several
+agencies under different URLs, so URL uniqueness doesn't catch it. Every
+article gets a 64-bit SimHash of its title and text shingles; articles whose
+signatures differ in at most NEAR_DUP_MAX_DISTANCE bits are one story. The
+signatures are stored in news.article_signatures, so a story is also
+recognised when another source publishes it in a later run.
+"""
+
+import os
+import re
+import hashlib
+from typing import Dict, Iterable, List, Optional, Tuple
+
+SIMHASH_BITS = 64
+
+WORD_RE = re.compile(r'\w+')
+
+
+def near_dup_enabled() -> bool:
+    """Whether NEAR_DUP_ENABLED is on (default: true)"""
+    return os.getenv('NEAR_DUP_ENABLED', 'true').lower() == 'true'
+
+
+def shingles(text: str, size: int) -> set:
+    """
+    Word shingles of a text
+
+    Args:
+        text: Title and content
+        size: Words per shingle
+
+    Returns:
+        Set of lowercase word n-grams (the whole text if it is shorter than one shingle)
+    """
+    words = WORD_RE.findall(text.casefold())
+    if len(words) <= size:
+        return {' '.join(words)} if words else set()
+    return {' '.join(words[i:i + size]) for i in range(len(words) - size + 1)}
+
+
+def simhash(text: str, shingle_size: int = 3) -> Optional[int]:
+    """
+    64-bit SimHash of a text
+
+    Each bit is set when most shingle hashes have it set, so texts sharing most
+    of their shingles get signatures that differ in only a few bits.
+
+    Returns:
+        Unsigned signature, or None for a text without words
+    """
+    hashes = [hashlib.blake2b(shingle.encode('utf-8'), digest_size=8).digest()
+              for shingle in shingles(text, shingle_size)]
+    if not hashes:
+        return None
+
+    # Bit strings transposed into columns: one str.count per bit instead of a loop per shingle
+    half = len(hashes) / 2
+    bits = (format(int.from_bytes(h, 'big'), '064b') for h in hashes)
+    return int(''.join('1' if column.count('1') > half else '0' for column in zip(*bits)), 2)
+
+
+def to_signed(signature: int) -> int:
+    """Unsigned 64-bit signature as a PostgreSQL BIGINT"""
+    return signature - (1 << SIMHASH_BITS) if signature >= 1 << (SIMHASH_BITS - 1) else signature
+
+
+def to_unsigned(value: int) -> int:
+    """BIGINT from news.article_signatures back to an unsigned signature"""
+    return value % (1 << SIMHASH_BITS)
+
+
+class SignatureIndex:
+    """
+    SimHash signatures split into bands for lookup by Hamming distance
+
+    With max_distance + 1 bands, two signatures within max_distance bits agree
+    on at least one whole band, so only articles sharing a band are compared.
+    """
+
+    def __init__(self, max_distance: int):
+        self.max_distance = max_distance
+        bands = max_distance + 1
+        edges = [round(i * SIMHASH_BITS / bands) for i in range(bands + 1)]
+        self.bands = [(start, (1 << (end - start)) - 1) for start, end in zip(edges, edges[1:])]
+        self.buckets: Dict[Tuple[int, int], List[Tuple[int, str]]] = {}
+        self.size = 0
+
+    def add(self, signature: int, url: str):
+        """Index an article's signature"""
+        for band, (shift, mask) in enumerate(self.bands):
+            self.buckets.setdefault((band, (signature >> shift) & mask), []).append((signature, url))
+        self.size += 1
+
+    def find(self, signature: int) -> Optional[str]:
+        """
+        Closest indexed article within max_distance bits
+
+        Returns:
+            Its URL, or None
+        """
+        best_url, best_distance = None, self.max_distance + 1
+        for band, (shift, mask) in enumerate(self.bands):
+            for other, url in self.buckets.get((band, (signature >> shift) & mask), ()):
+                distance = (signature ^ other).bit_count()
+                if distance < best_distance:
+                    best_url, best_distance = url, distance
+        return best_url
+
+
+class NearDuplicateDetector:
+    """
+    Clusters a run's articles with each other and with stored stories
+
+    The first article of a story to reach cluster() (or the stored one) is
+    kept; the others get duplicate_of set to its URL. ArticlePipeline clusters
+    each source as it finishes, so between two new copies the one from the
+    source that finished first wins.
+
+    Configuration (environment variables):
+    - NEAR_DUP_ENABLED: detect near-duplicates (default: true)
+    - NEAR_DUP_MAX_DISTANCE: differing signature bits that still count as the same story (default: 3)
+    - NEAR_DUP_SHINGLE_SIZE: words per shingle (default: 3)
+    - NEAR_DUP_LOOKBACK_HOURS: how far back stored signatures are matched (default: 72)
+    """
+
+    def __init__(self):
+        self.max_distance = max(0, int(os.getenv('NEAR_DUP_MAX_DISTANCE', '3')))
+        self.shingle_size = max(1, int(os.getenv('NEAR_DUP_SHINGLE_SIZE', '3')))
+        self.lookback_hours = float(os.getenv('NEAR_DUP_LOOKBACK_HOURS', '72'))
+
+    def signature(self, article: Dict) -> Optional[int]:
+        """SimHash of an article's title and content"""
+        return simhash(f"{article.get('title') or ''}\n{article.get('content') or ''}", self.shingle_size)
+
+    def build_index(self, stored: Iterable[Dict]) -> SignatureIndex:
+        """
+        Index of stored stories
+
+        Args:
+            stored: news.article_signatures rows with url and simhash
+        """
+        index = SignatureIndex(self.max_distance)
+        for row in stored:
+            index.add(to_unsigned(row['simhash']), row['url'])
+        return index
+
+    def cluster(self, articles: List[Dict], index: SignatureIndex) -> Tuple[List[Dict], List[Dict]]:
+        """
+        Split articles into one per story and the near-duplicates
+
+        Sets article['simhash'] on every article with text and
+        article['duplicate_of'] on the duplicates; kept articles are added to
+        the index.
+
+        Args:
+            articles: New articles of the run; earlier ones win over later copies
+            index: Stored stories (see build_index)
+
+        Returns:
+            (kept articles, duplicates), both in input order
+        """
+        kept, duplicates = [], []
+        for article in articles:
+            signature = self.signature(article)
+            if signature is None:
+                kept.append(article)
+                continue
+
+            article['simhash'] = signature
+            original = index.find(signature)
+            if original and original != article.get('url'):
+                article['duplicate_of'] = original
+                duplicates.append(article)
+            else:
+                index.add(signature, article.get('url'))
+                kept.append(article)
+        return kept, duplicates
+
+
+def signature_rows(articles: Iterable[Dict]) -> List[Dict]:
+    """
+    Parameters for db.UPSERT_SIGNATURE_SQL from clustered articles
+
+    Args:
+        articles: Kept articles and duplicates after NearDuplicateDetector.cluster
+
+    Returns:
+        One row per article with a signature
+    """
+    return [{
+        'url': article.get('url'),
+        'source': article.get('source'),
+        'simhash': to_signed(article['simhash']),
+        'duplicate_of': article.get('duplicate_of')
+    } for article in articles if article.get('simhash') is not None]
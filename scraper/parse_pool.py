@@ -0,0 +1,109 @@
+"""
+Executor for CPU-bound HTML parsing
+Keeps BeautifulSoup work off the event loop thread so downloads keep flowing
+while large pages are parsed
+"""
+
+import os
+import time
+from concurrent.futures import Executor, ThreadPoolExecutor, ProcessPoolExecutor
+from typing import Callable, Dict, Optional, Tuple
+
+PARSER_MODES = ('inline', 'thread', 'process')
+
+_executor: Optional[Executor] = None
+_executor_mode: Optional[str] = None
+
+# Scraper instances reused inside worker processes (one per scraper class)
+_worker_scrapers: Dict[type, object] = {}
+
+
+def get_parser_mode() -> str:
+    """
+    Parsing mode from PARSER_EXECUTOR
+
+    - inline: parse on the event loop thread (old behaviour)
+    - thread: parse in a thread pool (default)
+    - process: parse article pages in a process pool, scaling across cores
+    """
+    mode = os.getenv('PARSER_EXECUTOR', 'thread').lower()
+    if mode not in PARSER_MODES:
+        print(f"[WARNING] Unknown PARSER_EXECUTOR '{mode}', using 'thread'")
+        mode = 'thread'
+    return mode
+
+
+def get_parser_workers() -> int:
+    """Worker count from PARSER_WORKERS (default: number of CPUs, max 8)"""
+    default = min(8, os.cpu_count() or 1)
+    return max(1, int(os.getenv('PARSER_WORKERS', str(default))))
+
+
+def get_parse_executor(mode: str) -> Optional[Executor]:
+    """
+    Get the shared executor for a parsing mode, creating it on first use
+
+    Args:
+        mode: One of PARSER_MODES
+
+    Returns:
+        Executor, or None for inline parsing
+    """
+    global _executor, _executor_mode
+
+    if mode == 'inline':
+        return None
+
+    if _executor is None or _executor_mode != mode:
+        shutdown_parse_executor()
+        workers = get_parser_workers()
+        if mode == 'process':
+            _executor = ProcessPoolExecutor(max_workers=workers)
+        else:
+            _executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='parser')
+        _executor_mode = mode
+        print(f"[INFO] HTML parsing in {mode} pool ({workers} workers)")
+
+    return _executor
+
+
+def shutdown_parse_executor():
+    """Shut down the shared executor (no-op if none was created)"""
+    global _executor, _executor_mode
+    if _executor is not None:
+        _executor.shutdown(wait=True)
+    _executor = None
+    _executor_mode = None
+
+
+def timed_parse(parse: Callable[[bytes, str], Optional[Dict]], html: bytes,
+                url: str) -> Tuple[Optional[Dict], float]:
+    """
+    Run a parse function and measure the CPU time it used
+
+    CPU time is taken with time.thread_time(), so it only counts the thread
+    doing the parsing even when other parser threads are busy.
+
+    Returns:
+        (article, cpu_seconds)
+    """
+    start = time.thread_time()
+    article = parse(html, url)
+    return article, time.thread_time() - start
+
+
+def parse_article_in_worker(scraper_class: type, html: bytes, url: str) -> Tuple[Optional[Dict], float]:
+    """
+    Process-pool entry point: run scraper_class.parse_article in the worker
+
+    Only the class (pickled by reference), the raw page and the URL cross the
+    process boundary; the returned article dict is plain data.
+
+    Returns:
+        (article, cpu_seconds) as from timed_parse()
+    """
+    scraper = _worker_scrapers.get(scraper_class)
+    if scraper is None:
+        scraper = scraper_class()
+        _worker_scrapers[scraper_class] = scraper
+    return timed_parse(scraper.parse_article, html, url)
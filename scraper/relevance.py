@@ -0,0 +1,288 @@
+"""
+Local banking-relevance pre-filter
+Settles clear-cut articles without Gemini: weighted Azerbaijani keyword stems
+(kredit, depozit, faiz, məzənnə, Mərkəzi Bank, ...) score every article, and
+a small TF-IDF + logistic regression model trained on earlier Gemini verdicts
+(news.article_relevance) decides the middle band once there are enough of
+them. Only the articles neither is sure about go to Gemini.
+"""
+
+import os
+import re
+import math
+import random
+import hashlib
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from metrics import run_metrics, GEMINI_GROUP
+
+WORD_RE = re.compile(r'\w+')
+
+# Characters of content scored / used as model input besides the title
+SNIPPET_CHARS = 300
+
+# Stems matched at the start of a word (Azerbaijani suffixes vary: kredit, kreditlər, kreditin)
+POSITIVE_STEMS = {
+    'mərkəzi bank': 4, 'bank': 3, 'kredit': 3, 'depozit': 3, 'əmanət': 3, 'ipoteka': 3,
+    'uçot dərəcə': 4, 'məzənnə': 3, 'inflyasiya': 3, 'likvidlik': 3, 'istiqraz': 3, 'fintex': 3,
+    'valyuta': 2, 'manat': 2, 'maliyyə': 2, 'sığorta': 2, 'lizinq': 2, 'kapital': 2, 'birja': 2,
+    'səhm': 2, 'ödəniş': 2, 'bvf': 3, 'beynəlxalq valyuta fondu': 3, 'ümumi daxili məhsul': 2,
+    'ümd': 2, 'federal ehtiyat': 3, 'qiymətli kağız': 3, 'dollar': 2, 'avro': 2, 'borc': 2,
+    # Weak: alone they only send an article to Gemini instead of rejecting it
+    'faiz': 1, 'büdcə': 1, 'vergi': 1, 'investisiya': 1, 'mənfəət': 1, 'nağd': 1, 'iqtisad': 1,
+    'qiymət': 1, 'ixrac': 1, 'idxal': 1, 'neft': 1, 'sahibkar': 1,
+}
+NEGATIVE_STEMS = {
+    'futbol': 4, 'idman': 4, 'çempion': 4, 'olimpiya': 3, 'konsert': 3, 'festival': 2, 'teatr': 3,
+    'film': 2, 'serial': 3, 'müğənni': 3, 'aktyor': 3, 'hərbi': 3, 'ordu': 2, 'silahlı': 3,
+    'prokurorluq': 3, 'məhkəmə': 2, 'cinayət': 3, 'həbs': 3, 'qəza': 3, 'yanğın': 3,
+    'hava şərait': 3, 'yağış': 2,
+}
+
+# Words that start with a stem but mean something else ("avro" - Avropa, "ordu" - Ordubad)
+FALSE_FRIENDS = ('avropa', 'ordubad', 'banket')
+
+
+def normalize(text: str) -> str:
+    """Lowercase Azerbaijani text (İ -> i and I -> ı, which str.lower gets wrong)"""
+    return text.replace('İ', 'i').replace('I', 'ı').lower()
+
+
+def stem_pattern(stems: Iterable[str]) -> re.Pattern:
+    """Regex matching any of the stems at the start of a word"""
+    alternatives = sorted((re.escape(stem) for stem in stems), key=len, reverse=True)
+    return re.compile(r'\b(' + '|'.join(alternatives) + r')\w*')
+
+
+def matched_stems(pattern: re.Pattern, text: str) -> set:
+    """Stems of a stem_pattern found in normalized text, skipping FALSE_FRIENDS"""
+    return {match.group(1) for match in pattern.finditer(text) if not match.group(0).startswith(FALSE_FRIENDS)}
+
+
+POSITIVE_RE = stem_pattern(POSITIVE_STEMS)
+NEGATIVE_RE = stem_pattern(NEGATIVE_STEMS)
+
+
+def article_text(article: Dict) -> Tuple[str, str]:
+    """Normalized title and content snippet of an article"""
+    return normalize(article.get('title') or ''), normalize((article.get('content') or '')[:SNIPPET_CHARS])
+
+
+def content_hash(article: Dict) -> str:
+    """SHA-256 of an article's normalized title and content (key of news.article_relevance)"""
+    title = normalize(article.get('title') or '').strip()
+    content = normalize(article.get('content') or '').strip()
+    return hashlib.sha256(f"{title}\n{content}".encode('utf-8')).hexdigest()
+
+
+def keyword_score(article: Dict) -> float:
+    """
+    Banking-relevance score of an article
+
+    Each stem counts once per field; title matches weigh double.
+
+    Returns:
+        Sum of positive minus negative stem weights (0 without any match)
+    """
+    score = 0.0
+    for text, factor in zip(article_text(article), (2, 1)):
+        score += factor * sum(POSITIVE_STEMS[stem] for stem in matched_stems(POSITIVE_RE, text))
+        score -= factor * sum(NEGATIVE_STEMS[stem] for stem in matched_stems(NEGATIVE_RE, text))
+    return score
+
+
+class RelevanceModel:
+    """
+    TF-IDF features + logistic regression, in plain Python
+
+    Words are cut to their first STEM_LENGTH characters as a rough lemma;
+    title words are separate features. Trained with SGD on a few thousand
+    verdicts in well under a second.
+    """
+
+    STEM_LENGTH = 6
+
+    def __init__(self):
+        self.idf: Dict[str, float] = {}
+        self.weights: Dict[str, float] = {}
+        self.bias = 0.0
+
+    def terms(self, title: str, snippet: str) -> set:
+        """Title and body word stems of normalized text"""
+        return ({'t:' + word[:self.STEM_LENGTH] for word in WORD_RE.findall(title)} |
+                {word[:self.STEM_LENGTH] for word in WORD_RE.findall(snippet)})
+
+    def features(self, title: str, snippet: str) -> Dict[str, float]:
+        """L2-normalized TF-IDF vector (terms unknown to the model are dropped)"""
+        vector = {term: self.idf[term] for term in self.terms(title, snippet) if term in self.idf}
+        norm = math.sqrt(sum(value * value for value in vector.values())) or 1.0
+        return {term: value / norm for term, value in vector.items()}
+
+    def fit(self, examples: List[Tuple[str, str, bool]], epochs: int = 10, rate: float = 0.5, l2: float = 1e-4):
+        """
+        Train on (title, snippet, relevant) examples (normalized text)
+        """
+        documents = [self.terms(title, snippet) for title, snippet, _ in examples]
+        frequency: Dict[str, int] = {}
+        for terms in documents:
+            for term in terms:
+                frequency[term] = frequency.get(term, 0) + 1
+        count = len(documents)
+        self.idf = {term: math.log((1 + count) / (1 + df)) + 1 for term, df in frequency.items() if df >= 2}
+
+        vectors = [(self.features(title, snippet), 1.0 if relevant else 0.0)
+                   for title, snippet, relevant in examples]
+        self.weights, self.bias = {}, 0.0
+        order = list(range(len(vectors)))
+        shuffle = random.Random(0)
+        for _ in range(epochs):
+            shuffle.shuffle(order)
+            for i in order:
+                vector, label = vectors[i]
+                gradient = self._probability(vector) - label
+                self.bias -= rate * gradient
+                for term, value in vector.items():
+                    weight = self.weights.get(term, 0.0)
+                    self.weights[term] = weight - rate * (gradient * value + l2 * weight)
+
+    def _probability(self, vector: Dict[str, float]) -> float:
+        z = self.bias + sum(self.weights.get(term, 0.0) * value for term, value in vector.items())
+        return 1 / (1 + math.exp(-max(-30.0, min(30.0, z))))
+
+    def probability(self, title: str, snippet: str) -> float:
+        """Probability that an article is banking-relevant"""
+        return self._probability(self.features(title, snippet))
+
+
+class RelevancePrefilter:
+    """
+    Splits articles into relevant, irrelevant and ambiguous before the Gemini filter
+
+    Keyword score >= RELEVANCE_ACCEPT_SCORE: relevant; <= RELEVANCE_REJECT_SCORE
+    (only reached through negative stems such as sport or showbiz): irrelevant.
+    An article without any keyword is not clear-cut. In between, the model (if
+    trained) decides when it is at least RELEVANCE_MODEL_CONFIDENCE sure;
+    everything else is ambiguous.
+
+    Configuration (environment variables):
+    - RELEVANCE_PREFILTER: settle clear-cut articles locally (default: true)
+    - RELEVANCE_ACCEPT_SCORE: keyword score that is relevant without Gemini (default: 6)
+    - RELEVANCE_REJECT_SCORE: keyword score that is irrelevant without Gemini (default: -2)
+    - RELEVANCE_MODEL: train the TF-IDF/logistic regression model (default: true)
+    - RELEVANCE_MODEL_MIN_EXAMPLES: Gemini verdicts needed to train it (default: 300)
+    - RELEVANCE_MODEL_MAX_EXAMPLES: newest verdicts it is trained on (default: 5000)
+    - RELEVANCE_MODEL_CONFIDENCE: probability the model needs to decide (default: 0.9)
+    - RELEVANCE_MODEL_MIN_ACCURACY: held-out accuracy needed to use it (default: 0.85)
+    """
+
+    def __init__(self):
+        self.enabled = os.getenv('RELEVANCE_PREFILTER', 'true').lower() == 'true'
+        self.accept_score = float(os.getenv('RELEVANCE_ACCEPT_SCORE', '6'))
+        self.reject_score = float(os.getenv('RELEVANCE_REJECT_SCORE', '-2'))
+        self.model_enabled = os.getenv('RELEVANCE_MODEL', 'true').lower() == 'true'
+        self.min_examples = max(10, int(os.getenv('RELEVANCE_MODEL_MIN_EXAMPLES', '300')))
+        self.max_examples = max(self.min_examples, int(os.getenv('RELEVANCE_MODEL_MAX_EXAMPLES', '5000')))
+        self.confidence = float(os.getenv('RELEVANCE_MODEL_CONFIDENCE', '0.9'))
+        self.min_accuracy = float(os.getenv('RELEVANCE_MODEL_MIN_ACCURACY', '0.85'))
+        self.model: Optional[RelevanceModel] = None
+
+    def train(self, verdicts: List[Dict]) -> bool:
+        """
+        Train the model on stored Gemini verdicts
+
+        The newest fifth is held out first; the model is only used if it
+        reaches RELEVANCE_MODEL_MIN_ACCURACY there, then it is refit on all of them.
+
+        Args:
+            verdicts: news.article_relevance rows with title, snippet, relevant (newest first)
+
+        Returns:
+            Whether the model is in use
+        """
+        self.model = None
+        if not (self.enabled and self.model_enabled) or len(verdicts) < self.min_examples:
+            return False
+
+        examples = [(normalize(row['title'] or ''), normalize(row['snippet'] or ''), bool(row['relevant']))
+                    for row in verdicts]
+        if len({relevant for _, _, relevant in examples}) < 2:
+            return False
+
+        held_out = len(examples) // 5
+        model = RelevanceModel()
+        model.fit(examples[held_out:])
+        correct = sum((model.probability(title, snippet) >= 0.5) == relevant
+                      for title, snippet, relevant in examples[:held_out])
+        accuracy = correct / held_out
+        if accuracy < self.min_accuracy:
+            print(f"[INFO] Relevance model not used: held-out accuracy {accuracy:.0%} "
+                  f"< {self.min_accuracy:.0%} ({len(examples)} verdicts)")
+            return False
+
+        model.fit(examples)
+        self.model = model
+        print(f"[INFO] Relevance model trained on {len(examples)} Gemini verdicts "
+              f"(held-out accuracy {accuracy:.0%})")
+        return True
+
+    def classify(self, article: Dict) -> Optional[bool]:
+        """
+        Local verdict for one article
+
+        Returns:
+            True (relevant), False (irrelevant) or None (ask Gemini)
+        """
+        score = keyword_score(article)
+        if score >= self.accept_score:
+            return True
+        if score <= self.reject_score:
+            return False
+
+        if self.model:
+            probability = self.model.probability(*article_text(article))
+            if probability >= self.confidence:
+                return True
+            if probability <= 1 - self.confidence:
+                return False
+        return None
+
+    def split(self, articles: List[Dict]) -> Tuple[List[Dict], List[Dict], List[Dict]]:
+        """
+        Settle what can be settled locally
+
+        Returns:
+            (relevant, irrelevant, ambiguous), each in input order; with
+            RELEVANCE_PREFILTER off every article is ambiguous
+        """
+        if not self.enabled:
+            return [], [], list(articles)
+
+        relevant, irrelevant, ambiguous = [], [], []
+        for article in articles:
+            verdict = self.classify(article)
+            (ambiguous if verdict is None else relevant if verdict else irrelevant).append(article)
+
+        run_metrics.count(GEMINI_GROUP, 'prefilter.relevant', len(relevant))
+        run_metrics.count(GEMINI_GROUP, 'prefilter.irrelevant', len(irrelevant))
+        run_metrics.count(GEMINI_GROUP, 'prefilter.ambiguous', len(ambiguous))
+        return relevant, irrelevant, ambiguous
+
+
+def verdict_rows(articles: List[Dict], relevant: List[Dict], prompt_version: str) -> List[Dict]:
+    """
+    Parameters for db.UPSERT_RELEVANCE_SQL from one Gemini filter call
+
+    Args:
+        articles: Articles the call judged
+        relevant: The ones it picked
+        prompt_version: Version of the filter prompt (summarizer.FILTER_PROMPT_VERSION)
+    """
+    picked = {id(article) for article in relevant}
+    return [{
+        'content_hash': content_hash(article),
+        'prompt_version': prompt_version,
+        'relevant': id(article) in picked,
+        'url': article.get('url'),
+        'title': article.get('title'),
+        'snippet': (article.get('content') or '')[:SNIPPET_CHARS]
+    } for article in articles]
@@ -0,0 +1,151 @@
+"""
+Retry policy and per-host circuit breaker for page fetches
+Transient failures (5xx, 429, timeouts, dropped connections) are retried with
+jittered exponential backoff, honouring Retry-After; a host that keeps failing
+is skipped for a cooldown instead of costing a full timeout per article
+"""
+
+import os
+import time
+import random
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+# Statuses worth retrying: rate limiting and temporary server trouble
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+class RetryableFetchError(Exception):
+    """A fetch failed in a way that may succeed on a later attempt"""
+
+    def __init__(self, message: str, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class CircuitOpenError(Exception):
+    """A request was refused because the host's circuit breaker is open"""
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Seconds to wait from a Retry-After header
+
+    Args:
+        value: Header value - delay in seconds or an HTTP date
+
+    Returns:
+        Seconds (>= 0), or None if the header is missing or invalid
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class RetryPolicy:
+    """
+    How often and how long to wait before retrying a failed fetch
+
+    Configuration (environment variables):
+    - HTTP_RETRY_ATTEMPTS: total attempts per page, including the first (default: 3)
+    - HTTP_RETRY_BASE_DELAY: backoff base in seconds (default: 0.5)
+    - HTTP_RETRY_MAX_DELAY: backoff cap in seconds (default: 10)
+    - HTTP_RETRY_AFTER_MAX: longest Retry-After to wait for, in seconds (default: 60)
+    """
+
+    def __init__(self):
+        self.attempts = max(1, int(os.getenv('HTTP_RETRY_ATTEMPTS', '3')))
+        self.base_delay = float(os.getenv('HTTP_RETRY_BASE_DELAY', '0.5'))
+        self.max_delay = float(os.getenv('HTTP_RETRY_MAX_DELAY', '10'))
+        self.retry_after_max = float(os.getenv('HTTP_RETRY_AFTER_MAX', '60'))
+
+    def delay(self, attempt: int, retry_after: Optional[float] = None) -> Optional[float]:
+        """
+        Wait before the next attempt
+
+        Args:
+            attempt: Number of the attempt that just failed (1-based)
+            retry_after: Server-requested delay from Retry-After, if any
+
+        Returns:
+            Seconds to sleep, or None if the server asked for longer than
+            HTTP_RETRY_AFTER_MAX (not worth holding the run for)
+        """
+        if retry_after is not None:
+            if retry_after > self.retry_after_max:
+                return None
+            return retry_after + random.uniform(0, self.base_delay)
+        # Full jitter: spreads retries from many articles of the same host
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+
+
+class CircuitBreaker:
+    """
+    Stops requests to a host after consecutive failures
+
+    closed:    requests flow; failures are counted
+    open:      after HTTP_BREAKER_THRESHOLD consecutive failures every request is
+               refused for HTTP_BREAKER_COOLDOWN seconds
+    half-open: after the cooldown one trial request is let through; success
+               closes the circuit, failure opens it again
+
+    Configuration (environment variables):
+    - HTTP_BREAKER_THRESHOLD: consecutive failures before opening (default: 5)
+    - HTTP_BREAKER_COOLDOWN: seconds to wait before a trial request (default: 60)
+    """
+
+    def __init__(self, host: str):
+        self.host = host
+        self.threshold = max(1, int(os.getenv('HTTP_BREAKER_THRESHOLD', '5')))
+        self.cooldown = float(os.getenv('HTTP_BREAKER_COOLDOWN', '60'))
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self.trial_started_at: Optional[float] = None
+        self.times_opened = 0
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return 'closed'
+        if time.monotonic() - self.opened_at < self.cooldown:
+            return 'open'
+        return 'half-open'
+
+    def allow_request(self) -> bool:
+        """Whether a request to the host may be sent now"""
+        state = self.state
+        if state == 'closed':
+            return True
+        now = time.monotonic()
+        # A trial that never reported back (e.g. cancelled) expires after a cooldown
+        if state == 'half-open' and (self.trial_started_at is None
+                                     or now - self.trial_started_at >= self.cooldown):
+            self.trial_started_at = now
+            return True
+        return False
+
+    def record_success(self):
+        """The host answered (any non-retryable response counts)"""
+        if self.opened_at is not None:
+            print(f"[INFO] {self.host} is responding again - circuit closed")
+        self.failures = 0
+        self.opened_at = None
+        self.trial_started_at = None
+
+    def record_failure(self):
+        """A retryable failure (timeout, connection error, 5xx, 429)"""
+        self.failures += 1
+        was_trial = self.trial_started_at is not None
+        self.trial_started_at = None
+
+        if was_trial or (self.opened_at is None and self.failures >= self.threshold):
+            self.opened_at = time.monotonic()
+            self.times_opened += 1
+            print(f"[WARNING] {self.host} failed {self.failures} times in a row - "
+                  f"pausing requests for {self.cooldown:.0f}s")
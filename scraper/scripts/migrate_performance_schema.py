@@ -0,0 +1,134 @@
+"""
+Migrate database schema for the scraper performance work
+Safe to run repeatedly: every step is idempotent
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from db import Database
+
+db = Database()
+db.connect()
+
+print("Migrating database schema (performance metrics)...")
+print("=" * 80)
+
+# Per-run latency percentiles stored with each session
+print("\n1. Adding performance_metrics column to scraping_summaries...")
+db.cursor.execute("""
+    ALTER TABLE news.scraping_summaries
+    ADD COLUMN IF NOT EXISTS performance_metrics JSONB
+""")
+db.conn.commit()
+print("[SUCCESS] Column added")
+
+# Per-source metrics of every run
+print("\n2. Creating scraping_metrics table...")
+db.cursor.execute("""
+    CREATE TABLE IF NOT EXISTS news.scraping_metrics (
+        id SERIAL PRIMARY KEY,
+        run_started_at TIMESTAMP NOT NULL,
+        run_duration_seconds NUMERIC(10, 2),
+        run_success BOOLEAN NOT NULL DEFAULT FALSE,
+        scraping_session_id INTEGER REFERENCES news.scraping_summaries(id) ON DELETE SET NULL,
+        source VARCHAR(100) NOT NULL,
+        requests INTEGER NOT NULL DEFAULT 0,
+        bytes BIGINT NOT NULL DEFAULT 0,
+        errors INTEGER NOT NULL DEFAULT 0,
+        error_classes JSONB,
+        articles_found INTEGER,
+        articles_saved INTEGER,
+        latency_p50_ms NUMERIC(10, 1),
+        latency_p95_ms NUMERIC(10, 1),
+        latency_p99_ms NUMERIC(10, 1),
+        time_spent_ms NUMERIC(12, 1),
+        parse_cpu_seconds NUMERIC(10, 3),
+        tokens_input INTEGER NOT NULL DEFAULT 0,
+        tokens_output INTEGER NOT NULL DEFAULT 0,
+        details JSONB,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )
+""")
+db.cursor.execute("""
+    CREATE INDEX IF NOT EXISTS idx_scraping_metrics_run
+    ON news.scraping_metrics(run_started_at DESC)
+""")
+db.cursor.execute("""
+    CREATE INDEX IF NOT EXISTS idx_scraping_metrics_source
+    ON news.scraping_metrics(source, run_started_at DESC)
+""")
+db.conn.commit()
+print("[SUCCESS] Table created")
+
+# Incremental crawl state per source
+print("\n3. Creating source_state table...")
+db.cursor.execute("""
+    CREATE TABLE IF NOT EXISTS news.source_state (
+        source VARCHAR(100) PRIMARY KEY,
+        last_url TEXT,
+        last_published_date TIMESTAMP,
+        listing_url TEXT,
+        listing_etag TEXT,
+        listing_last_modified TEXT,
+        last_attempt_at TIMESTAMP WITH TIME ZONE,
+        last_success_at TIMESTAMP WITH TIME ZONE,
+        consecutive_failures INTEGER NOT NULL DEFAULT 0,
+        last_error TEXT,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )
+""")
+db.cursor.execute("DROP TRIGGER IF EXISTS update_source_state_updated_at ON news.source_state")
+db.cursor.execute("""
+    CREATE TRIGGER update_source_state_updated_at
+        BEFORE UPDATE ON news.source_state
+        FOR EACH ROW
+        EXECUTE FUNCTION news.update_updated_at_column()
+""")
+db.conn.commit()
+print("[SUCCESS] Table created")
+
+# Near-duplicate signature index
+print("\n4. Creating article_signatures table...")
+db.cursor.execute("""
+    CREATE TABLE IF NOT EXISTS news.article_signatures (
+        url TEXT PRIMARY KEY,
+        source VARCHAR(100) NOT NULL,
+        simhash BIGINT NOT NULL,
+        duplicate_of TEXT,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )
+""")
+db.cursor.execute("""
+    CREATE INDEX IF NOT EXISTS idx_article_signatures_created
+    ON news.article_signatures(created_at DESC)
+""")
+db.conn.commit()
+print("[SUCCESS] Table created")
+
+# Gemini relevance verdicts (training labels of the local pre-filter)
+print("\n5. Creating article_relevance table...")
+db.cursor.execute("""
+    CREATE TABLE IF NOT EXISTS news.article_relevance (
+        content_hash CHAR(64) NOT NULL,
+        prompt_version VARCHAR(20) NOT NULL,
+        relevant BOOLEAN NOT NULL,
+        url TEXT,
+        title TEXT,
+        snippet TEXT,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        PRIMARY KEY (content_hash, prompt_version)
+    )
+""")
+db.cursor.execute("""
+    CREATE INDEX IF NOT EXISTS idx_article_relevance_created
+    ON news.article_relevance(prompt_version, created_at DESC)
+""")
+db.conn.commit()
+print("[SUCCESS] Table created")
+
+print("\n" + "=" * 80)
+print("Migration completed successfully!")
+db.close()
@@ -13,10 +13,15 @@ CREATE TABLE IF NOT EXISTS news.scraping_summaries (
     sources_count INTEGER NOT NULL,
     new_articles_count INTEGER NOT NULL,
     scraping_duration_seconds NUMERIC(10, 2),
+    performance_metrics JSONB,
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
 
+-- Added after the first release; a no-op on fresh databases
+ALTER TABLE news.scraping_summaries ADD COLUMN IF NOT EXISTS performance_metrics JSONB;
+COMMENT ON COLUMN news.scraping_summaries.performance_metrics IS 'Per-source fetch/parse latency percentiles and DB/Gemini timings for the run';
+
 -- Create index for scraping_summaries
 CREATE INDEX IF NOT EXISTS idx_scraping_summaries_date ON news.scraping_summaries(scraping_date DESC);
 
@@ -69,3 +74,101 @@ CREATE TRIGGER update_articles_updated_at
     BEFORE UPDATE ON news.articles
     FOR EACH ROW
     EXECUTE FUNCTION news.update_updated_at_column();
+
+-- Per-run performance metrics
+-- One row per source per run, plus 'database' and 'gemini' rows; written at the end of every run
+CREATE TABLE IF NOT EXISTS news.scraping_metrics (
+    id SERIAL PRIMARY KEY,
+    run_started_at TIMESTAMP NOT NULL,
+    run_duration_seconds NUMERIC(10, 2),
+    run_success BOOLEAN NOT NULL DEFAULT FALSE,
+    scraping_session_id INTEGER REFERENCES news.scraping_summaries(id) ON DELETE SET NULL,
+    source VARCHAR(100) NOT NULL,
+    requests INTEGER NOT NULL DEFAULT 0,
+    bytes BIGINT NOT NULL DEFAULT 0,
+    errors INTEGER NOT NULL DEFAULT 0,
+    error_classes JSONB,
+    articles_found INTEGER,
+    articles_saved INTEGER,
+    latency_p50_ms NUMERIC(10, 1),
+    latency_p95_ms NUMERIC(10, 1),
+    latency_p99_ms NUMERIC(10, 1),
+    time_spent_ms NUMERIC(12, 1),
+    parse_cpu_seconds NUMERIC(10, 3),
+    tokens_input INTEGER NOT NULL DEFAULT 0,
+    tokens_output INTEGER NOT NULL DEFAULT 0,
+    details JSONB,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS idx_scraping_metrics_run ON news.scraping_metrics(run_started_at DESC);
+CREATE INDEX IF NOT EXISTS idx_scraping_metrics_source ON news.scraping_metrics(source, run_started_at DESC);
+
+COMMENT ON TABLE news.scraping_metrics IS 'Per-source fetch, parse, Gemini and DB performance for each scraping run';
+COMMENT ON COLUMN news.scraping_metrics.requests IS 'HTTP requests for sources, API calls for gemini, timed queries for database';
+COMMENT ON COLUMN news.scraping_metrics.latency_p50_ms IS 'Time to first byte for sources, call time for gemini, session save time for database';
+COMMENT ON COLUMN news.scraping_metrics.time_spent_ms IS 'Total fetch time for sources, call time for gemini, write time for database';
+COMMENT ON COLUMN news.scraping_metrics.details IS 'All histograms (p50/p95/p99) and counters for the group';
+
+-- Per-source crawl state
+-- One row per source, updated at the end of every run (see scraper/source_state.py)
+CREATE TABLE IF NOT EXISTS news.source_state (
+    source VARCHAR(100) PRIMARY KEY,
+    last_url TEXT,
+    last_published_date TIMESTAMP,
+    listing_url TEXT,
+    listing_etag TEXT,
+    listing_last_modified TEXT,
+    last_attempt_at TIMESTAMP WITH TIME ZONE,
+    last_success_at TIMESTAMP WITH TIME ZONE,
+    consecutive_failures INTEGER NOT NULL DEFAULT 0,
+    last_error TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+DROP TRIGGER IF EXISTS update_source_state_updated_at ON news.source_state;
+CREATE TRIGGER update_source_state_updated_at
+    BEFORE UPDATE ON news.source_state
+    FOR EACH ROW
+    EXECUTE FUNCTION news.update_updated_at_column();
+
+COMMENT ON TABLE news.source_state IS 'Incremental crawl state and health of each news source';
+COMMENT ON COLUMN news.source_state.last_url IS 'Newest article URL on the first listing page of the last stored run';
+COMMENT ON COLUMN news.source_state.last_published_date IS 'High-water mark: newest publish time of a stored article';
+COMMENT ON COLUMN news.source_state.listing_etag IS 'ETag of listing_url, sent as If-None-Match on the next run';
+COMMENT ON COLUMN news.source_state.consecutive_failures IS 'Runs in a row without a successful listing crawl; pauses the source';
+
+-- Near-duplicate signature index (see scraper/near_dup.py)
+CREATE TABLE IF NOT EXISTS news.article_signatures (
+    url TEXT PRIMARY KEY,
+    source VARCHAR(100) NOT NULL,
+    simhash BIGINT NOT NULL,
+    duplicate_of TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS idx_article_signatures_created ON news.article_signatures(created_at DESC);
+
+COMMENT ON TABLE news.article_signatures IS 'SimHash of every new article, for matching the same story across sources and runs';
+COMMENT ON COLUMN news.article_signatures.simhash IS '64-bit SimHash of title and content word shingles (stored signed)';
+COMMENT ON COLUMN news.article_signatures.duplicate_of IS 'URL of the stored article of the same story; NULL for stored articles. Duplicates are not in news.articles';
+
+-- Gemini relevance verdicts, training labels of the local pre-filter (see scraper/relevance.py)
+CREATE TABLE IF NOT EXISTS news.article_relevance (
+    content_hash CHAR(64) NOT NULL,
+    prompt_version VARCHAR(20) NOT NULL,
+    relevant BOOLEAN NOT NULL,
+    url TEXT,
+    title TEXT,
+    snippet TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (content_hash, prompt_version)
+);
+
+CREATE INDEX IF NOT EXISTS idx_article_relevance_created ON news.article_relevance(prompt_version, created_at DESC);
+
+COMMENT ON TABLE news.article_relevance IS 'Banking-relevance verdicts of the Gemini filter: cache (each article content is judged once per prompt version) and training labels of the local pre-filter model';
+COMMENT ON COLUMN news.article_relevance.content_hash IS 'SHA-256 of the normalized title and content';
+COMMENT ON COLUMN news.article_relevance.prompt_version IS 'Version of the filter prompt that gave the verdict';
+COMMENT ON COLUMN news.article_relevance.snippet IS 'Start of the content (model input together with the title)';
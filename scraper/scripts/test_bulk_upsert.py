@@ -0,0 +1,114 @@
+"""
+Test that bulk upserts store the same published_date for naive and +04:00 dates
+Writes a few test articles (URLs under https://test.invalid/) and removes them again
+"""
+
+import sys
+import os
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from db import Database
+from async_db import AsyncDatabase
+
+BAKU = timezone(timedelta(hours=4))
+
+# (published_date as a scraper gives it, naive Baku time expected in the table)
+naive = (datetime(2025, 11, 12, 11, 34), datetime(2025, 11, 12, 11, 34))
+aware = (datetime(2025, 11, 12, 11, 34, 35, tzinfo=BAKU), datetime(2025, 11, 12, 11, 34, 35))
+
+# Mixed batches in both orders: psycopg 3 types the date array from its elements
+batches = {
+    'naive first': [naive, aware],
+    'aware first': [aware, naive],
+    'aware only': [aware],
+}
+
+
+def test_articles(name, batch):
+    return [
+        {
+            'title': f'Test article {i}',
+            'content': 'Bulk upsert date test',
+            'source': 'Test',
+            'url': f"https://test.invalid/{name.replace(' ', '-')}/{i}",
+            'published_date': published,
+        }
+        for i, (published, _) in enumerate(batch)
+    ]
+
+
+def check(label, stored, batch):
+    failures = 0
+    for (_, expected), value in zip(batch, stored):
+        status = "OK" if value == expected else "FAIL"
+        failures += value != expected
+        print(f"[{status}] {label}: stored {value} (expected {expected})")
+    return failures
+
+
+async def test_async(urls_by_batch):
+    db = AsyncDatabase()
+    if not await db.connect():
+        return 1
+
+    failures = 0
+    try:
+        for name, batch in batches.items():
+            articles = test_articles(f'async {name}', batch)
+            urls_by_batch.extend(a['url'] for a in articles)
+            if len(await db.upsert_articles(articles)) != len(articles):
+                print(f"[FAIL] async {name}: upsert failed")
+                failures += 1
+                continue
+            async with db.pool.connection() as conn:
+                cursor = await conn.execute(
+                    "SELECT url, published_date FROM news.articles WHERE url = ANY(%s)",
+                    ([a['url'] for a in articles],)
+                )
+                by_url = {row['url']: row['published_date'] for row in await cursor.fetchall()}
+            failures += check(f'async {name}', [by_url.get(a['url']) for a in articles], batch)
+    finally:
+        await db.close()
+    return failures
+
+
+def test_sync(urls_by_batch):
+    db = Database()
+    if not db.connect():
+        return 1
+
+    failures = 0
+    for name, batch in batches.items():
+        articles = test_articles(f'sync {name}', batch)
+        urls_by_batch.extend(a['url'] for a in articles)
+        if len(db.upsert_articles(articles)) != len(articles):
+            print(f"[FAIL] sync {name}: upsert failed")
+            failures += 1
+            continue
+        db.cursor.execute(
+            "SELECT url, published_date FROM news.articles WHERE url = ANY(%s)",
+            ([a['url'] for a in articles],)
+        )
+        by_url = {row['url']: row['published_date'] for row in db.cursor.fetchall()}
+        failures += check(f'sync {name}', [by_url.get(a['url']) for a in articles], batch)
+
+    db.cursor.execute("DELETE FROM news.articles WHERE url = ANY(%s)", (urls_by_batch,))
+    db.conn.commit()
+    db.close()
+    return failures
+
+
+print("Testing bulk upsert of naive and +04:00 publish dates...")
+print("=" * 60)
+
+urls = []
+failures = asyncio.run(test_async(urls))
+failures += test_sync(urls)
+
+print("\n" + "=" * 60)
+print("TEST PASSED" if not failures else f"TEST FAILED ({failures} article(s))")
+print("=" * 60)
+sys.exit(1 if failures else 0)
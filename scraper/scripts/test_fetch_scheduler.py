@@ -0,0 +1,81 @@
+"""
+Test that a half-open circuit breaker lets only one queued request through
+No network: requests queue on a host limiter's token bucket while the breaker
+opens and its cooldown passes
+"""
+
+import sys
+import os
+import time
+import asyncio
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fetch_scheduler import HostLimiter
+from retry_policy import CircuitOpenError
+
+WAITERS = 5
+
+
+def new_limiter() -> HostLimiter:
+    # Five slots but one request per second: all but the first wait for a token
+    return HostLimiter('test.invalid', initial_concurrency=WAITERS, max_concurrency=WAITERS,
+                       initial_rate=1, max_rate=1, latency_target=2, adaptive=False)
+
+
+def make_half_open(limiter: HostLimiter):
+    """Open the breaker as if its cooldown had just passed"""
+    for _ in range(limiter.breaker.threshold):
+        limiter.breaker.record_failure()
+    limiter.breaker.opened_at = time.monotonic() - limiter.breaker.cooldown
+
+
+async def send(limiter: HostLimiter) -> str:
+    try:
+        await limiter.acquire()
+    except CircuitOpenError:
+        return 'refused'
+    await limiter.release()
+    return 'sent'
+
+
+async def queued_before_opening():
+    """Requests queued while closed; the breaker goes half-open before they get a token"""
+    limiter = new_limiter()
+    tasks = [asyncio.create_task(send(limiter)) for _ in range(WAITERS)]
+    await asyncio.sleep(0.1)
+    make_half_open(limiter)
+    return await asyncio.gather(*tasks)
+
+
+async def trial_arrives_half_open():
+    """The trial request arrives half-open behind requests queued while closed"""
+    limiter = new_limiter()
+    tasks = [asyncio.create_task(send(limiter)) for _ in range(WAITERS - 1)]
+    await asyncio.sleep(0.1)
+    make_half_open(limiter)
+    assert limiter.breaker.allow_request()
+    tasks.append(asyncio.create_task(send(limiter)))
+    return await asyncio.gather(*tasks)
+
+
+# (scenario, expected results)
+scenarios = [
+    (queued_before_opening, ['sent', 'sent', 'refused', 'refused', 'refused']),
+    (trial_arrives_half_open, ['sent', 'refused', 'refused', 'refused', 'sent']),
+]
+
+print("Testing half-open circuit breaker with queued requests...")
+print("=" * 60)
+
+failures = 0
+for scenario, expected in scenarios:
+    results = asyncio.run(scenario())
+    status = "OK" if results == expected else "FAIL"
+    failures += results != expected
+    print(f"[{status}] {scenario.__name__}: {results} (expected {expected})")
+
+print("\n" + "=" * 60)
+print("TEST PASSED" if not failures else f"TEST FAILED ({failures} scenario(s))")
+print("=" * 60)
+sys.exit(1 if failures else 0)
@@ -0,0 +1,39 @@
+"""
+Test the local relevance pre-filter's keyword verdicts
+"""
+
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from relevance import RelevancePrefilter, keyword_score
+
+# (title, content, expected verdict: True relevant, False irrelevant, None ask Gemini)
+test_articles = [
+    ("Mərkəzi Bank uçot dərəcəsini 7 faizdə saxladı", "İnflyasiya proqnozu açıqlanıb.", True),
+    ("İpoteka kreditlərinin həcmi artıb", "", True),
+    ("Avropa İttifaqı sammiti Brüsseldə keçirilib", "", None),
+    ("Avronun məzənnəsi ucuzlaşıb", "", True),
+    ("Ordubadda yeni məktəb açılıb", "", None),
+    ("Prezident nümayəndə heyətini qəbul edib", "Görüşdə əməkdaşlıq müzakirə olunub.", None),
+    ("Qarabağ çempionatda qalib gəlib", "Futbol üzrə Premyer Liqanın növbəti turu.", False),
+]
+
+prefilter = RelevancePrefilter()
+
+print("Testing relevance pre-filter...")
+print("=" * 60)
+
+failures = 0
+for title, content, expected in test_articles:
+    article = {'title': title, 'content': content}
+    verdict = prefilter.classify(article)
+    status = "OK" if verdict == expected else "FAIL"
+    failures += verdict != expected
+    print(f"[{status}] {title}: score {keyword_score(article):g}, verdict {verdict} (expected {expected})")
+
+print("\n" + "=" * 60)
+print("TEST PASSED" if not failures else f"TEST FAILED ({failures} article(s))")
+print("=" * 60)
+sys.exit(1 if failures else 0)
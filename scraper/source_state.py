@@ -0,0 +1,156 @@
+"""
+Per-source crawl state (news.source_state)
+What earlier runs learned about each source - its newest article, the
+validators of its first listing page, the last successful crawl and the
+number of failed runs in a row - so the next run fetches only what changed
+and leaves a source that keeps failing alone for a while
+"""
+
+import os
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Optional
+
+# Publish dates further in the future than this are mis-parsed and never become the high-water mark
+FUTURE_DATE_TOLERANCE = timedelta(days=1)
+
+
+class SourceBackoff:
+    """
+    Decides whether a failing source is skipped this run
+
+    After SOURCE_FAILURE_THRESHOLD failed runs in a row the source is paused;
+    the pause starts at SOURCE_BACKOFF_MINUTES after the last attempt and
+    doubles with every further failure, up to SOURCE_BACKOFF_MAX_MINUTES. Once
+    it is over, one run tries the source again.
+
+    Configuration (environment variables):
+    - SOURCE_FAILURE_THRESHOLD: failed runs in a row before pausing (default: 3)
+    - SOURCE_BACKOFF_MINUTES: first pause in minutes (default: 30)
+    - SOURCE_BACKOFF_MAX_MINUTES: longest pause in minutes (default: 720)
+    """
+
+    def __init__(self):
+        self.threshold = max(1, int(os.getenv('SOURCE_FAILURE_THRESHOLD', '3')))
+        self.base_minutes = float(os.getenv('SOURCE_BACKOFF_MINUTES', '30'))
+        self.max_minutes = float(os.getenv('SOURCE_BACKOFF_MAX_MINUTES', '720'))
+
+    def pause(self, failures: int) -> timedelta:
+        """Length of the pause after `failures` failed runs in a row"""
+        if failures < self.threshold:
+            return timedelta(0)
+        minutes = self.base_minutes * 2 ** (failures - self.threshold)
+        return timedelta(minutes=min(self.max_minutes, minutes))
+
+    def skip_reason(self, state: Optional[Dict], now: Optional[datetime] = None) -> Optional[str]:
+        """
+        Why the source should not be crawled now
+
+        Args:
+            state: Stored state of the source (a news.source_state row), if any
+            now: Current time (timezone-aware, default: now)
+
+        Returns:
+            Human-readable reason, or None if the source should be crawled
+        """
+        if not state or not state.get('last_attempt_at'):
+            return None
+
+        failures = state.get('consecutive_failures') or 0
+        resume_at = state['last_attempt_at'] + self.pause(failures)
+        now = now or datetime.now(timezone.utc)
+        if failures < self.threshold or now >= resume_at:
+            return None
+
+        return (f"failed {failures} runs in a row, paused until "
+                f"{resume_at.astimezone(timezone.utc):%Y-%m-%d %H:%M} UTC")
+
+
+def newest_published(current: Optional[datetime], published: Optional[datetime]) -> Optional[datetime]:
+    """
+    Advance a high-water mark with an article's publish time
+
+    Dates are compared as naive local times (as stored in news.articles);
+    dates more than FUTURE_DATE_TOLERANCE ahead are ignored.
+
+    Args:
+        current: High-water mark so far
+        published: Publish time of a scraped article
+
+    Returns:
+        The later of the two
+    """
+    if not isinstance(published, datetime):
+        return current
+    published = published.replace(tzinfo=None)
+    if published > datetime.now() + FUTURE_DATE_TOLERANCE:
+        return current
+    if current is None or published > current:
+        return published
+    return current
+
+
+def state_row(crawl_state: Dict, attempted_at: Optional[datetime], include_progress: bool) -> Dict:
+    """
+    Parameters for db.UPSERT_SOURCE_STATE_SQL from a scraper's crawl state
+
+    Progress (newest article, listing validators) may only move forward once
+    the run's articles are stored - otherwise the next run would stop before
+    reaching them. Without include_progress only the success/failure
+    bookkeeping is updated.
+
+    Args:
+        crawl_state: BaseScraper.crawl_state after a crawl (or a state from merge_state)
+        attempted_at: Start time of the run (timezone-aware); None writes only
+            the progress, for an attempt that was recorded earlier
+        include_progress: Whether the run's articles are stored (or there were none)
+
+    Returns:
+        Dictionary of named query parameters
+    """
+    succeeded = crawl_state.get('succeeded', True)
+    progress = crawl_state if include_progress and succeeded else {}
+    return {
+        'source': crawl_state['source'],
+        'last_url': progress.get('last_url'),
+        'last_published_date': progress.get('last_published_date'),
+        'listing_url': progress.get('listing_url'),
+        'listing_etag': progress.get('listing_etag'),
+        'listing_last_modified': progress.get('listing_last_modified'),
+        'attempted_at': attempted_at,
+        'succeeded_at': attempted_at if succeeded else None,
+        'error': crawl_state.get('error')
+    }
+
+
+def merge_state(state: Optional[Dict], crawl_state: Dict, attempted_at: datetime) -> Dict:
+    """
+    Apply a crawl to an in-memory news.source_state row, as UPSERT_SOURCE_STATE_SQL would
+
+    Used by the daemon, which crawls a source many times between two saves of
+    its articles: the next crawl starts from what the previous one learned.
+
+    Args:
+        state: Current row (None for a source without state)
+        crawl_state: BaseScraper.crawl_state after a crawl
+        attempted_at: Start time of the crawl (timezone-aware)
+
+    Returns:
+        Updated row
+    """
+    merged = dict(state or {'source': crawl_state['source'], 'consecutive_failures': 0})
+    merged['last_attempt_at'] = attempted_at
+    merged['last_error'] = crawl_state.get('error')
+    if not crawl_state['succeeded']:
+        merged['consecutive_failures'] = (merged.get('consecutive_failures') or 0) + 1
+        return merged
+
+    merged['consecutive_failures'] = 0
+    merged['last_success_at'] = attempted_at
+    merged['last_url'] = crawl_state.get('last_url') or merged.get('last_url')
+    merged['last_published_date'] = newest_published(merged.get('last_published_date'),
+                                                     crawl_state.get('last_published_date'))
+    if crawl_state.get('listing_url'):
+        merged['listing_url'] = crawl_state['listing_url']
+        merged['listing_etag'] = crawl_state.get('listing_etag')
+        merged['listing_last_modified'] = crawl_state.get('listing_last_modified')
+    return merged
@@ -18,7 +18,7 @@ if sys.platform == 'win32' and hasattr(sys.stdout, 'buffer'):
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from base_scraper import BaseScraper
+from base_scraper import BaseScraper, class_strainer
 from datetime import datetime
 from typing import List, Dict, Optional
 import re
@@ -32,6 +32,8 @@ class ApaAzScraper(BaseScraper):
             source_name="APA.az",
             base_url="https://apa.az"
         )
+        # Article pages: parse only title, date and body containers
+        self.article_parse_only = class_strainer('title_news', 'date', 'texts')
         self.category_url = "https://apa.az/economy"
         # Month mapping for Azerbaijani to numbers
         self.months = {
@@ -131,19 +133,18 @@ class ApaAzScraper(BaseScraper):
 
         return None
 
-    async def scrape_article(self, url: str) -> Optional[Dict]:
+    def parse_article(self, html: bytes, url: str) -> Optional[Dict]:
         """
-        Scrape a single article from apa.az asynchronously
+        Parse a single article page from apa.az
 
         Args:
+            html: Raw article page
             url: Article URL
 
         Returns:
             Dictionary with article data
         """
-        soup = await self.fetch_page(url)
-        if not soup:
-            return None
+        soup = self.parse_html(html, parse_only=self.article_parse_only)
 
         try:
             # Extract title
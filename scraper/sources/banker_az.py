@@ -66,19 +66,18 @@ class BankerAzScraper(BaseScraper):
 
         return article_urls
 
-    async def scrape_article(self, url: str) -> Optional[Dict]:
+    def parse_article(self, html: bytes, url: str) -> Optional[Dict]:
         """
-        Scrape a single article from banker.az
+        Parse a single article page from banker.az
 
         Args:
+            html: Raw article page
             url: Article URL
 
         Returns:
             Dictionary with article data
         """
-        soup = await self.fetch_page(url)
-        if not soup:
-            return None
+        soup = self.parse_html(html, parse_only=self.article_parse_only)
 
         try:
             # Extract title - try multiple selectors
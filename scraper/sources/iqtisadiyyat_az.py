@@ -18,7 +18,7 @@ if sys.platform == 'win32' and hasattr(sys.stdout, 'buffer'):
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from base_scraper import BaseScraper
+from base_scraper import BaseScraper, class_strainer
 from datetime import datetime
 from typing import List, Dict, Optional
 import re
@@ -32,6 +32,8 @@ class IqtisadiyyatAzScraper(BaseScraper):
             source_name="Iqtisadiyyat.az",
             base_url="https://iqtisadiyyat.az"
         )
+        # Article pages: parse only title, date and body containers
+        self.article_parse_only = class_strainer('post-title', 'date-badge', 'post-content')
         self.categories = [
             "az/category/bank-35",      # Banking
             "az/category/biznes-9",     # Business
@@ -131,19 +133,18 @@ class IqtisadiyyatAzScraper(BaseScraper):
             print(f"[WARNING] Could not parse date: {date_str}, error: {e}")
             return None
 
-    async def scrape_article(self, url: str) -> Optional[Dict]:
+    def parse_article(self, html: bytes, url: str) -> Optional[Dict]:
         """
-        Scrape a single article from iqtisadiyyat.az
+        Parse a single article page from iqtisadiyyat.az
 
         Args:
+            html: Raw article page
             url: Article URL
 
         Returns:
             Dictionary with article data
         """
-        soup = await self.fetch_page(url)
-        if not soup:
-            return None
+        soup = self.parse_html(html, parse_only=self.article_parse_only)
 
         try:
             # Extract title from <h1 class="medium-header-h1 post-title">
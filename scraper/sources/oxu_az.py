@@ -18,7 +18,7 @@ if sys.platform == 'win32' and hasattr(sys.stdout, 'buffer'):
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from base_scraper import BaseScraper
+from base_scraper import BaseScraper, class_strainer
 from datetime import datetime
 from typing import List, Dict, Optional
 import re
@@ -32,6 +32,8 @@ class OxuAzScraper(BaseScraper):
             source_name="Oxu.az",
             base_url="https://oxu.az"
         )
+        # Article pages: parse only title, date and body containers
+        self.article_parse_only = class_strainer('post-detail-title', 'post-detail-meta', 'post-detail-content-inner', 'post-detail-content')
         self.category_url = "https://oxu.az/iqtisadiyyat"
         # Update headers to avoid being blocked - use more realistic browser headers
         self.headers = {
@@ -181,19 +183,18 @@ class OxuAzScraper(BaseScraper):
 
         return None
 
-    async def scrape_article(self, url: str) -> Optional[Dict]:
+    def parse_article(self, html: bytes, url: str) -> Optional[Dict]:
         """
-        Scrape a single article from oxu.az asynchronously
+        Parse a single article page from oxu.az
 
         Args:
+            html: Raw article page
             url: Article URL
 
         Returns:
             Dictionary with article data
         """
-        soup = await self.fetch_page(url)
-        if not soup:
-            return None
+        soup = self.parse_html(html, parse_only=self.article_parse_only)
 
         try:
             # Extract title from h1 in .post-detail-title
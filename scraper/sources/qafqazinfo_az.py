@@ -123,19 +123,18 @@ class QafqazinfoAzScraper(BaseScraper):
 
         return None
 
-    async def scrape_article(self, url: str) -> Optional[Dict]:
+    def parse_article(self, html: bytes, url: str) -> Optional[Dict]:
         """
-        Scrape a single article from qafqazinfo.az asynchronously
+        Parse a single article page from qafqazinfo.az
 
         Args:
+            html: Raw article page
             url: Article URL
 
         Returns:
             Dictionary with article data
         """
-        soup = await self.fetch_page(url)
-        if not soup:
-            return None
+        soup = self.parse_html(html, parse_only=self.article_parse_only)
 
         try:
             # Extract title - it's in <h1> with style="font-size: 32px;"
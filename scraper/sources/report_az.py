@@ -21,7 +21,7 @@ if sys.platform == 'win32' and hasattr(sys.stdout, 'buffer'):
 
 # Add parent directory to path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from base_scraper import BaseScraper
+from base_scraper import BaseScraper, class_strainer
 
 
 class ReportAzScraper(BaseScraper):
@@ -32,6 +32,8 @@ class ReportAzScraper(BaseScraper):
             source_name="Report.az",
             base_url="https://report.az"
         )
+        # Article pages: parse only title, date and body containers
+        self.article_parse_only = class_strainer('section-title', 'news-detail__desc', 'news__date')
         self.category_url = f"{self.base_url}/iqtisadiyyat-xeberleri"
 
     async def scrape_article_list(self, page: int = 1) -> List[str]:
@@ -71,20 +73,19 @@ class ReportAzScraper(BaseScraper):
             print(f"[ERROR] Failed to scrape article list from {self.source_name}: {e}")
             return []
 
-    async def scrape_article(self, url: str) -> Optional[Dict]:
+    def parse_article(self, html: bytes, url: str) -> Optional[Dict]:
         """
-        Scrape individual article from Report.az
+        Parse individual article page from Report.az
 
         Args:
+            html: Raw article page
             url: Article URL
 
         Returns:
             Dictionary with article data or None if failed
         """
         try:
-            soup = await self.fetch_page(url)
-            if not soup:
-                return None
+            soup = self.parse_html(html, parse_only=self.article_parse_only)
 
             # Extract title
             title_elem = soup.find('h1', class_='section-title')
@@ -4,10 +4,15 @@ News summarization using Google Gemini API
 
 import sys
 import os
+import re
 import time
-from typing import Dict, List, Optional
+import asyncio
+from typing import Dict, List, Optional, Sequence
 from datetime import datetime
 
+from metrics import run_metrics, GEMINI_GROUP
+from relevance import RelevancePrefilter, keyword_score
+
 # Fix encoding for Azerbaijani characters on Windows
 if sys.platform == 'win32' and hasattr(sys.stdout, 'buffer'):
     import io
@@ -19,6 +24,68 @@ if sys.platform == 'win32' and hasattr(sys.stdout, 'buffer'):
         sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8')
 
 
+# Characters per token for Azerbaijani text until responses report real counts
+# (conservative; calibrated from usage_metadata after every call)
+CHARS_PER_TOKEN = 3
+
+# Snippet length bounds in relevance-filter prompts
+FILTER_SNIPPET_MIN_CHARS = 100
+FILTER_SNIPPET_MAX_CHARS = 400
+
+# Characters an entry adds besides title and snippet ("12. ", newline, indent, "...",
+# blank line before the next entry)
+ENTRY_OVERHEAD_CHARS = 14
+
+# Version of the relevance-filter prompt; bump it when the prompt changes so
+# stored verdicts (news.article_relevance) of the old prompt are not reused
+FILTER_PROMPT_VERSION = '1'
+
+# "12. " numbering or "• " bullet at the start of an entry
+LIST_MARKER_RE = re.compile(r'^(\d+\.|•)\s*')
+
+
+def fit_snippets(sizes: Sequence[int], weights: Sequence[float], available: int,
+                 floor: int, cap: int) -> Optional[List[int]]:
+    """
+    Snippet lengths that fill a character budget, in proportion to importance
+
+    Every snippet gets scale * weight characters, bounded by floor and cap (and
+    by its content); the largest scale that fits the budget is used.
+
+    Args:
+        sizes: Content length of each article
+        weights: Importance of each article
+        available: Characters left for snippets
+        floor: Shortest snippet
+        cap: Longest snippet
+
+    Returns:
+        Snippet length per article, or None if even the shortest ones don't fit
+    """
+    def lengths(scale: float) -> List[int]:
+        return [min(size, cap, max(floor, int(scale * weight))) for size, weight in zip(sizes, weights)]
+
+    if not sizes or sum(lengths(0)) > available:
+        return None
+
+    low, high = 0.0, cap / min(weights)
+    if sum(lengths(high)) <= available:
+        return lengths(high)
+    for _ in range(30):
+        middle = (low + high) / 2
+        if sum(lengths(middle)) <= available:
+            low = middle
+        else:
+            high = middle
+    return lengths(low)
+
+
+def in_order(articles: List[Dict], *groups: List[Dict]) -> List[Dict]:
+    """The articles contained in any of the groups, in the order of articles"""
+    picked = {id(article) for group in groups for article in group}
+    return [article for article in articles if id(article) in picked]
+
+
 class GeminiSummarizer:
     """
     Summarize news articles using Google Gemini API
@@ -33,6 +100,35 @@ class GeminiSummarizer:
     - Configurable via environment variables
     - Default: 3 retries with exponential backoff (2s, 4s, 8s)
     - See GEMINI_MAX_RETRIES, GEMINI_INITIAL_RETRY_DELAY, GEMINI_MAX_RETRY_DELAY
+
+    Calls go through the SDK's async client, so calls and backoffs don't block
+    the event loop (filter_relevant_articles and create_session_summary are
+    asyncio.run wrappers for sync scripts); relevance filtering is split into
+    batches that run concurrently:
+    - GEMINI_MAX_CONCURRENCY: requests in flight at once (default: 4)
+    - GEMINI_FILTER_BATCH_SIZE: articles per relevance-filter prompt (default: 50)
+
+    Sessions too large for one report prompt are map-reduced: the relevant
+    articles are packed into chunks, each chunk is condensed into banking
+    facts (concurrently) and the facts feed the report:
+    - GEMINI_SUMMARY_CHUNK_TOKENS: estimated prompt tokens per chunk (default: 12000)
+    - GEMINI_SNIPPET_CHARS: content characters per article of average importance (default: 400)
+    - GEMINI_NOTES_MAX_FACTS: facts kept per chunk (default: 15)
+
+    Prompts are sized in tokens, estimated from characters with a ratio
+    calibrated from each response's usage_metadata. Snippets fill the prompt
+    budget: the report's input gets longer snippets for more important
+    articles (keyword score, see relevance.py), shrinking them to fit one
+    prompt before resorting to map-reduce; filter prompts share their budget
+    evenly. Requests and tokens are both rate limited:
+    - GEMINI_TOKENS_PER_MINUTE: prompt + response tokens per minute (default: 1000000)
+    - GEMINI_FILTER_PROMPT_TOKENS: target size of a relevance-filter prompt (default: 4000)
+    - GEMINI_SNIPPET_MIN_CHARS / GEMINI_SNIPPET_MAX_CHARS: bounds of a report
+      snippet (defaults: 100 / 1200)
+
+    Before any filter call, clear-cut articles are settled locally by the
+    keyword/model pre-filter (see relevance.py, RELEVANCE_* variables); only
+    ambiguous ones reach Gemini.
     """
 
     def __init__(self):
@@ -44,6 +140,8 @@ class GeminiSummarizer:
         # Rate limiting
         self.requests_per_minute = 15
         self.request_times = []
+        self.tokens_per_minute = max(1000, int(os.getenv('GEMINI_TOKENS_PER_MINUTE', '1000000')))
+        self.token_times = []  # [time, tokens] per call, estimated until the response arrives
         self.quota_exhausted = False  # Track if daily quota is exhausted
 
         # Retry configuration for handling transient errors (503, overload)
@@ -52,6 +150,27 @@ class GeminiSummarizer:
         self.initial_retry_delay = float(os.getenv('GEMINI_INITIAL_RETRY_DELAY', '2'))  # seconds
         self.max_retry_delay = float(os.getenv('GEMINI_MAX_RETRY_DELAY', '30'))  # seconds
 
+        # Concurrent calls share the rate limit
+        self.max_concurrency = max(1, int(os.getenv('GEMINI_MAX_CONCURRENCY', '4')))
+        self.filter_batch_size = max(1, int(os.getenv('GEMINI_FILTER_BATCH_SIZE', '50')))
+        self._rate_lock = asyncio.Lock()
+
+        # Map-reduce summary: sessions larger than one chunk are condensed chunk by chunk
+        self.chunk_tokens = max(500, int(os.getenv('GEMINI_SUMMARY_CHUNK_TOKENS', '12000')))
+        self.snippet_chars = max(50, int(os.getenv('GEMINI_SNIPPET_CHARS', '400')))
+        self.notes_max_facts = max(3, int(os.getenv('GEMINI_NOTES_MAX_FACTS', '15')))
+        self.snippet_min_chars = max(0, int(os.getenv('GEMINI_SNIPPET_MIN_CHARS', '100')))
+        self.snippet_max_chars = max(self.snippet_chars, int(os.getenv('GEMINI_SNIPPET_MAX_CHARS', '1200')))
+        self.filter_prompt_tokens = max(500, int(os.getenv('GEMINI_FILTER_PROMPT_TOKENS', '4000')))
+
+        # Token accounting: calibrated estimate and totals from usage_metadata
+        self.chars_per_token = float(CHARS_PER_TOKEN)
+        self.usage: Dict[str, Dict[str, int]] = {}
+        self._in_flight = asyncio.Semaphore(self.max_concurrency)
+
+        # Local relevance pre-filter (keywords + model trained on Gemini verdicts)
+        self.prefilter = RelevancePrefilter()
+
         if not self.enabled:
             print("[INFO] Summarization disabled (missing GEMINI_API_KEY)")
         else:
@@ -76,33 +195,149 @@ class GeminiSummarizer:
             print(f"[ERROR] Failed to initialize Gemini: {e}")
             self.enabled = False
 
-    def _wait_for_rate_limit(self):
+    def _rate_limit_wait(self, tokens: int) -> float:
         """
-        Ensure we don't exceed rate limits (15 requests per minute)
+        Seconds until a call of about this many tokens fits both limits
+        (15 requests and GEMINI_TOKENS_PER_MINUTE tokens per minute)
         """
         current_time = time.time()
 
         # Remove requests older than 60 seconds
-        self.request_times = [
-            t for t in self.request_times
-            if current_time - t < 60
-        ]
+        self.request_times = [t for t in self.request_times if current_time - t < 60]
+        self.token_times = [entry for entry in self.token_times if current_time - entry[0] < 60]
 
+        wait_time = 0.0
         # If we've made 15 requests in the last minute, wait
         if len(self.request_times) >= self.requests_per_minute:
             wait_time = 60 - (current_time - self.request_times[0])
+
+        # Wait until enough of the last minute's tokens expire (an oversized call waits for all of them)
+        excess = sum(entry[1] for entry in self.token_times) + tokens - self.tokens_per_minute
+        for started, used in self.token_times:
+            if excess <= 0:
+                break
+            excess -= used
+            wait_time = max(wait_time, 60 - (current_time - started))
+        return wait_time
+
+    def _reserve(self, tokens: int) -> List:
+        """Record a call about to start; returns its token entry (see _record_usage)"""
+        now = time.time()
+        self.request_times.append(now)
+        entry = [now, tokens]
+        self.token_times.append(entry)
+        return entry
+
+    async def _await_rate_limit(self, tokens: int = 0) -> List:
+        """
+        Wait until a call fits the rate limits (15 requests and
+        GEMINI_TOKENS_PER_MINUTE tokens per minute), then reserve it
+
+        Concurrent calls queue on a lock and wait with asyncio.sleep, so the
+        event loop keeps running.
+
+        Args:
+            tokens: Estimated prompt tokens of the call
+
+        Returns:
+            The call's token entry
+        """
+        async with self._rate_lock:
+            wait_time = self._rate_limit_wait(tokens)
             if wait_time > 0:
                 print(f"[INFO] Rate limit: waiting {wait_time:.1f}s...")
-                time.sleep(wait_time)
-                # Clear old requests after waiting
-                self.request_times = []
+                await asyncio.sleep(wait_time)
+            return self._reserve(tokens)
+
+    def estimate_tokens(self, text: str) -> int:
+        """Approximate tokens of a text (calibrated characters per token)"""
+        return int(len(text) / self.chars_per_token) + 1
+
+    def _budget_chars(self, tokens: int) -> int:
+        """Characters that fit a token budget"""
+        return int(tokens * self.chars_per_token)
 
-        # Record this request
-        self.request_times.append(time.time())
+    def _record_usage(self, response, prompt: str, operation_name: str, entry: List):
+        """
+        Account the tokens a response reports (usage_metadata)
+
+        Adds them to the run metrics and the per-operation totals of
+        get_usage_stats, replaces the call's estimate in the token rate limit
+        and recalibrates characters per token from the prompt's real count.
+        """
+        totals = self.usage.setdefault(operation_name, {
+            'calls': 0, 'prompt_tokens': 0, 'response_tokens': 0, 'thinking_tokens': 0
+        })
+        totals['calls'] += 1
+
+        usage = getattr(response, 'usage_metadata', None)
+        if usage is None:
+            return
+
+        prompt_tokens = usage.prompt_token_count or 0
+        response_tokens = usage.candidates_token_count or 0
+        thinking_tokens = getattr(usage, 'thoughts_token_count', None) or 0
+        totals['prompt_tokens'] += prompt_tokens
+        totals['response_tokens'] += response_tokens
+        totals['thinking_tokens'] += thinking_tokens
+
+        # Thinking tokens are billed as output
+        run_metrics.count(GEMINI_GROUP, 'tokens_input', prompt_tokens)
+        run_metrics.count(GEMINI_GROUP, 'tokens_output', response_tokens + thinking_tokens)
+        run_metrics.count(GEMINI_GROUP, 'tokens_thinking', thinking_tokens)
+
+        entry[1] = prompt_tokens + response_tokens + thinking_tokens
+        if prompt_tokens:
+            observed = len(prompt) / prompt_tokens
+            self.chars_per_token = min(6.0, max(1.5, 0.7 * self.chars_per_token + 0.3 * observed))
+
+    def _retry_delay(self, error: Exception, attempt: int, operation_name: str) -> float:
+        """
+        Seconds to wait before retrying a failed call
 
-    def _call_with_retry(self, prompt: str, operation_name: str = "API call"):
+        Raises:
+            Exception: The error itself when it is not worth retrying (quota
+                exhausted, non-transient error or retries used up)
+        """
+        error_msg = str(error)
+        run_metrics.count(GEMINI_GROUP, 'errors')
+
+        # Check for quota exhaustion - don't retry these
+        if '429' in error_msg or 'RESOURCE_EXHAUSTED' in error_msg or 'quota' in error_msg.lower():
+            self.quota_exhausted = True
+            print(f"[ERROR] Gemini quota exhausted: {error}")
+            raise error
+
+        # Check for transient errors (503, overload, UNAVAILABLE)
+        is_transient = (
+            '503' in error_msg or
+            'UNAVAILABLE' in error_msg or
+            'overload' in error_msg.lower() or
+            'temporarily' in error_msg.lower()
+        )
+
+        if is_transient and attempt < self.max_retries:
+            # Calculate exponential backoff delay
+            delay = min(
+                self.initial_retry_delay * (2 ** attempt),
+                self.max_retry_delay
+            )
+
+            print(f"[WARNING] {operation_name} failed (attempt {attempt + 1}/{self.max_retries + 1}): {error_msg}")
+            print(f"[INFO] Retrying in {delay}s...")
+            return delay
+
+        # Non-transient error or max retries reached
+        if attempt == self.max_retries:
+            print(f"[ERROR] {operation_name} failed after {self.max_retries + 1} attempts: {error_msg}")
+        raise error
+
+    async def _call_with_retry_async(self, prompt: str, operation_name: str = "API call"):
         """
-        Call Gemini API with exponential backoff retry for transient errors
+        Call Gemini with the SDK's async client (client.aio) and exponential
+        backoff retry for transient errors
+
+        At most GEMINI_MAX_CONCURRENCY calls are in flight; backoffs don't hold a slot.
 
         Args:
             prompt: The prompt to send to Gemini
@@ -118,90 +353,57 @@ class GeminiSummarizer:
 
         for attempt in range(self.max_retries + 1):
             try:
-                self._wait_for_rate_limit()
+                async with self._in_flight:
+                    entry = await self._await_rate_limit(self.estimate_tokens(prompt))
 
-                response = self.client.models.generate_content(
-                    model=self.model_name,
-                    contents=prompt
-                )
+                    run_metrics.count(GEMINI_GROUP, 'calls')
+                    with run_metrics.timer(GEMINI_GROUP, 'call'):
+                        response = await self.client.aio.models.generate_content(
+                            model=self.model_name,
+                            contents=prompt
+                        )
+                self._record_usage(response, prompt, operation_name, entry)
 
-                # Success!
                 if attempt > 0:
                     print(f"[SUCCESS] {operation_name} succeeded on attempt {attempt + 1}")
 
                 return response
 
             except Exception as e:
-                error_msg = str(e)
                 last_error = e
+                await asyncio.sleep(self._retry_delay(e, attempt, operation_name))
 
-                # Check for quota exhaustion - don't retry these
-                if '429' in error_msg or 'RESOURCE_EXHAUSTED' in error_msg or 'quota' in error_msg.lower():
-                    self.quota_exhausted = True
-                    print(f"[ERROR] Gemini quota exhausted: {e}")
-                    raise e
-
-                # Check for transient errors (503, overload, UNAVAILABLE)
-                is_transient = (
-                    '503' in error_msg or
-                    'UNAVAILABLE' in error_msg or
-                    'overload' in error_msg.lower() or
-                    'temporarily' in error_msg.lower()
-                )
-
-                if is_transient and attempt < self.max_retries:
-                    # Calculate exponential backoff delay
-                    delay = min(
-                        self.initial_retry_delay * (2 ** attempt),
-                        self.max_retry_delay
-                    )
-
-                    print(f"[WARNING] {operation_name} failed (attempt {attempt + 1}/{self.max_retries + 1}): {error_msg}")
-                    print(f"[INFO] Retrying in {delay}s...")
-                    time.sleep(delay)
-                    continue
-                else:
-                    # Non-transient error or max retries reached
-                    if attempt == self.max_retries:
-                        print(f"[ERROR] {operation_name} failed after {self.max_retries + 1} attempts: {error_msg}")
-                    raise e
-
-        # Should never reach here, but just in case
         raise last_error if last_error else Exception("Unknown error in retry logic")
 
-    def filter_relevant_articles(self, articles: List[Dict]) -> List[Dict]:
+    def _filter_prompt(self, articles: List[Dict]) -> str:
         """
-        Filter articles to keep only those relevant to banking/finance sector
+        Relevance-filter prompt listing the articles by number
 
-        Args:
-            articles: List of all articles
-
-        Returns:
-            List of relevant articles only
+        The snippets share what GEMINI_FILTER_PROMPT_TOKENS leaves after the
+        instructions and titles, so small batches get more context per article.
         """
-        if not self.enabled or not articles:
-            return articles
-
-        # Skip if quota exhausted
-        if self.quota_exhausted:
-            print("[WARNING] Gemini quota exhausted - skipping AI filtering")
-            return articles
-
-        try:
-            print(f"\n[INFO] Filtering {len(articles)} articles for banking/finance relevance...")
-
-            # Prepare articles for filtering
-            articles_list = []
-            for i, article in enumerate(articles, 1):
-                content_snippet = article.get('content', '')[:100]  # Reduced from 200 to save tokens
-                articles_list.append(
-                    f"{i}. {article['title']}\n{content_snippet}..."
-                )
-
-            articles_text = "\n\n".join(articles_list)
-
-            # Filtering prompt - STRICT banking/finance only
-            filter_prompt = f"""Sən bank sektoru analitikiəsən. YALNIZ bank və maliyyə sektoruna BİRBAŞA aid olan xəbərləri seç.
+        contents = [article.get('content') or '' for article in articles]
+        fixed = len(self._filter_instructions('')) + sum(len(article['title']) + ENTRY_OVERHEAD_CHARS
+                                                         for article in articles)
+        lengths = fit_snippets([len(content) for content in contents], [1.0] * len(articles),
+                               self._budget_chars(self.filter_prompt_tokens) - fixed,
+                               FILTER_SNIPPET_MIN_CHARS, FILTER_SNIPPET_MAX_CHARS)
+        if lengths is None:
+            lengths = [FILTER_SNIPPET_MIN_CHARS] * len(articles)
+
+        # Prepare articles for filtering
+        articles_list = []
+        for i, (article, content, length) in enumerate(zip(articles, contents, lengths), 1):
+            articles_list.append(
+                f"{i}. {article['title']}\n{content[:length]}..."
+            )
+
+        return self._filter_instructions("\n\n".join(articles_list))
+
+    def _filter_instructions(self, articles_text: str) -> str:
+        """Relevance-filter prompt around the numbered articles"""
+        # Filtering prompt - STRICT banking/finance only
+        return f"""Sən bank sektoru analitikiəsən. YALNIZ bank və maliyyə sektoruna BİRBAŞA aid olan xəbərləri seç.
 
 ✅ QƏBUL ET (bank/maliyyə xəbərləri):
 - Bankların maliyyə nəticələri, mənfəət/zərər
@@ -229,84 +431,254 @@ QAYDA: Əgər xəbər BANKLAR, KREDİT, DEPOZIT, FAİZ, MƏZƏNNƏ və ya MALİY
 
 BİRBAŞA bank/maliyyə xəbərlərinin nömrələri (vergüllə): """
 
-            # Call API with retry logic
-            response = self._call_with_retry(filter_prompt, "Article filtering")
+    def _parse_filter_response(self, response, articles: List[Dict]) -> Optional[List[Dict]]:
+        """
+        Articles picked by a filter response (None if it can't be read)
+        """
+        # Check if response has text
+        if not response or not hasattr(response, 'text') or response.text is None:
+            print(f"[WARNING] Empty response from API, using all articles")
+            return None
 
-            # Check if response has text
-            if not response or not hasattr(response, 'text') or response.text is None:
-                print(f"[WARNING] Empty response from API, using all articles")
-                return articles
+        relevant_indices_str = response.text.strip()
 
-            relevant_indices_str = response.text.strip()
+        # Parse indices
+        try:
+            relevant_indices = [int(x.strip()) - 1 for x in relevant_indices_str.split(',') if x.strip().isdigit()]
+            return [articles[i] for i in relevant_indices if 0 <= i < len(articles)]
 
-            # Parse indices
-            try:
-                relevant_indices = [int(x.strip()) - 1 for x in relevant_indices_str.split(',') if x.strip().isdigit()]
-                relevant_articles = [articles[i] for i in relevant_indices if 0 <= i < len(articles)]
+        except Exception as parse_error:
+            print(f"[WARNING] Could not parse filter results: {parse_error}")
+            print(f"[INFO] Using all articles as fallback")
+            return None
 
-                print(f"[SUCCESS] Filtered: {len(relevant_articles)}/{len(articles)} articles are banking-relevant")
-                return relevant_articles
+    def _filter_failed(self, error: Exception, articles: List[Dict]) -> List[Dict]:
+        """Fallback when a filter call fails: keep the articles"""
+        # Quota errors are already handled in _retry_delay
+        if not self.quota_exhausted:
+            print(f"[ERROR] Filtering failed: {error}")
+        print(f"[INFO] Using all articles as fallback")
+        return articles
 
-            except Exception as parse_error:
-                print(f"[WARNING] Could not parse filter results: {parse_error}")
-                print(f"[INFO] Using all articles as fallback")
-                return articles
+    def _prefilter(self, articles: List[Dict]):
+        """
+        Settle clear-cut articles locally
+
+        Returns:
+            (relevant, ambiguous) - irrelevant articles are dropped
+        """
+        relevant, irrelevant, ambiguous = self.prefilter.split(articles)
+        if self.prefilter.enabled:
+            print(f"[INFO] Relevance pre-filter: {len(relevant)} relevant, {len(irrelevant)} irrelevant, "
+                  f"{len(ambiguous)} for Gemini")
+        return relevant, ambiguous
+
+    def _run_sync(self, method, *args):
+        """Run an async method from sync code (scripts; not inside a running event loop)"""
+        # asyncio locks bind to the loop they are first used on, and every
+        # asyncio.run() starts a new one
+        self._rate_lock = asyncio.Lock()
+        self._in_flight = asyncio.Semaphore(self.max_concurrency)
+        return asyncio.run(method(*args))
+
+    def filter_relevant_articles(self, articles: List[Dict]) -> List[Dict]:
+        """Sync filter_relevant_articles_async, for scripts without an event loop"""
+        return self._run_sync(self.filter_relevant_articles_async, articles)
+
+    async def judge_batch_async(self, articles: List[Dict]) -> Optional[List[Dict]]:
+        """
+        Gemini's verdict on one batch of articles, with one async call
+
+        Args:
+            articles: Up to GEMINI_FILTER_BATCH_SIZE articles
+
+        Returns:
+            The relevant ones, or None if there is no verdict (call failed,
+            unreadable response, Gemini disabled or out of quota)
+        """
+        if not self.enabled or not articles or self.quota_exhausted:
+            return None
 
+        try:
+            response = await self._call_with_retry_async(self._filter_prompt(articles), "Article filtering")
+            return self._parse_filter_response(response, articles)
         except Exception as e:
-            error_msg = str(e)
-            # Quota errors are already handled in _call_with_retry
-            # Just fall back to using all articles
-            if not self.quota_exhausted:
-                print(f"[ERROR] Filtering failed: {e}")
-            print(f"[INFO] Using all articles as fallback")
-            return articles
+            self._filter_failed(e, articles)
+            return None
 
-    def create_session_summary(self, articles: List[Dict], sources_stats: List[Dict]) -> Optional[str]:
+    async def filter_batch_async(self, articles: List[Dict]) -> List[Dict]:
         """
-        Create banking intelligence summary with actionable insights
+        Relevance-filter one batch of articles with one async call
 
         Args:
-            articles: List of ALL articles (new ones) from this session
-            sources_stats: List of stats per source
+            articles: Up to GEMINI_FILTER_BATCH_SIZE articles
 
         Returns:
-            Banking intelligence report in Azerbaijani with strategic insights
+            The relevant ones (all of them if there is no verdict)
+        """
+        judged = await self.judge_batch_async(articles)
+        return articles if judged is None else judged
+
+    async def filter_relevant_articles_async(self, articles: List[Dict]) -> List[Dict]:
+        """
+        Filter articles to keep only those relevant to banking/finance sector
+
+        After the local pre-filter, batches of GEMINI_FILTER_BATCH_SIZE
+        ambiguous articles are filtered concurrently.
+
+        Args:
+            articles: List of all articles
+
+        Returns:
+            List of relevant articles only, in input order
         """
         if not self.enabled or not articles:
-            return None
+            return articles
+
+        relevant, ambiguous = self._prefilter(articles)
+        if not ambiguous:
+            return relevant
 
-        # If quota exhausted, return basic summary
         if self.quota_exhausted:
-            print("[WARNING] Gemini quota exhausted - returning basic summary")
-            return self._create_fallback_summary(articles, sources_stats)
+            print("[WARNING] Gemini quota exhausted - skipping AI filtering")
+            return in_order(articles, relevant, ambiguous)
 
-        try:
-            # STEP 1: Filter for relevant articles
-            relevant_articles = self.filter_relevant_articles(articles)
-
-            # If filtering significantly reduced articles, those filtered out weren't banking-related
-            if not relevant_articles or len(relevant_articles) == 0:
-                return "Bu sessiyada bank sektoruna aid heç bir xəbər tapılmadı."
-
-            # Log warning if filtering significantly reduced articles, but continue with summary
-            if len(relevant_articles) < 3 and len(articles) > 5:
-                print(f"[WARNING] Only {len(relevant_articles)}/{len(articles)} articles passed filter - continuing with available articles")
-
-            # STEP 2: Create banking intelligence report
-            # Prepare article summaries WITHOUT source names (for public channel)
-            article_summaries = []
-            for i, article in enumerate(relevant_articles, 1):
-                content_snippet = article.get('content', '')[:200]  # Reduced from 400 to save tokens
-                # Don't mention source name - looks more professional
-                article_summaries.append(
-                    f"{i}. {article['title']}\n"
-                    f"   {content_snippet}..."
-                )
-
-            articles_text = "\n\n".join(article_summaries[:40])
-
-            # Banking intelligence prompt - SHORT and CLEAN format for PUBLIC CHANNEL
-            prompt = f"""Sən Azərbaycan bank sektoru üzrə peşəkar analitik mərkəzsən.
+        batches = [ambiguous[i:i + self.filter_batch_size]
+                   for i in range(0, len(ambiguous), self.filter_batch_size)]
+        print(f"\n[INFO] Filtering {len(ambiguous)} articles for banking/finance relevance "
+              f"({len(batches)} concurrent batch(es))...")
+
+        results = await asyncio.gather(*(self.filter_batch_async(batch) for batch in batches))
+        relevant_articles = in_order(articles, relevant, *results)
+
+        print(f"[SUCCESS] Filtered: {len(relevant_articles)}/{len(articles)} articles are banking-relevant")
+        return relevant_articles
+
+    def _importance(self, article: Dict) -> float:
+        """Snippet weight of an article: its keyword score relative to the pre-filter's accept score"""
+        return min(2.0, max(0.5, keyword_score(article) / max(1.0, self.prefilter.accept_score)))
+
+    def _article_entries(self, relevant_articles: List[Dict]) -> List[str]:
+        """
+        Numbered title + snippet of every relevant article, WITHOUT source names (for public channel)
+
+        Snippets fill the report prompt (GEMINI_SUMMARY_CHUNK_TOKENS) in
+        proportion to importance, between GEMINI_SNIPPET_MIN_CHARS and
+        GEMINI_SNIPPET_MAX_CHARS. When even the shortest don't fit, every
+        article gets GEMINI_SNIPPET_CHARS scaled by importance and the
+        entries are map-reduced.
+        """
+        contents = [article.get('content') or '' for article in relevant_articles]
+        weights = [self._importance(article) for article in relevant_articles]
+        fixed = len(self._summary_prompt('')) + sum(len(article['title']) + ENTRY_OVERHEAD_CHARS
+                                                    for article in relevant_articles)
+        lengths = fit_snippets([len(content) for content in contents], weights,
+                               self._budget_chars(self.chunk_tokens) - fixed,
+                               self.snippet_min_chars, self.snippet_max_chars)
+        if lengths is None:
+            lengths = [min(self.snippet_max_chars, max(self.snippet_min_chars, int(self.snippet_chars * weight)))
+                       for weight in weights]
+
+        article_summaries = []
+        for i, (article, content, length) in enumerate(zip(relevant_articles, contents, lengths), 1):
+            # Don't mention source name - looks more professional
+            article_summaries.append(
+                f"{i}. {article['title']}\n"
+                f"   {content[:length]}..."
+            )
+        return article_summaries
+
+    def _pack_entries(self, entries: List[str]) -> List[List[str]]:
+        """
+        Group entries into chunks of at most GEMINI_SUMMARY_CHUNK_TOKENS (estimated)
+
+        An entry larger than the budget gets a chunk of its own.
+        """
+        budget = self._budget_chars(self.chunk_tokens)
+        chunks, chunk, chunk_chars = [], [], 0
+        for entry in entries:
+            chars = len(entry) + 2  # blank line between entries
+            if chunk and chunk_chars + chars > budget:
+                chunks.append(chunk)
+                chunk, chunk_chars = [], 0
+            chunk.append(entry)
+            chunk_chars += chars
+        if chunk:
+            chunks.append(chunk)
+        return chunks
+
+    def _notes_prompt(self, entries: List[str]) -> str:
+        """Map step: condense a chunk of articles (or of earlier notes) into banking facts"""
+        material = "\n\n".join(entries)
+        return f"""Sən bank sektoru analitikisən. Aşağıdakı materialdan bank və maliyyə sektoru üçün ƏN VACİB faktları çıxar.
+
+MATERIAL:
+{material}
+
+QAYDALAR:
+- Hər fakt bir sətir, "• " ilə başlasın
+- Rəqəmləri, faizləri, tarixləri və qurumların adlarını saxla
+- Eyni mövzuya aid faktları bir sətirdə birləşdir
+- Maksimum {self.notes_max_facts} fakt, ən vacibləri əvvəl
+- MƏNBƏ QEYD ETMƏ (sayt adlarını çəkmə)
+- Azərbaycan dilində yaz
+
+FAKTLAR:"""
+
+    def _notes_failed(self, error: Exception, entries: List[str]) -> str:
+        """Fallback notes for a chunk whose map call failed: the titles only"""
+        if self.quota_exhausted:
+            raise error
+        print(f"[WARNING] Chunk summary failed ({error}) - using article titles")
+        return "\n".join("• " + LIST_MARKER_RE.sub('', entry.split("\n", 1)[0]) for entry in entries)
+
+    def _notes_from_response(self, response, entries: List[str]) -> str:
+        """Facts of a map response (the titles if it is empty)"""
+        if not response or not hasattr(response, 'text') or not response.text:
+            return self._notes_failed(Exception("empty response"), entries)
+        return response.text.strip()
+
+    def _reduce_level(self, chunks: List[List[str]], notes: List[str], level: int) -> Optional[List[List[str]]]:
+        """
+        Pack one level's notes for the next level
+
+        Returns:
+            The next level's chunks, or None when the notes don't shrink any
+            further (they then go into the report prompt as they are)
+        """
+        next_chunks = self._pack_entries(notes)
+        print(f"[INFO] Map-reduce level {level}: {len(chunks)} chunks -> {len(next_chunks)}")
+        return next_chunks if len(next_chunks) < len(chunks) else None
+
+    async def _condense_async(self, relevant_articles: List[Dict]) -> str:
+        """
+        Material for the report prompt: the articles themselves when they fit
+        GEMINI_SUMMARY_CHUNK_TOKENS, otherwise facts from map-reducing them
+        chunk by chunk
+
+        The chunks of each level are summarized concurrently. Hundreds of
+        articles become a few chunks of facts, which are packed and condensed
+        again until everything fits one report prompt.
+        """
+        chunks = self._pack_entries(self._article_entries(relevant_articles))
+        level = 0
+        while len(chunks) > 1:
+            level += 1
+            responses = await asyncio.gather(
+                *(self._call_with_retry_async(self._notes_prompt(chunk), "Chunk summary") for chunk in chunks),
+                return_exceptions=True
+            )
+            notes = [self._notes_failed(response, chunk) if isinstance(response, Exception)
+                     else self._notes_from_response(response, chunk)
+                     for response, chunk in zip(responses, chunks)]
+            next_chunks = self._reduce_level(chunks, notes, level)
+            chunks = next_chunks or [notes]
+        return "\n\n".join(chunks[0])
+
+    def _summary_prompt(self, articles_text: str) -> str:
+        """Banking intelligence report prompt (articles or condensed facts)"""
+        # Banking intelligence prompt - SHORT and CLEAN format for PUBLIC CHANNEL
+        return f"""Sən Azərbaycan bank sektoru üzrə peşəkar analitik mərkəzsən.
 Aşağıdakı xəbərlərdən QISA və PROFESSIONAL banking intelligence report hazırla.
 
 BANK SEKTORU XƏBƏRLƏRI (SON 24 SAAT):
@@ -360,34 +732,86 @@ VACIB QAYDALAR:
 
 PROFESSIONAL BANKING INTELLIGENCE REPORT:"""
 
-            # Generate banking intelligence with retry logic
-            response = self._call_with_retry(prompt, "Summary generation")
+    def _check_relevant(self, articles: List[Dict], relevant_articles: List[Dict]) -> Optional[str]:
+        """Summary to return instead of a report when no article is relevant"""
+        # If filtering significantly reduced articles, those filtered out weren't banking-related
+        if not relevant_articles:
+            return "Bu sessiyada bank sektoruna aid heç bir xəbər tapılmadı."
+
+        # Log warning if filtering significantly reduced articles, but continue with summary
+        if len(relevant_articles) < 3 and len(articles) > 5:
+            print(f"[WARNING] Only {len(relevant_articles)}/{len(articles)} articles passed filter - continuing with available articles")
+        return None
+
+    def _summary_from_response(self, response, articles: List[Dict], relevant_articles: List[Dict],
+                               sources_stats: List[Dict]) -> str:
+        """Report text of a summary response (fallback summary if it is empty)"""
+        # Check if response has text
+        if not response or not hasattr(response, 'text') or response.text is None:
+            print(f"[WARNING] Empty response from API, using fallback summary")
+            return self._create_fallback_summary(articles, sources_stats)
 
-            # Check if response has text
-            if not response or not hasattr(response, 'text') or response.text is None:
-                print(f"[WARNING] Empty response from API, using fallback summary")
-                return self._create_fallback_summary(articles, sources_stats)
+        summary = response.text.strip()
 
-            summary = response.text.strip()
+        print(f"[SUCCESS] Created banking intelligence report from {len(relevant_articles)} relevant articles")
+        print(f"[INFO] Filtered out {len(articles) - len(relevant_articles)} non-banking articles")
 
-            print(f"[SUCCESS] Created banking intelligence report from {len(relevant_articles)} relevant articles")
-            print(f"[INFO] Filtered out {len(articles) - len(relevant_articles)} non-banking articles")
+        return summary
 
-            return summary
+    def _summary_failed(self, error: Exception, articles: List[Dict], sources_stats: List[Dict]) -> Optional[str]:
+        """Fallback when the summary call fails: basic summary if the quota is gone, else None"""
+        # Quota errors are already handled in _retry_delay
+        # Return fallback summary for any errors
+        if self.quota_exhausted:
+            print(f"[WARNING] Returning basic summary without AI")
+            return self._create_fallback_summary(articles, sources_stats)
 
-        except Exception as e:
-            # Quota errors are already handled in _call_with_retry
-            # Return fallback summary for any errors
-            if self.quota_exhausted:
-                print(f"[WARNING] Returning basic summary without AI")
-                return self._create_fallback_summary(articles, sources_stats)
+        try:
+            print(f"[ERROR] Failed to create banking intelligence: {error}")
+        except (UnicodeEncodeError, UnicodeDecodeError):
+            print(f"[ERROR] Failed to create banking intelligence (encoding error)")
+        return None
 
-            try:
-                print(f"[ERROR] Failed to create banking intelligence: {e}")
-            except (UnicodeEncodeError, UnicodeDecodeError):
-                print(f"[ERROR] Failed to create banking intelligence (encoding error)")
+    def create_session_summary(self, articles: List[Dict], sources_stats: List[Dict]) -> Optional[str]:
+        """Sync create_session_summary_async, for scripts without an event loop"""
+        return self._run_sync(self.create_session_summary_async, articles, sources_stats)
+
+    async def create_session_summary_async(self, articles: List[Dict], sources_stats: List[Dict],
+                                           relevant_articles: Optional[List[Dict]] = None) -> Optional[str]:
+        """
+        Create banking intelligence summary with actionable insights
+
+        Args:
+            articles: List of ALL articles (new ones) from this session
+            sources_stats: List of stats per source
+            relevant_articles: Result of filtering articles, if already done
+                (e.g. batch by batch while scraping); filtered here otherwise
+
+        Returns:
+            Banking intelligence report in Azerbaijani with strategic insights
+        """
+        if not self.enabled or not articles:
             return None
 
+        if self.quota_exhausted:
+            print("[WARNING] Gemini quota exhausted - returning basic summary")
+            return self._create_fallback_summary(articles, sources_stats)
+
+        try:
+            if relevant_articles is None:
+                relevant_articles = await self.filter_relevant_articles_async(articles)
+            no_news = self._check_relevant(articles, relevant_articles)
+            if no_news:
+                return no_news
+
+            articles_text = await self._condense_async(relevant_articles)
+            response = await self._call_with_retry_async(self._summary_prompt(articles_text),
+                                                          "Summary generation")
+            return self._summary_from_response(response, articles, relevant_articles, sources_stats)
+
+        except Exception as e:
+            return self._summary_failed(e, articles, sources_stats)
+
     def _create_fallback_summary(self, articles: List[Dict], sources_stats: List[Dict]) -> str:
         """
         Create a basic summary without AI when quota is exhausted
@@ -435,19 +859,30 @@ PROFESSIONAL BANKING INTELLIGENCE REPORT:"""
         Get current usage statistics
 
         Returns:
-            Dictionary with usage stats
+            Dictionary with usage stats: rate limit headroom, token totals
+            from usage_metadata (overall and per operation) and the
+            calibrated characters per token
         """
         current_time = time.time()
 
-        # Count requests in last minute
+        # Count requests and tokens in last minute
         recent_requests = [
             t for t in self.request_times
             if current_time - t < 60
         ]
+        recent_tokens = sum(tokens for started, tokens in self.token_times if current_time - started < 60)
+
+        totals = {key: sum(operation[key] for operation in self.usage.values())
+                  for key in ('calls', 'prompt_tokens', 'response_tokens', 'thinking_tokens')}
 
         return {
             'requests_last_minute': len(recent_requests),
             'requests_limit': self.requests_per_minute,
             'requests_available': max(0, self.requests_per_minute - len(recent_requests)),
+            'tokens_last_minute': recent_tokens,
+            'tokens_limit': self.tokens_per_minute,
+            **totals,
+            'by_operation': {name: dict(operation) for name, operation in self.usage.items()},
+            'chars_per_token': round(self.chars_per_token, 2),
             'enabled': self.enabled
         }
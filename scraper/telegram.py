@@ -207,6 +207,9 @@ class TelegramReporter:
                 - total_saved: int
                 - session_summary: str (banking intelligence)
                 - errors: List of errors (optional)
+                - http_pool: Shared HTTP pool stats (optional)
+                - http_cache: Listing page cache stats (optional)
+                - performance: Per-source latency percentiles (optional, see metrics.py)
             success: Whether scraping completed successfully
 
         Returns:
@@ -241,6 +244,9 @@ class TelegramReporter:
             message_parts.append(f"• Total articles found: {stats.get('total_found', 0)}")
             message_parts.append(f"• Unique articles saved: {stats.get('total_saved', 0)}")
             message_parts.append(f"• Duplicates skipped: {stats.get('total_skipped', 0)}")
+            if stats.get('total_near_duplicates'):
+                message_parts.append(f"• Near-duplicates merged: {stats['total_near_duplicates']}")
+            message_parts.append(f"• Article fetches saved: {stats.get('total_fetches_saved', 0)}")
             message_parts.append(f"• Sources scraped: {stats.get('sources_count', 0) if success else len(stats.get('sources', []))}")
             message_parts.append("")
 
@@ -253,10 +259,74 @@ class TelegramReporter:
                     saved = source_stat.get('saved', 0)
                     skipped = source_stat.get('skipped', 0)
 
-                    if total > 0:
+                    if source_stat.get('error'):
+                        message_parts.append(f"• {source_name}: failed ❌")
+                    elif source_stat.get('paused'):
+                        message_parts.append(f"• {source_name}: paused ⏸ ({source_stat['paused']})")
+                    elif total > 0:
                         message_parts.append(f"• {source_name}: {saved} new / {total} total")
                 message_parts.append("")
 
+            # Adaptive per-host rate limits
+            limited = [s for s in stats.get('sources', []) if s.get('limiter')]
+            if limited:
+                message_parts.append("<b>🚦 RATE LIMITS</b>")
+                for source_stat in limited[:10]:
+                    limiter = source_stat['limiter']
+                    line = (f"• {source_stat['name']}: {limiter['concurrency']} slots "
+                            f"(peak {limiter['peak_concurrency']}), {limiter['rate_per_second']:g} req/s")
+                    if limiter['throttled'] or limiter['errors']:
+                        line += f" ⚠️ {limiter['throttled']} throttled, {limiter['errors']} errors"
+                    if source_stat.get('retries'):
+                        line += f", {source_stat['retries']} retries"
+                    if limiter.get('circuit') != 'closed' or source_stat.get('circuit_skipped'):
+                        line += f" 🔌 site down ({source_stat.get('circuit_skipped', 0)} pages skipped)"
+                    message_parts.append(line)
+                message_parts.append("")
+
+            # Connection pool usage
+            pool_stats = stats.get('http_pool')
+            if pool_stats and pool_stats.get('requests'):
+                message_parts.append("<b>🌐 HTTP POOL</b>")
+                message_parts.append(f"• Requests: {pool_stats['requests']}")
+                message_parts.append(f"• Connections opened: {pool_stats['connections_created']}")
+                message_parts.append(f"• Connection reuse: {pool_stats['reuse_ratio'] * 100:.0f}%")
+                message_parts.append(f"• Open at end: {pool_stats['open_connections']}/{pool_stats['pool_size']}")
+                cache_stats = stats.get('http_cache')
+                if cache_stats and cache_stats.get('enabled'):
+                    message_parts.append(f"• Listing pages unchanged (304): {cache_stats['hits']}")
+                message_parts.append("")
+
+            # Latency percentiles (p50/p95/p99)
+            performance = stats.get('performance') or {}
+            source_latency = [(s['name'], performance[s['name']]['latency'])
+                              for s in stats.get('sources', []) if s['name'] in performance]
+            if performance:
+                message_parts.append("<b>⏱ LATENCY (p50/p95/p99)</b>")
+                for source_name, latency in source_latency[:10]:
+                    ttfb = latency.get('ttfb_ms')
+                    if not ttfb or not ttfb.get('count'):
+                        continue
+                    line = f"• {source_name}: TTFB {ttfb['p50']:.0f}/{ttfb['p95']:.0f}/{ttfb['p99']:.0f} ms"
+                    parse = latency.get('parse_cpu_ms')
+                    if parse and parse.get('count'):
+                        line += f", parse {parse['p50']:.0f} ms"
+                    message_parts.append(line)
+
+                db_latency = performance.get('database', {}).get('latency', {})
+                if db_latency.get('save_session_ms', {}).get('count'):
+                    message_parts.append(f"• Database save: {db_latency['save_session_ms']['max']:.0f} ms")
+                lookups = db_latency.get('articles_exist_ms')
+                if lookups and lookups.get('count'):
+                    message_parts.append(f"• Known-URL lookups: {lookups['count']} × "
+                                         f"{lookups['p50']:.0f}/{lookups['p95']:.0f}/{lookups['p99']:.0f} ms")
+                gemini_calls = performance.get('gemini', {}).get('latency', {}).get('call_ms')
+                if gemini_calls and gemini_calls.get('count'):
+                    message_parts.append(f"• Gemini: {gemini_calls['count']} calls, "
+                                         f"{gemini_calls['p50'] / 1000:.1f}/{gemini_calls['p95'] / 1000:.1f}/"
+                                         f"{gemini_calls['p99'] / 1000:.1f} s")
+                message_parts.append("")
+
             # AI processing info (if successful)
             if success and stats.get('session_summary'):
                 summary_length = len(stats['session_summary'])